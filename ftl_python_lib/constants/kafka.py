@@ -0,0 +1,56 @@
+"""
+Constants for Kafka clients
+"""
+
+from enum import Enum
+
+
+class ConstantsKafkaProducerProfile(Enum):
+    """
+    librdkafka producer settings per tuning profile, selected by name
+    with KAFKA_PRODUCER_PROFILE (e.g. "high_throughput")
+    """
+
+    # librdkafka defaults
+    DEFAULT = {}
+
+    # Send right away, wait for the leader only
+    LOW_LATENCY = {
+        "linger.ms": 0,
+        "acks": "1",
+        "compression.type": "none",
+        "socket.nagle.disable": True,
+    }
+
+    # Large compressed batches, wait a little to fill them
+    HIGH_THROUGHPUT = {
+        "linger.ms": 50,
+        "batch.size": 1048576,
+        "batch.num.messages": 10000,
+        "compression.type": "lz4",
+        "acks": "1",
+        "queue.buffering.max.kbytes": 1048576,
+    }
+
+    # Idempotent producer: no duplicates or reordering on retries
+    EXACTLY_ONCE = {
+        "enable.idempotence": True,
+        "acks": "all",
+        "max.in.flight.requests.per.connection": 5,
+        "linger.ms": 5,
+        "compression.type": "lz4",
+    }
+
+
+class ConstantsKafkaCommitMode(Enum):
+    """
+    How ProviderKafkaConsumer.commit_batch commits offsets, selected
+    with KAFKA_CONSUMER_COMMIT_MODE
+    """
+
+    # Synchronous commit of the batch high-watermarks
+    BATCH = "batch"
+    # Asynchronous commit of the batch high-watermarks
+    ASYNC = "async"
+    # Store the high-watermarks, commit them asynchronously at intervals
+    PERIODIC = "periodic"
@@ -19,3 +19,54 @@ class ConstantsMessagesAllowRelease(Enum, metaclass=ConstantsMessagesAllowReleas
 class ConstantsMessagesTypes(Enum):
     PACS_002 = "pacs.002"
     PACS_008 = "pacs.008"
+
+
+class ConstantsMessagesPacs008Fields(Enum):
+    """
+    Paths of the pacs.008 fields read by the received message accessors
+    The last segment is either an element (its text) or an @attribute
+    """
+
+    CREDITOR_NAME = "Document/FIToFICstmrCdtTrf/CdtTrfTxInf/Cdtr/Nm"
+    CREDITOR_ACCOUNT = "Document/FIToFICstmrCdtTrf/CdtTrfTxInf/CdtrAcct/Id/Othr/Id"
+    DEBITOR_NAME = "Document/FIToFICstmrCdtTrf/CdtTrfTxInf/Dbtr/Nm"
+    DEBITOR_ACCOUNT = "Document/FIToFICstmrCdtTrf/CdtTrfTxInf/DbtrAcct/Id/Othr/Id"
+    AMOUNT = "Document/FIToFICstmrCdtTrf/CdtTrfTxInf/IntrBkSttlmAmt"
+    CURRENCY = "Document/FIToFICstmrCdtTrf/CdtTrfTxInf/IntrBkSttlmAmt/@Ccy"
+
+
+class ConstantsMessagesPacs008Paths(Enum):
+    """
+    Paths of the repeated pacs.008 elements
+    """
+
+    TRANSACTION = "Document/FIToFICstmrCdtTrf/CdtTrfTxInf"
+
+
+class ConstantsMessagesPacs008TransactionFields(Enum):
+    """
+    Paths of the fields of one pacs.008 transaction, relative to CdtTrfTxInf
+    """
+
+    INSTRUCTION_ID = "PmtId/InstrId"
+    END_TO_END_ID = "PmtId/EndToEndId"
+    TRANSACTION_ID = "PmtId/TxId"
+    CREDITOR_NAME = "Cdtr/Nm"
+    CREDITOR_ACCOUNT = "CdtrAcct/Id/Othr/Id"
+    DEBITOR_NAME = "Dbtr/Nm"
+    DEBITOR_ACCOUNT = "DbtrAcct/Id/Othr/Id"
+    AMOUNT = "IntrBkSttlmAmt"
+    CURRENCY = "IntrBkSttlmAmt/@Ccy"
+
+
+class ConstantsMessagesPacs002Status(Enum):
+    """
+    ISO 20022 payment status codes used in pacs.002 reports
+    """
+
+    ACCEPTED_TECHNICAL_VALIDATION = "ACTC"
+    ACCEPTED_SETTLEMENT_IN_PROCESS = "ACSP"
+    ACCEPTED_SETTLEMENT_COMPLETED = "ACSC"
+    ACCEPTED_CUSTOMER_PROFILE = "ACCP"
+    PENDING = "PDNG"
+    REJECTED = "RJCT"
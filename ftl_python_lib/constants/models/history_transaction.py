@@ -0,0 +1,24 @@
+"""
+Constants for History Transaction
+"""
+
+from enum import Enum
+
+
+class ConstantsHistoryTransactionRollupGranularity(Enum):
+    """
+    History transaction rollup bucket sizes - inherits the Enum class
+    """
+
+    HOUR = "hour"
+    DAY = "day"
+
+
+class ConstantsHistoryTransactionRollupBucketFormat(Enum):
+    """
+    MySQL DATE_FORMAT patterns truncating a timestamp to its rollup bucket,
+    one per ConstantsHistoryTransactionRollupGranularity member
+    """
+
+    HOUR = "%Y-%m-%d %H:00:00"
+    DAY = "%Y-%m-%d 00:00:00"
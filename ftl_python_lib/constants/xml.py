@@ -0,0 +1,14 @@
+"""
+Constants for XML processing
+"""
+
+from enum import Enum
+
+
+class ConstantsXmlCodec(Enum):
+    """
+    XML <-> dict codecs selectable with FTL_XML_CODEC
+    """
+
+    XMLTODICT = "xmltodict"
+    LXML = "lxml"
@@ -9,6 +9,7 @@ from typing import Dict
 from typing import Optional
 
 from ftl_python_lib.core.providers.aws.secretsmanager_environ import ProviderSecretsManagerEnviron
+from ftl_python_lib.utils.to_bool import str_to_bool
 
 
 def push_environ_to_os():
@@ -167,6 +168,148 @@ class EnvironmentContext:
 
         return self.__get_value(key="KAFKA_MESSAGE_OUTBOX_TARGET")
 
+    @property
+    def kafka_producer_profile(self) -> str:
+        """
+        Get KAFKA_PRODUCER_PROFILE env variable value
+        """
+
+        value: Optional[str] = self.__get_value(
+            key="KAFKA_PRODUCER_PROFILE", silent=True
+        )
+
+        return value.lower() if value is not None else "default"
+
+    @property
+    def kafka_producer_compression(self) -> Optional[str]:
+        """
+        Get KAFKA_PRODUCER_COMPRESSION env variable value
+        """
+
+        return self.__get_value(key="KAFKA_PRODUCER_COMPRESSION", silent=True)
+
+    @property
+    def kafka_consumer_group_id(self) -> Optional[str]:
+        """
+        Get KAFKA_CONSUMER_GROUP_ID env variable value
+        """
+
+        return self.__get_value(key="KAFKA_CONSUMER_GROUP_ID", silent=True)
+
+    @property
+    def kafka_consumer_fetch_min_bytes(self) -> int:
+        """
+        Get KAFKA_CONSUMER_FETCH_MIN_BYTES env variable value
+        """
+
+        value: Optional[str] = self.__get_value(
+            key="KAFKA_CONSUMER_FETCH_MIN_BYTES", silent=True
+        )
+
+        return int(value) if value is not None and value.isdigit() else 1
+
+    @property
+    def kafka_consumer_fetch_wait_max_ms(self) -> int:
+        """
+        Get KAFKA_CONSUMER_FETCH_WAIT_MAX_MS env variable value
+        """
+
+        value: Optional[str] = self.__get_value(
+            key="KAFKA_CONSUMER_FETCH_WAIT_MAX_MS", silent=True
+        )
+
+        return int(value) if value is not None and value.isdigit() else 500
+
+    @property
+    def kafka_consumer_max_partition_fetch_bytes(self) -> int:
+        """
+        Get KAFKA_CONSUMER_MAX_PARTITION_FETCH_BYTES env variable value
+        """
+
+        value: Optional[str] = self.__get_value(
+            key="KAFKA_CONSUMER_MAX_PARTITION_FETCH_BYTES", silent=True
+        )
+
+        return int(value) if value is not None and value.isdigit() else 1048576
+
+    @property
+    def kafka_consumer_session_timeout_ms(self) -> int:
+        """
+        Get KAFKA_CONSUMER_SESSION_TIMEOUT_MS env variable value
+        """
+
+        value: Optional[str] = self.__get_value(
+            key="KAFKA_CONSUMER_SESSION_TIMEOUT_MS", silent=True
+        )
+
+        return int(value) if value is not None and value.isdigit() else 45000
+
+    @property
+    def kafka_consumer_assignment_strategy(self) -> Optional[str]:
+        """
+        Get KAFKA_CONSUMER_ASSIGNMENT_STRATEGY env variable value
+        """
+
+        return self.__get_value(key="KAFKA_CONSUMER_ASSIGNMENT_STRATEGY", silent=True)
+
+    @property
+    def kafka_consumer_commit_mode(self) -> str:
+        """
+        Get KAFKA_CONSUMER_COMMIT_MODE env variable value
+        """
+
+        value: Optional[str] = self.__get_value(
+            key="KAFKA_CONSUMER_COMMIT_MODE", silent=True
+        )
+
+        return value.lower() if value is not None else "batch"
+
+    @property
+    def kafka_consumer_commit_interval_ms(self) -> int:
+        """
+        Get KAFKA_CONSUMER_COMMIT_INTERVAL_MS env variable value
+        """
+
+        value: Optional[str] = self.__get_value(
+            key="KAFKA_CONSUMER_COMMIT_INTERVAL_MS", silent=True
+        )
+
+        return int(value) if value is not None and value.isdigit() else 5000
+
+    @property
+    def kafka_worker_lanes(self) -> int:
+        """
+        Get KAFKA_WORKER_LANES env variable value
+        """
+
+        value: Optional[str] = self.__get_value(key="KAFKA_WORKER_LANES", silent=True)
+
+        return int(value) if value is not None and value.isdigit() else 8
+
+    @property
+    def kafka_worker_lane_capacity(self) -> int:
+        """
+        Get KAFKA_WORKER_LANE_CAPACITY env variable value
+        """
+
+        value: Optional[str] = self.__get_value(
+            key="KAFKA_WORKER_LANE_CAPACITY", silent=True
+        )
+
+        return int(value) if value is not None and value.isdigit() else 100
+
+    @property
+    def kafka_worker_revoke_timeout_ms(self) -> int:
+        """
+        Get KAFKA_WORKER_REVOKE_TIMEOUT_MS env variable value
+        """
+
+        value: Optional[str] = self.__get_value(
+            key="KAFKA_WORKER_REVOKE_TIMEOUT_MS", silent=True
+        )
+
+        return int(value) if value is not None and value.isdigit() else 30000
+
     @property
     def msa_msg_out(self) -> str:
         """
@@ -407,6 +550,112 @@ class EnvironmentContext:
 
         return self.__get_value(key="FTL_DB_PORT")
 
+    @property
+    def ftl_db_pool_size(self) -> int:
+        """
+        Get FTL_DB_POOL_SIZE env variable value
+        """
+
+        value: Optional[str] = self.__get_value(key="FTL_DB_POOL_SIZE", silent=True)
+
+        return int(value) if value is not None and value.isdigit() else 5
+
+    @property
+    def ftl_db_max_overflow(self) -> int:
+        """
+        Get FTL_DB_MAX_OVERFLOW env variable value
+        """
+
+        value: Optional[str] = self.__get_value(key="FTL_DB_MAX_OVERFLOW", silent=True)
+
+        return int(value) if value is not None and value.isdigit() else 10
+
+    @property
+    def ftl_db_pool_timeout(self) -> int:
+        """
+        Get FTL_DB_POOL_TIMEOUT env variable value
+        """
+
+        value: Optional[str] = self.__get_value(key="FTL_DB_POOL_TIMEOUT", silent=True)
+
+        return int(value) if value is not None and value.isdigit() else 30
+
+    @property
+    def ftl_db_pool_recycle(self) -> int:
+        """
+        Get FTL_DB_POOL_RECYCLE env variable value
+        """
+
+        value: Optional[str] = self.__get_value(key="FTL_DB_POOL_RECYCLE", silent=True)
+
+        return int(value) if value is not None and value.isdigit() else 3600
+
+    @property
+    def ftl_db_pool_pre_ping(self) -> bool:
+        """
+        Get FTL_DB_POOL_PRE_PING env variable value
+        """
+
+        value: Optional[str] = self.__get_value(key="FTL_DB_POOL_PRE_PING", silent=True)
+
+        return str_to_bool(value.lower()) if value is not None else True
+
+    @property
+    def ftl_db_echo(self) -> bool:
+        """
+        Get FTL_DB_ECHO env variable value
+        """
+
+        value: Optional[str] = self.__get_value(key="FTL_DB_ECHO", silent=True)
+
+        return str_to_bool(value.lower()) if value is not None else False
+
+    @property
+    def ftl_db_bulk_insert_chunk_size(self) -> int:
+        """
+        Get FTL_DB_BULK_INSERT_CHUNK_SIZE env variable value
+        """
+
+        value: Optional[str] = self.__get_value(
+            key="FTL_DB_BULK_INSERT_CHUNK_SIZE", silent=True
+        )
+
+        return int(value) if value is not None and value.isdigit() else 1000
+
+    @property
+    def ftl_xml_schema_cache_size(self) -> int:
+        """
+        Get FTL_XML_SCHEMA_CACHE_SIZE env variable value
+        """
+
+        value: Optional[str] = self.__get_value(
+            key="FTL_XML_SCHEMA_CACHE_SIZE", silent=True
+        )
+
+        return int(value) if value is not None and value.isdigit() else 32
+
+    @property
+    def ftl_xml_codec(self) -> str:
+        """
+        Get FTL_XML_CODEC env variable value
+        """
+
+        value: Optional[str] = self.__get_value(key="FTL_XML_CODEC", silent=True)
+
+        return value.lower() if value is not None else "xmltodict"
+
+    @property
+    def ftl_dashboard_cache_ttl(self) -> int:
+        """
+        Get FTL_DASHBOARD_CACHE_TTL env variable value
+        """
+
+        value: Optional[str] = self.__get_value(
+            key="FTL_DASHBOARD_CACHE_TTL", silent=True
+        )
+
+        return int(value) if value is not None and value.isdigit() else 30
+
     @property
     def message_definitions_host(self) -> str:
         """
@@ -1,26 +1,192 @@
 """
 Context for the SQLalchemy session
-Contains the session
+Contains the session and the request-scoped unit of work
 """
 
-from sqlalchemy import create_engine
+import threading
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from sqlalchemy.orm import Session
 from sqlalchemy.orm import sessionmaker
 
+from ftl_python_lib.core.context.request import RequestContext
+from ftl_python_lib.core.log import LOGGER
 from ftl_python_lib.core.providers.mysql.engine import MySqlEngine
 
+# Session.info key of the callbacks to run once the unit of work commits
+AFTER_COMMIT: str = "ftl_after_commit"
+
+_UNITS_OF_WORK: Dict[str, Session] = {}
+_UNITS_OF_WORK_LOCK: threading.Lock = threading.Lock()
+
 
 class SessionContext:
     """
     FTL Context about the session
+    While a unit of work is open for the request, every helper built with
+    the same RequestContext shares one session and one transaction, which
+    is committed once when the unit of work ends; helpers built outside of
+    it keep their own standalone session
+    :param __request_context: Context about the request
+    :type __request_context: Optional[RequestContext]
     """
 
-    def __init__(self) -> None:
+    def __init__(self, request_context: Optional[RequestContext] = None) -> None:
         """
         Constructor
         """
 
-    def get_session(self):
-        Session = sessionmaker(bind=MySqlEngine.get_engine())
-        session = Session()
+        self.__request_context = request_context
+        self.__session: Optional[Session] = None
+
+    def __enter__(self) -> Session:
+        return self.begin()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.end(exception=exc_value)
+
+    @property
+    def __request_id(self) -> Optional[str]:
+        if self.__request_context is None:
+            return None
+
+        return self.__request_context.request_id
+
+    @property
+    def in_unit_of_work(self) -> bool:
+        """
+        Whether a unit of work is open for the current request
+        """
+
+        return self.__request_id in _UNITS_OF_WORK
+
+    @property
+    def is_shared(self) -> bool:
+        """
+        Whether the session held by this context is the shared session
+        of the request's open unit of work
+        """
+
+        shared: Optional[Session] = _UNITS_OF_WORK.get(self.__request_id)
+
+        return shared is not None and self.__session is shared
+
+    def get_session(self) -> Session:
+        """
+        Return the session held by this context. The first call picks the
+        request's shared session if a unit of work is open, otherwise a new
+        standalone session; later calls keep returning the same one, so a
+        helper built before begin() keeps committing its own session
+        """
+
+        if self.__session is None:
+            self.__session = _UNITS_OF_WORK.get(self.__request_id)
+
+        if self.__session is None:
+            self.__session = sessionmaker(bind=MySqlEngine.get_engine())()
+
+        return self.__session
+
+    def commit(self, on_commit: Optional[Callable[[], None]] = None) -> None:
+        """
+        Commit the held session if it is standalone; if it is the shared
+        session of a unit of work only flush, the commit happens once when
+        the unit of work ends
+        :param on_commit: Called once the changes are really committed,
+            i.e. right away for a standalone session, in end() otherwise
+        :type on_commit: Optional[Callable[[], None]]
+        """
+
+        session: Session = self.get_session()
+
+        if not self.is_shared:
+            session.commit()
+
+            if on_commit is not None:
+                on_commit()
+
+            return
+
+        session.flush()
+
+        if on_commit is not None:
+            callbacks: List[Callable[[], None]] = session.info.setdefault(
+                AFTER_COMMIT, []
+            )
+
+            if on_commit not in callbacks:
+                callbacks.append(on_commit)
+
+    def rollback(self) -> None:
+        """
+        Roll back the held session if it is standalone; the shared session
+        of a unit of work is left alone, the caller raises and end() rolls
+        back the whole unit of work
+        """
+
+        if self.__session is None or self.is_shared:
+            return
+
+        self.__session.rollback()
+
+    def begin(self) -> Session:
+        """
+        Open the unit of work for the current request
+        """
+
+        if self.__request_id is None:
+            raise ValueError("A unit of work requires a request context")
+
+        with _UNITS_OF_WORK_LOCK:
+            session: Optional[Session] = _UNITS_OF_WORK.get(self.__request_id)
+
+            if session is None:
+                session = sessionmaker(bind=MySqlEngine.get_engine())()
+                _UNITS_OF_WORK[self.__request_id] = session
+
+                LOGGER.logger.debug(
+                    f"Unit of work opened for request {self.__request_id}"
+                )
+
+        self.__session = session
 
         return session
+
+    def end(self, exception: Optional[BaseException] = None) -> None:
+        """
+        Commit (or roll back on exception) and close the unit of work
+        for the current request, then run the on_commit callbacks of a
+        successful commit; safe to call from a teardown hook
+        """
+
+        with _UNITS_OF_WORK_LOCK:
+            session: Optional[Session] = _UNITS_OF_WORK.pop(self.__request_id, None)
+
+        if session is None:
+            return
+
+        callbacks: List[Callable[[], None]] = session.info.pop(AFTER_COMMIT, [])
+
+        try:
+            if exception is None:
+                session.commit()
+            else:
+                session.rollback()
+        except Exception as exc:
+            session.rollback()
+            LOGGER.logger.error(
+                f"Unexpected error when ending unit of work: {str(exc)}"
+            )
+            raise exc
+        finally:
+            session.close()
+            self.__session = None
+
+            LOGGER.logger.debug(f"Unit of work closed for request {self.__request_id}")
+
+        if exception is None:
+            for callback in callbacks:
+                callback()
@@ -2,18 +2,33 @@
 Provider for Kafka Consumer
 """
 
+import threading
+import time
+from typing import Callable
+from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
+from typing import Union
 
 from confluent_kafka import Consumer
+from confluent_kafka import KafkaError
+from confluent_kafka import KafkaException
 from confluent_kafka import Message
+from confluent_kafka import TopicPartition
 
+from ftl_python_lib.constants.kafka import ConstantsKafkaCommitMode
 from ftl_python_lib.core.context.environment import EnvironmentContext
 from ftl_python_lib.core.context.request import RequestContext
 from ftl_python_lib.core.exceptions.server_unexpected_error_exception import ExceptionUnexpectedError
 from ftl_python_lib.core.log import LOGGER
 from ftl_python_lib.utils.to_str import bytes_to_str
 
+# librdkafka's default, used by consumers that predate the cooperative default
+EAGER_ASSIGNMENT_STRATEGY: str = "range,roundrobin"
+
+COOPERATIVE_ASSIGNMENT_STRATEGY: str = "cooperative-sticky"
+
 
 # pylint: disable=R0903
 # too-few-public-methods
@@ -52,18 +67,23 @@ class ProviderKafkaConsumer:
         self.__bootstrap_servers = self.__environ_context.kafka_broker_endpoints
 
         self.__subscribed = False
+        self.__commit_mode = self.__get_commit_mode()
+        self.__commit_interval = (
+            self.__environ_context.kafka_consumer_commit_interval_ms / 1000
+        )
+        self.__committed_at = time.monotonic()
+
+        self.__rebalance_lock: threading.Lock = threading.Lock()
+        self.__rebalances: int = 0
+        self.__rebalance_time_total: float = 0.0
+        self.__rebalance_time_max: float = 0.0
+        self.__callback_time_total: float = 0.0
+        self.__revoked_at: Optional[float] = None
 
         if init_consumer is True:
             LOGGER.logger.debug("Initializing Kafka consumer. Connecting to brokers")
 
-            self.__consumer = Consumer(
-                {
-                    "bootstrap.servers": self.__bootstrap_servers,
-                    "group.id": __package__,
-                    "enable.auto.commit": False,
-                    "auto.offset.reset": "earliest",
-                }
-            )
+            self.__consumer = Consumer(self.__get_config())
 
             LOGGER.logger.debug("Initializing Kafka consumer. Connected to brokers")
         else:
@@ -71,6 +91,58 @@ class ProviderKafkaConsumer:
 
             self.__consumer = None
 
+    def __get_config(self) -> Dict[str, Union[str, int, bool]]:
+        """
+        Build the consumer configuration from the environment
+        Offsets are only stored explicitly, so that commit_batch can
+        store the high-watermarks of fully processed batches
+        """
+
+        group_id: Optional[str] = self.__environ_context.kafka_consumer_group_id
+        strategy: str = COOPERATIVE_ASSIGNMENT_STRATEGY
+
+        if group_id is None:
+            LOGGER.logger.warning(
+                "KAFKA_CONSUMER_GROUP_ID is not set. "
+                + f"Joining the shared consumer group {__package__}"
+            )
+
+            group_id = __package__
+
+            # Members of the shared group may still run the eager protocol,
+            # a cooperative member cannot join a group with eager members
+            strategy = EAGER_ASSIGNMENT_STRATEGY
+
+        return {
+            "bootstrap.servers": self.__bootstrap_servers,
+            "group.id": group_id,
+            "enable.auto.commit": False,
+            "enable.auto.offset.store": False,
+            "auto.offset.reset": "earliest",
+            "fetch.min.bytes": self.__environ_context.kafka_consumer_fetch_min_bytes,
+            "fetch.wait.max.ms": self.__environ_context.kafka_consumer_fetch_wait_max_ms,
+            "max.partition.fetch.bytes": self.__environ_context.kafka_consumer_max_partition_fetch_bytes,
+            "session.timeout.ms": self.__environ_context.kafka_consumer_session_timeout_ms,
+            "partition.assignment.strategy": self.__environ_context.kafka_consumer_assignment_strategy
+            or strategy,
+        }
+
+    def __get_commit_mode(self) -> ConstantsKafkaCommitMode:
+        """
+        Resolve the commit mode from KAFKA_CONSUMER_COMMIT_MODE
+        """
+
+        name: str = self.__environ_context.kafka_consumer_commit_mode
+
+        try:
+            return ConstantsKafkaCommitMode(name)
+        except ValueError:
+            LOGGER.logger.warning(
+                f"Unknown Kafka consumer commit mode {name}. Using {ConstantsKafkaCommitMode.BATCH.value}"
+            )
+
+            return ConstantsKafkaCommitMode.BATCH
+
     def init_consumer(self) -> None:
         """
         Create Kafka consumer and create a connection
@@ -78,22 +150,27 @@ class ProviderKafkaConsumer:
 
         LOGGER.logger.debug("Initializing Kafka consumer. Connecting to brokers")
 
-        self.__consumer = Consumer(
-            {
-                "bootstrap.servers": self.__bootstrap_servers,
-                "group.id": __package__,
-                "enable.auto.commit": False,
-                "auto.offset.reset": "earliest",
-            }
-        )
+        self.__consumer = Consumer(self.__get_config())
 
         LOGGER.logger.debug("Initializing Kafka consumer. Connected to brokers")
 
-    def subscribe(self, topics: List[str]) -> None:
+    def subscribe(
+        self,
+        topics: List[str],
+        on_assign: Optional[Callable[[Consumer, List[TopicPartition]], None]] = None,
+        on_revoke: Optional[Callable[[Consumer, List[TopicPartition]], None]] = None,
+        on_lost: Optional[Callable[[Consumer, List[TopicPartition]], None]] = None,
+    ) -> None:
         """
         Set subscription to supplied list of topics
         :param topics: List of topic to subscribe to
         :type topics: List[str]
+        :param on_assign: Called when partitions are assigned
+        :type on_assign: Optional[Callable[[Consumer, List[TopicPartition]], None]]
+        :param on_revoke: Called when partitions are revoked
+        :type on_revoke: Optional[Callable[[Consumer, List[TopicPartition]], None]]
+        :param on_lost: Called when partitions are lost
+        :type on_lost: Optional[Callable[[Consumer, List[TopicPartition]], None]]
         """
 
         if self.__consumer is not None:
@@ -101,7 +178,13 @@ class ProviderKafkaConsumer:
                 f"Kafka consumer is initialized. Subscribing to topics: {topics}"
             )
 
-            self.__consumer.subscribe(topics)
+            callbacks: Dict[str, Callable[[Consumer, List[TopicPartition]], None]] = {
+                "on_assign": self.__timed_rebalance(event="assign", callback=on_assign),
+                "on_revoke": self.__timed_rebalance(event="revoke", callback=on_revoke),
+                "on_lost": self.__timed_rebalance(event="lost", callback=on_lost),
+            }
+
+            self.__consumer.subscribe(topics, **callbacks)
             self.__subscribed = True
 
             LOGGER.logger.debug(f"Subscribed to topics: {topics}")
@@ -143,6 +226,235 @@ class ProviderKafkaConsumer:
 
             self.__consumer.commit(message=message)
 
+    def consume_batch(
+        self, max_messages: int = 500, timeout: Optional[float] = 1.0
+    ) -> List[Message]:
+        """
+        Consume up to `max_messages` messages in one call
+        Messages carrying an error (e.g. partition EOF) are logged and left out
+        :param max_messages: Maximum number of messages returned
+        :type max_messages: int
+        :param timeout: Maximum time to block waiting for messages
+        :type timeout: Optional[float]
+        """
+
+        if self.__subscribed is True and self.__consumer is not None:
+            LOGGER.logger.debug(
+                f"Kafka consumer is intialized and subscribed. Consuming up to {max_messages} messages"
+            )
+
+            messages: List[Message] = []
+
+            for message in self.__consumer.consume(
+                num_messages=max_messages, timeout=timeout
+            ):
+                if message.error() is not None:
+                    LOGGER.logger.warning(
+                        f"Kafka consumer received an error: {message.error()}"
+                    )
+
+                    continue
+
+                messages.append(message)
+
+            return messages
+        raise ExceptionUnexpectedError(
+            request_context=self.__request_context,
+            message="Kafka consumer was not subscribed",
+        )
+
+    @staticmethod
+    def high_watermarks(messages: List[Message]) -> List[TopicPartition]:
+        """
+        Return, per topic partition, the offset following the last message
+        :param messages: Processed messages
+        :type messages: List[Message]
+        """
+
+        offsets: Dict[Tuple[str, int], int] = {}
+
+        for message in messages:
+            key: Tuple[str, int] = (message.topic(), message.partition())
+            offsets[key] = max(offsets.get(key, -1), message.offset() + 1)
+
+        return [
+            TopicPartition(topic, partition, offset)
+            for (topic, partition), offset in offsets.items()
+        ]
+
+    def commit_offsets(
+        self,
+        offsets: List[TopicPartition],
+        mode: Optional[ConstantsKafkaCommitMode] = None,
+    ) -> None:
+        """
+        Commit offsets according to the commit mode
+        :param offsets: Offsets to commit, i.e. next offset to consume per partition
+        :type offsets: List[TopicPartition]
+        :param mode: Commit mode, defaults to KAFKA_CONSUMER_COMMIT_MODE
+        :type mode: Optional[ConstantsKafkaCommitMode]
+        """
+
+        if len(offsets) == 0:
+            return
+
+        if self.__subscribed is not True or self.__consumer is None:
+            return
+
+        mode = mode if mode is not None else self.__commit_mode
+
+        LOGGER.logger.debug(
+            f"Kafka consumer is intialized and subscribed. Commiting {len(offsets)} partition offsets ({mode.value})"
+        )
+
+        if mode == ConstantsKafkaCommitMode.PERIODIC:
+            self.__consumer.store_offsets(offsets=offsets)
+
+            if time.monotonic() - self.__committed_at < self.__commit_interval:
+                return
+
+            self.__consumer.commit(asynchronous=True)
+        else:
+            self.__consumer.commit(
+                offsets=offsets, asynchronous=mode == ConstantsKafkaCommitMode.ASYNC
+            )
+
+        self.__committed_at = time.monotonic()
+
+    def commit_batch(
+        self, messages: List[Message], mode: Optional[ConstantsKafkaCommitMode] = None
+    ) -> None:
+        """
+        Commit a processed batch: one commit of the partition high-watermarks
+        instead of one synchronous commit per message
+        :param messages: Processed messages
+        :type messages: List[Message]
+        :param mode: Commit mode, defaults to KAFKA_CONSUMER_COMMIT_MODE
+        :type mode: Optional[ConstantsKafkaCommitMode]
+        """
+
+        self.commit_offsets(
+            offsets=ProviderKafkaConsumer.high_watermarks(messages=messages), mode=mode
+        )
+
+    def __timed_rebalance(
+        self,
+        event: str,
+        callback: Optional[Callable[[Consumer, List[TopicPartition]], None]],
+    ) -> Callable[[Consumer, List[TopicPartition]], None]:
+        """
+        Wrap a rebalance callback to time it and the whole rebalance,
+        from the first revocation to the following assignment
+        """
+
+        def timed(consumer: Consumer, partitions: List[TopicPartition]) -> None:
+            started_at: float = time.perf_counter()
+
+            with self.__rebalance_lock:
+                if event != "assign" and self.__revoked_at is None:
+                    self.__revoked_at = started_at
+
+            try:
+                if callback is not None:
+                    callback(consumer, partitions)
+            finally:
+                finished_at: float = time.perf_counter()
+                elapsed: float = finished_at - started_at
+                rebalance: Optional[float] = None
+
+                with self.__rebalance_lock:
+                    self.__callback_time_total += elapsed
+
+                    if event == "assign":
+                        self.__rebalances += 1
+                        rebalance = finished_at - (
+                            self.__revoked_at
+                            if self.__revoked_at is not None
+                            else started_at
+                        )
+                        self.__revoked_at = None
+                        self.__rebalance_time_total += rebalance
+                        self.__rebalance_time_max = max(
+                            self.__rebalance_time_max, rebalance
+                        )
+
+                LOGGER.logger.info(
+                    f"Kafka consumer rebalance {event}: {len(partitions)} partitions, callback {elapsed * 1000:.1f} ms"
+                    + (
+                        f", rebalance {rebalance * 1000:.1f} ms"
+                        if rebalance is not None
+                        else ""
+                    )
+                )
+
+        return timed
+
+    def statistics(self) -> Dict[str, Union[int, float]]:
+        """
+        Return a snapshot of the rebalance statistics
+        """
+
+        with self.__rebalance_lock:
+            return {
+                "rebalances": self.__rebalances,
+                "rebalance_time_total": self.__rebalance_time_total,
+                "rebalance_time_max": self.__rebalance_time_max,
+                "rebalance_time_avg": (
+                    self.__rebalance_time_total / self.__rebalances
+                    if self.__rebalances > 0
+                    else 0.0
+                ),
+                "callback_time_total": self.__callback_time_total,
+            }
+
+    def assignment(self) -> List[TopicPartition]:
+        """
+        Return the partitions currently assigned to the consumer
+        """
+
+        if self.__consumer is None:
+            return []
+
+        return self.__consumer.assignment()
+
+    def pause(self, partitions: List[TopicPartition]) -> None:
+        """
+        Stop fetching from the supplied partitions
+        :param partitions: Partitions to pause
+        :type partitions: List[TopicPartition]
+        """
+
+        if self.__consumer is not None and len(partitions) > 0:
+            LOGGER.logger.debug(f"Pausing {len(partitions)} Kafka partitions")
+
+            self.__consumer.pause(partitions)
+
+    def resume(self, partitions: List[TopicPartition]) -> None:
+        """
+        Resume fetching from the supplied partitions
+        :param partitions: Partitions to resume
+        :type partitions: List[TopicPartition]
+        """
+
+        if self.__consumer is not None and len(partitions) > 0:
+            LOGGER.logger.debug(f"Resuming {len(partitions)} Kafka partitions")
+
+            self.__consumer.resume(partitions)
+
+    def __commit_stored(self) -> None:
+        """
+        Synchronously commit the offsets stored since the last periodic commit
+        """
+
+        try:
+            self.__consumer.commit(asynchronous=False)
+        except KafkaException as exc:
+            # Nothing stored since the last commit
+            # _NO_OFFSET is librdkafka's public error code, only named with
+            # a leading underscore by confluent_kafka
+            if exc.args[0].code() != KafkaError._NO_OFFSET:  # pylint: disable=W0212
+                raise exc
+
     def close(self) -> None:
         """
         Close down and terminate the Kafka Consumer
@@ -153,4 +465,7 @@ class ProviderKafkaConsumer:
                 "Kafka consumer is intialized and subscribed. Closing the consumer"
             )
 
+            if self.__commit_mode == ConstantsKafkaCommitMode.PERIODIC:
+                self.__commit_stored()
+
             self.__consumer.close()
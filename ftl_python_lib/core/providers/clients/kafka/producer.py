@@ -2,16 +2,29 @@
 Provider for Kafka Producer
 """
 
+import threading
+from concurrent.futures import Future
+from typing import Callable
+from typing import Dict
+from typing import List
 from typing import Optional
+from typing import Union
 
+from confluent_kafka import KafkaError
+from confluent_kafka import KafkaException
+from confluent_kafka import Message
 from confluent_kafka import Producer
 
+from ftl_python_lib.constants.kafka import ConstantsKafkaProducerProfile
 from ftl_python_lib.core.context.environment import EnvironmentContext
 from ftl_python_lib.core.context.request import RequestContext
 from ftl_python_lib.core.exceptions.server_unexpected_error_exception import ExceptionUnexpectedError
 from ftl_python_lib.core.log import LOGGER
 from ftl_python_lib.utils.to_str import bytes_to_str
 
+# Seconds the background thread blocks in poll() between checks for shutdown
+POLL_INTERVAL: float = 0.1
+
 
 class ProviderKafkaProducer:
     """
@@ -22,8 +35,12 @@ class ProviderKafkaProducer:
     :type __request_context: RequestContext
     :param __producer: Kafka producer
     :type __producer: Optional[Producer]
+    :param __poll_thread: Background thread serving delivery callbacks in async mode
+    :type __poll_thread: Optional[threading.Thread]
     """
 
+    __poll_thread: Optional[threading.Thread] = None
+
     def __init__(
         self,
         request_context: RequestContext,
@@ -46,16 +63,13 @@ class ProviderKafkaProducer:
         self.__request_context = request_context
         self.__environ_context = environ_context
         self.__bootstrap_servers = self.__environ_context.kafka_broker_endpoints
+        self.__poll_stop = threading.Event()
+        self.__poll_lock = threading.Lock()
 
         if init_producer is True:
             LOGGER.logger.debug("Initializing Kafka producer. Connecting to brokers")
 
-            self.__producer = Producer(
-                {
-                    "bootstrap.servers": self.__bootstrap_servers,
-                    "client.id": __package__,
-                }
-            )
+            self.__producer = Producer(self.__get_config())
 
             LOGGER.logger.debug("Initializing Kafka producer. Connected to brokers")
         else:
@@ -63,6 +77,38 @@ class ProviderKafkaProducer:
 
             self.__producer = None
 
+    def __get_config(self) -> Dict[str, Union[str, int, bool]]:
+        """
+        Build the producer configuration from the selected tuning profile
+        """
+
+        profile_name: str = self.__environ_context.kafka_producer_profile
+
+        try:
+            profile: ConstantsKafkaProducerProfile = ConstantsKafkaProducerProfile[
+                profile_name.upper()
+            ]
+        except KeyError:
+            LOGGER.logger.warning(
+                f"Unknown Kafka producer profile '{profile_name}'. Using defaults"
+            )
+
+            profile = ConstantsKafkaProducerProfile.DEFAULT
+
+        LOGGER.logger.debug(f"Kafka producer profile: {profile.name.lower()}")
+
+        config: Dict[str, Union[str, int, bool]] = {
+            **profile.value,
+            "bootstrap.servers": self.__bootstrap_servers,
+            "client.id": __package__,
+        }
+
+        compression: Optional[str] = self.__environ_context.kafka_producer_compression
+        if compression is not None:
+            config["compression.type"] = compression
+
+        return config
+
     def init_producer(self) -> None:
         """
         Create Kafka producer and create a connection
@@ -70,15 +116,49 @@ class ProviderKafkaProducer:
 
         LOGGER.logger.debug("Initializing Kafka producer. Connecting to brokers")
 
-        self.__producer = Producer(
-            {
-                "bootstrap.servers": self.__bootstrap_servers,
-                "client.id": __package__,
-            }
-        )
+        self.__producer = Producer(self.__get_config())
 
         LOGGER.logger.debug("Initializing Kafka producer. Connected to brokers")
 
+    def __produce_sync(self, topic: str, key: str, value: str) -> None:
+        """
+        Produce a message and wait for its delivery report
+        The report is recorded by a callback of its own, whichever thread
+        serves it, and any delivery error is raised in the caller's thread
+        """
+
+        if self.__producer is None:
+            return
+
+        LOGGER.logger.debug(
+            f"Kafka producer is initialized. Producing message with key: {key}"
+        )
+
+        delivered: threading.Event = threading.Event()
+        errors: List[KafkaError] = []
+
+        def report(error: Optional[KafkaError], message: Message) -> None:
+            try:
+                if error is not None:
+                    errors.append(error)
+                else:
+                    self.delivery_callback(error=error, message=message)
+            finally:
+                delivered.set()
+
+        self.__producer.produce(topic=topic, key=key, value=value, callback=report)
+        self.__producer.flush()
+        delivered.wait()
+
+        if len(errors) > 0:
+            LOGGER.logger.error(
+                f"Could not produce message in Kafka topic: {errors[0]}"
+            )
+
+            raise ExceptionUnexpectedError(
+                message=str(errors[0]), request_context=self.__request_context
+            )
+
     def produce_message_in_sync(self, key: str, value: str) -> None:
         """
         Produce a Kafka message - incoming topic
@@ -88,18 +168,11 @@ class ProviderKafkaProducer:
         :type value: str
         """
 
-        if self.__producer is not None:
-            LOGGER.logger.debug(
-                f"Kafka producer is initialized. Producing message with key: {key}"
-            )
-
-            self.__producer.produce(
-                topic=self.__environ_context.kafka_message_inbox_target,
-                key=key,
-                value=value,
-                callback=self.delivery_callback,
-            )
-            self.__producer.flush()
+        self.__produce_sync(
+            topic=self.__environ_context.kafka_message_inbox_target,
+            key=key,
+            value=value,
+        )
 
     def produce_message_out_sync(self, key: str, value: str) -> None:
         """
@@ -110,18 +183,11 @@ class ProviderKafkaProducer:
         :type value: str
         """
 
-        if self.__producer is not None:
-            LOGGER.logger.debug(
-                f"Kafka producer is initialized. Producing message with key: {key}"
-            )
-
-            self.__producer.produce(
-                topic=self.__environ_context.kafka_message_outbox_target,
-                key=key,
-                value=value,
-                callback=self.delivery_callback,
-            )
-            self.__producer.flush()
+        self.__produce_sync(
+            topic=self.__environ_context.kafka_message_outbox_target,
+            key=key,
+            value=value,
+        )
 
     def delivery_callback(self, error: str, message: str) -> None:
         """
@@ -140,3 +206,171 @@ class ProviderKafkaProducer:
         LOGGER.logger.debug(
             f"Produced message with key {key} to Kafka topic {message.topic()}[{message.partition()}]"
         )
+
+    def __poll_loop(self) -> None:
+        while not self.__poll_stop.is_set():
+            try:
+                self.__producer.poll(POLL_INTERVAL)
+            except Exception as exc:
+                # A failing callback must not stop delivery reports for the rest
+                LOGGER.logger.error(
+                    f"Unexpected error in Kafka producer polling: {str(exc)}"
+                )
+
+    def __start_polling(self) -> None:
+        if self.__poll_thread is not None and self.__poll_thread.is_alive():
+            return
+
+        with self.__poll_lock:
+            if self.__poll_thread is None or not self.__poll_thread.is_alive():
+                self.__poll_stop.clear()
+                self.__poll_thread = threading.Thread(
+                    target=self.__poll_loop,
+                    name="ftl-kafka-producer-poll",
+                    daemon=True,
+                )
+                self.__poll_thread.start()
+
+                LOGGER.logger.debug("Kafka producer background polling started")
+
+    def __produce_async(
+        self,
+        topic: str,
+        key: str,
+        value: str,
+        on_delivery: Optional[Callable[[Optional[KafkaError], Message], None]],
+    ) -> Future:
+        future: Future = Future()
+
+        if self.__producer is None:
+            future.set_exception(
+                ExceptionUnexpectedError(
+                    message="Kafka producer was not initialized",
+                    request_context=self.__request_context,
+                )
+            )
+
+            return future
+
+        self.__start_polling()
+
+        def delivered(error: Optional[KafkaError], message: Message) -> None:
+            if error is not None:
+                LOGGER.logger.error(
+                    f"Could not produce message in Kafka topic: {error}"
+                )
+
+                future.set_exception(KafkaException(error))
+            else:
+                future.set_result(message)
+
+            if on_delivery is not None:
+                try:
+                    on_delivery(error, message)
+                except Exception as exc:
+                    LOGGER.logger.error(
+                        f"Unexpected error in Kafka delivery callback: {str(exc)}"
+                    )
+
+        while True:
+            try:
+                self.__producer.produce(
+                    topic=topic, key=key, value=value, callback=delivered
+                )
+
+                return future
+            except BufferError:
+                # Local queue is full, wait for deliveries to free it up
+                LOGGER.logger.warning("Kafka producer queue is full. Waiting")
+
+                self.__producer.poll(POLL_INTERVAL)
+
+    def produce_message_in_async(
+        self,
+        key: str,
+        value: str,
+        on_delivery: Optional[Callable[[Optional[KafkaError], Message], None]] = None,
+    ) -> Future:
+        """
+        Queue a Kafka message - incoming topic - without waiting for delivery
+        Messages are batched by librdkafka (linger.ms, batch.size); the
+        returned future resolves with the delivered message or fails with
+        a KafkaException, and `on_delivery` is called either way
+        :param key: Message key
+        :type key: str
+        :param value: Message value
+        :type value: str
+        :param on_delivery: Per-message delivery callback (error, message)
+        :type on_delivery: Optional[Callable[[Optional[KafkaError], Message], None]]
+        """
+
+        return self.__produce_async(
+            topic=self.__environ_context.kafka_message_inbox_target,
+            key=key,
+            value=value,
+            on_delivery=on_delivery,
+        )
+
+    def produce_message_out_async(
+        self,
+        key: str,
+        value: str,
+        on_delivery: Optional[Callable[[Optional[KafkaError], Message], None]] = None,
+    ) -> Future:
+        """
+        Queue a Kafka message - outgoing topic - without waiting for delivery
+        :param key: Message key
+        :type key: str
+        :param value: Message value
+        :type value: str
+        :param on_delivery: Per-message delivery callback (error, message)
+        :type on_delivery: Optional[Callable[[Optional[KafkaError], Message], None]]
+        """
+
+        return self.__produce_async(
+            topic=self.__environ_context.kafka_message_outbox_target,
+            key=key,
+            value=value,
+            on_delivery=on_delivery,
+        )
+
+    def flush(self, timeout: Optional[float] = None) -> int:
+        """
+        Barrier: wait until every queued message is delivered (or failed)
+        :param timeout: Maximum time to wait, forever when None
+        :type timeout: Optional[float]
+        :return: Number of messages still queued
+        """
+
+        if self.__producer is None:
+            return 0
+
+        if timeout is None:
+            return self.__producer.flush()
+
+        return self.__producer.flush(timeout)
+
+    def close(self, timeout: Optional[float] = None) -> int:
+        """
+        Flush pending messages and stop background polling
+        :param timeout: Maximum time to wait for the flush, forever when None
+        :type timeout: Optional[float]
+        :return: Number of messages still queued
+        """
+
+        remaining: int = self.flush(timeout=timeout)
+
+        with self.__poll_lock:
+            if self.__poll_thread is not None:
+                self.__poll_stop.set()
+                self.__poll_thread.join()
+                self.__poll_thread = None
+
+                LOGGER.logger.debug("Kafka producer background polling stopped")
+
+        if remaining > 0:
+            LOGGER.logger.warning(
+                f"Kafka producer closed with {remaining} undelivered messages"
+            )
+
+        return remaining
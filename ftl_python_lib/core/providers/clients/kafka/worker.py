@@ -0,0 +1,566 @@
+"""
+Partition-aware worker pool around the Kafka consumer
+"""
+
+import queue
+import threading
+import zlib
+from collections import deque
+from typing import Callable
+from typing import Deque
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from typing import Union
+
+from confluent_kafka import Consumer
+from confluent_kafka import Message
+from confluent_kafka import TopicPartition
+
+from ftl_python_lib.constants.kafka import ConstantsKafkaCommitMode
+from ftl_python_lib.core.context.environment import EnvironmentContext
+from ftl_python_lib.core.log import LOGGER
+from ftl_python_lib.core.providers.clients.kafka.consumer import ProviderKafkaConsumer
+
+
+class ProviderKafkaPartitionOffsets:
+    """
+    Offsets of one assigned partition
+    Messages complete out of order across lanes; only the lowest contiguous
+    completed offset is reported as committable. A failed message is never
+    completed, so the watermark stops below it and it is consumed again
+    once the partition is reassigned
+    :param topic: Topic name
+    :type topic: str
+    :param partition: Partition number
+    :type partition: int
+    """
+
+    def __init__(self, topic: str, partition: int) -> None:
+        """
+        Constructor
+        """
+
+        self.topic = topic
+        self.partition = partition
+        self.revoked = False
+        self.failed = False
+
+        self.__condition: threading.Condition = threading.Condition()
+        self.__pending: Deque[int] = deque()
+        self.__completed: set = set()
+        self.__in_flight: int = 0
+        self.__committable: int = -1
+        self.__committed: int = -1
+
+    def dispatch(self, offset: int) -> None:
+        """
+        Register a message handed to a lane, in partition order
+        """
+
+        with self.__condition:
+            self.__pending.append(offset)
+
+    def start(self) -> bool:
+        """
+        Mark a message as being processed, unless the partition was revoked
+        or one of its messages failed
+        """
+
+        with self.__condition:
+            if self.revoked is True or self.failed is True:
+                return False
+
+            self.__in_flight += 1
+
+            return True
+
+    def complete(self, offset: int) -> None:
+        """
+        Mark a processed message and advance the contiguous watermark
+        """
+
+        with self.__condition:
+            self.__in_flight -= 1
+            self.__completed.add(offset)
+
+            while len(self.__pending) > 0 and self.__pending[0] in self.__completed:
+                self.__completed.discard(self.__pending[0])
+                self.__committable = self.__pending.popleft() + 1
+
+            self.__condition.notify_all()
+
+    def fail(self) -> None:
+        """
+        Mark a message that could not be processed; the watermark no longer
+        advances and the following messages of the partition are skipped
+        """
+
+        with self.__condition:
+            self.__in_flight -= 1
+            self.failed = True
+
+            self.__condition.notify_all()
+
+    def revoke(self, timeout: float) -> bool:
+        """
+        Stop processing queued messages and wait for the in-flight ones
+        :param timeout: Maximum time to wait, in seconds
+        :type timeout: float
+        """
+
+        with self.__condition:
+            self.revoked = True
+
+            return self.__condition.wait_for(
+                lambda: self.__in_flight == 0, timeout=timeout
+            )
+
+    def to_commit(self) -> Optional[TopicPartition]:
+        """
+        Return the offset to commit if the watermark moved since the last commit
+        """
+
+        with self.__condition:
+            if self.__committable <= self.__committed:
+                return None
+
+            return TopicPartition(self.topic, self.partition, self.__committable)
+
+    def committed(self, offset: int) -> None:
+        """
+        Record a committed offset
+        """
+
+        with self.__condition:
+            self.__committed = max(self.__committed, offset)
+
+
+class ProviderKafkaWorkerPool:
+    """
+    Dispatch consumed messages to a bounded pool of lanes
+    Messages with the same key always go to the same lane, one thread per lane,
+    so they are processed in order. Offsets are committed up to the lowest
+    contiguous completed offset of each partition; when a lane is full the
+    assigned partitions are paused until the lanes drain.
+    A message whose handler raises is handed to `on_failure` (e.g. a dead
+    letter producer) and completed once it returns. Without `on_failure`,
+    or when it raises too, the partition stops: its watermark is not
+    advanced past the failed message and it stays paused, so the message is
+    consumed again after the next rebalance or restart (at-least-once)
+    :param consumer: Kafka consumer
+    :type consumer: ProviderKafkaConsumer
+    :param environ_context: Context about the environment
+    :type environ_context: EnvironmentContext
+    :param handler: Processes a single message
+    :type handler: Callable[[Message], None]
+    :param key: Returns the ordering key of a message, defaults to the message key
+    :type key: Optional[Callable[[Message], Optional[bytes]]]
+    :param batch_size: Maximum number of messages consumed per poll
+    :type batch_size: int
+    :param poll_timeout: Maximum time to block waiting for messages
+    :type poll_timeout: float
+    :param on_failure: Called with a message and the handler error; must
+        succeed for the message to be committed
+    :type on_failure: Optional[Callable[[Message, Exception], None]]
+    """
+
+    def __init__(
+        self,
+        consumer: ProviderKafkaConsumer,
+        environ_context: EnvironmentContext,
+        handler: Callable[[Message], None],
+        key: Optional[Callable[[Message], Optional[bytes]]] = None,
+        batch_size: int = 500,
+        poll_timeout: float = 1.0,
+        on_failure: Optional[Callable[[Message, Exception], None]] = None,
+    ) -> None:
+        """
+        Constructor
+        """
+
+        self.__consumer = consumer
+        self.__handler = handler
+        self.__on_failure = on_failure
+        self.__key = key if key is not None else lambda message: message.key()
+        self.__batch_size = batch_size
+        self.__poll_timeout = poll_timeout
+
+        self.__lane_count: int = max(environ_context.kafka_worker_lanes, 1)
+        self.__lane_capacity: int = max(environ_context.kafka_worker_lane_capacity, 1)
+        self.__revoke_timeout: float = (
+            environ_context.kafka_worker_revoke_timeout_ms / 1000
+        )
+
+        self.__lanes: List[queue.Queue] = []
+        self.__threads: List[threading.Thread] = []
+        self.__partitions: Dict[Tuple[str, int], ProviderKafkaPartitionOffsets] = {}
+        self.__partitions_lock: threading.Lock = threading.Lock()
+        self.__backlog: Deque[Message] = deque()
+        self.__paused: bool = False
+        self.__stopping: threading.Event = threading.Event()
+
+        self.__stats_lock: threading.Lock = threading.Lock()
+        self.__processed: int = 0
+        self.__failed: int = 0
+        self.__dead_lettered: int = 0
+        self.__pauses: int = 0
+
+    def run(self, topics: List[str]) -> None:
+        """
+        Subscribe to the topics and process messages until stop() is called
+        :param topics: List of topic to subscribe to
+        :type topics: List[str]
+        """
+
+        self.__start_lanes()
+        self.__consumer.subscribe(
+            topics,
+            on_assign=self.__on_assign,
+            on_revoke=self.__on_revoke,
+            on_lost=self.__on_lost,
+        )
+
+        try:
+            while not self.__stopping.is_set():
+                self.__dispatch_backlog()
+
+                messages: List[Message] = self.__consumer.consume_batch(
+                    max_messages=self.__batch_size,
+                    timeout=self.__poll_timeout,
+                )
+
+                self.__backlog.extend(messages)
+                self.__dispatch_backlog()
+                self.__apply_backpressure()
+                self.__commit()
+        except Exception as exc:
+            LOGGER.logger.error(
+                f"Unexpected error when running Kafka worker pool: {str(exc)}"
+            )
+            raise exc
+        finally:
+            self.__shutdown()
+
+    def stop(self) -> None:
+        """
+        Ask the pool to finish the messages already dispatched and stop
+        """
+
+        self.__stopping.set()
+
+    def statistics(self) -> Dict[str, Union[int, bool]]:
+        """
+        Return a snapshot of the pool statistics
+        """
+
+        with self.__stats_lock:
+            return {
+                "lanes": self.__lane_count,
+                "queued": sum(lane.qsize() for lane in self.__lanes),
+                "backlog": len(self.__backlog),
+                "partitions": len(self.__partitions),
+                "paused": self.__paused,
+                "pauses": self.__pauses,
+                "processed": self.__processed,
+                "failed": self.__failed,
+                "dead_lettered": self.__dead_lettered,
+            }
+
+    def __start_lanes(self) -> None:
+        for index in range(self.__lane_count):
+            lane: queue.Queue = queue.Queue(maxsize=self.__lane_capacity)
+            thread: threading.Thread = threading.Thread(
+                target=self.__work,
+                args=(lane,),
+                name=f"ftl-kafka-worker-{index}",
+                daemon=True,
+            )
+            thread.start()
+
+            self.__lanes.append(lane)
+            self.__threads.append(thread)
+
+    def __work(self, lane: queue.Queue) -> None:
+        """
+        Process the messages of one lane in order
+        """
+
+        while True:
+            item: Optional[Tuple[ProviderKafkaPartitionOffsets, Message]] = lane.get()
+
+            if item is None:
+                lane.task_done()
+
+                return
+
+            offsets, message = item
+
+            try:
+                if offsets.start() is False:
+                    continue
+
+                if self.__process(message=message) is True:
+                    offsets.complete(message.offset())
+                else:
+                    offsets.fail()
+            finally:
+                lane.task_done()
+
+    def __process(self, message: Message) -> bool:
+        """
+        Run the handler, then `on_failure` if it raises
+        Return whether the message can be committed
+        """
+
+        try:
+            self.__handler(message)
+        except Exception as exc:
+            with self.__stats_lock:
+                self.__failed += 1
+
+            LOGGER.logger.error(
+                "Unexpected error when processing Kafka message at "
+                f"{message.topic()}[{message.partition()}]@{message.offset()}: "
+                f"{str(exc)}"
+            )
+
+            return self.__dead_letter(message=message, error=exc)
+
+        with self.__stats_lock:
+            self.__processed += 1
+
+        return True
+
+    def __dead_letter(self, message: Message, error: Exception) -> bool:
+        if self.__on_failure is None:
+            return False
+
+        try:
+            self.__on_failure(message, error)
+        except Exception as exc:
+            LOGGER.logger.error(
+                "Unexpected error when handing off failed Kafka message at "
+                f"{message.topic()}[{message.partition()}]@{message.offset()}: "
+                f"{str(exc)}"
+            )
+
+            return False
+
+        with self.__stats_lock:
+            self.__dead_lettered += 1
+
+        return True
+
+    def __get_lane(self, message: Message) -> queue.Queue:
+        key: Optional[Union[str, bytes]] = self.__key(message)
+
+        if key is None:
+            return self.__lanes[message.partition() % self.__lane_count]
+
+        if isinstance(key, str):
+            key = key.encode("utf-8")
+
+        return self.__lanes[zlib.crc32(key) % self.__lane_count]
+
+    def __dispatch_backlog(self) -> None:
+        """
+        Hand backlog messages to their lanes, stopping at the first full lane
+        so that messages of the same key keep their order
+        """
+
+        while len(self.__backlog) > 0:
+            message: Message = self.__backlog[0]
+
+            with self.__partitions_lock:
+                offsets: Optional[
+                    ProviderKafkaPartitionOffsets
+                ] = self.__partitions.get((message.topic(), message.partition()))
+
+            if offsets is None or offsets.revoked is True or offsets.failed is True:
+                # Partition is no longer ours or is stopped on a failed
+                # message, it will be consumed again from its watermark
+                self.__backlog.popleft()
+
+                continue
+
+            lane: queue.Queue = self.__get_lane(message)
+
+            if lane.full():
+                return
+
+            offsets.dispatch(message.offset())
+            lane.put_nowait((offsets, message))
+            self.__backlog.popleft()
+
+    def __apply_backpressure(self) -> None:
+        """
+        Pause the assigned partitions while messages wait for a full lane,
+        resume once every lane is at most half full; partitions stopped on a
+        failed message stay paused
+        """
+
+        with self.__partitions_lock:
+            failed: Set[Tuple[str, int]] = {
+                key for key, offsets in self.__partitions.items() if offsets.failed
+            }
+
+        if len(failed) > 0:
+            self.__consumer.pause(
+                [TopicPartition(topic, partition) for topic, partition in failed]
+            )
+
+        if len(self.__backlog) > 0:
+            # Pause again after each poll, partitions assigned meanwhile
+            # must not be fetched either
+            self.__consumer.pause(self.__consumer.assignment())
+
+            if self.__paused is False:
+                LOGGER.logger.debug("Kafka worker lanes are full. Pausing consumption")
+
+                with self.__stats_lock:
+                    self.__pauses += 1
+
+            self.__paused = True
+        elif self.__paused is True and all(
+            lane.qsize() <= self.__lane_capacity // 2 for lane in self.__lanes
+        ):
+            LOGGER.logger.debug("Kafka worker lanes drained. Resuming consumption")
+
+            self.__consumer.resume(
+                [
+                    partition
+                    for partition in self.__consumer.assignment()
+                    if (partition.topic, partition.partition) not in failed
+                ]
+            )
+            self.__paused = False
+
+    def __commit(
+        self,
+        offsets: Optional[List[ProviderKafkaPartitionOffsets]] = None,
+        mode: Optional[ConstantsKafkaCommitMode] = None,
+    ) -> None:
+        """
+        Commit the contiguous watermark of every partition that advanced
+        """
+
+        if offsets is None:
+            with self.__partitions_lock:
+                offsets = list(self.__partitions.values())
+
+        advanced: List[Tuple[ProviderKafkaPartitionOffsets, TopicPartition]] = [
+            (partition, topic_partition)
+            for partition in offsets
+            for topic_partition in (partition.to_commit(),)
+            if topic_partition is not None
+        ]
+
+        if len(advanced) == 0:
+            return
+
+        self.__consumer.commit_offsets(
+            offsets=[topic_partition for _, topic_partition in advanced], mode=mode
+        )
+
+        for partition, topic_partition in advanced:
+            partition.committed(topic_partition.offset)
+
+    def __on_assign(self, _: Consumer, partitions: List[TopicPartition]) -> None:
+        LOGGER.logger.debug(f"Kafka worker pool assigned {len(partitions)} partitions")
+
+        with self.__partitions_lock:
+            for partition in partitions:
+                self.__partitions[
+                    (partition.topic, partition.partition)
+                ] = ProviderKafkaPartitionOffsets(
+                    topic=partition.topic, partition=partition.partition
+                )
+
+    def __on_revoke(self, _: Consumer, partitions: List[TopicPartition]) -> None:
+        """
+        Drop queued messages of the revoked partitions, wait for the in-flight
+        ones and synchronously commit what was completed before giving them up
+        """
+
+        LOGGER.logger.debug(f"Kafka worker pool revoked {len(partitions)} partitions")
+
+        revoked: List[ProviderKafkaPartitionOffsets] = self.__release(
+            partitions=partitions
+        )
+
+        for offsets in revoked:
+            if offsets.revoke(timeout=self.__revoke_timeout) is False:
+                LOGGER.logger.warning(
+                    f"Kafka partition {offsets.topic}[{offsets.partition}] "
+                    "still has messages in flight after revocation"
+                )
+
+        try:
+            self.__commit(offsets=revoked, mode=ConstantsKafkaCommitMode.BATCH)
+        except Exception as exc:
+            LOGGER.logger.error(
+                f"Unexpected error when committing revoked Kafka partitions: {str(exc)}"
+            )
+
+    def __on_lost(self, _: Consumer, partitions: List[TopicPartition]) -> None:
+        """
+        Lost partitions may already belong to another member, nothing is committed
+        """
+
+        LOGGER.logger.warning(f"Kafka worker pool lost {len(partitions)} partitions")
+
+        for offsets in self.__release(partitions=partitions):
+            offsets.revoke(timeout=0)
+
+    def __release(
+        self, partitions: List[TopicPartition]
+    ) -> List[ProviderKafkaPartitionOffsets]:
+        """
+        Forget the partitions and drop their backlog messages, which would
+        otherwise be dispatched to the offsets of a later reassignment
+        Rebalance callbacks run on the consume thread, like __dispatch_backlog
+        """
+
+        released: Set[Tuple[str, int]] = {
+            (partition.topic, partition.partition) for partition in partitions
+        }
+        self.__backlog = deque(
+            message
+            for message in self.__backlog
+            if (message.topic(), message.partition()) not in released
+        )
+
+        with self.__partitions_lock:
+            return [
+                offsets
+                for offsets in (
+                    self.__partitions.pop((partition.topic, partition.partition), None)
+                    for partition in partitions
+                )
+                if offsets is not None
+            ]
+
+    def __shutdown(self) -> None:
+        """
+        Finish the dispatched messages, commit them and close the consumer
+        Backlog messages were never dispatched and are consumed again later
+        """
+
+        LOGGER.logger.debug("Stopping Kafka worker pool")
+
+        self.__backlog.clear()
+
+        for lane in self.__lanes:
+            lane.join()
+            lane.put(None)
+
+        for thread in self.__threads:
+            thread.join()
+
+        try:
+            self.__commit(mode=ConstantsKafkaCommitMode.BATCH)
+        finally:
+            self.__consumer.close()
@@ -1,15 +1,87 @@
 """Create database connection."""
+import os
+import threading
+import time
+from typing import Dict
+from typing import Union
+
 from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError  # pylint: disable=W0622
+from sqlalchemy.pool import QueuePool
 
 from ftl_python_lib.core.context.environment import EnvironmentContext
+from ftl_python_lib.core.log import LOGGER
 
 ENVIRON_CONTEXT: EnvironmentContext = EnvironmentContext()
 
+_ENGINES: Dict[str, Engine] = {}
+_ENGINES_LOCK: threading.Lock = threading.Lock()
+
+
+class MySqlPool(QueuePool):
+    """
+    QueuePool that keeps checkout, overflow and wait time statistics
+    """
+
+    def __init__(self, creator, **kwargs) -> None:
+        super().__init__(creator, **kwargs)
+
+        self.__stats_lock: threading.Lock = threading.Lock()
+        self.__checkouts: int = 0
+        self.__timeouts: int = 0
+        self.__overflow_peak: int = 0
+        self.__wait_time_total: float = 0.0
+        self.__wait_time_max: float = 0.0
+
+    def _do_get(self):
+        started_at: float = time.perf_counter()
+
+        try:
+            connection = super()._do_get()
+        except TimeoutError:
+            with self.__stats_lock:
+                self.__timeouts += 1
+            raise
+
+        waited: float = time.perf_counter() - started_at
+
+        with self.__stats_lock:
+            self.__checkouts += 1
+            self.__wait_time_total += waited
+            self.__wait_time_max = max(self.__wait_time_max, waited)
+            self.__overflow_peak = max(self.__overflow_peak, self.overflow())
+
+        return connection
+
+    def statistics(self) -> Dict[str, Union[int, float]]:
+        """
+        Return a snapshot of the pool usage statistics
+        """
+
+        with self.__stats_lock:
+            return {
+                "size": self.size(),
+                "checked_in": self.checkedin(),
+                "checked_out": self.checkedout(),
+                "overflow": self.overflow(),
+                "overflow_peak": self.__overflow_peak,
+                "checkouts": self.__checkouts,
+                "timeouts": self.__timeouts,
+                "wait_time_total": self.__wait_time_total,
+                "wait_time_max": self.__wait_time_max,
+                "wait_time_avg": (
+                    self.__wait_time_total / self.__checkouts
+                    if self.__checkouts > 0
+                    else 0.0
+                ),
+            }
+
 
 class MySqlEngine:
     """
     Engine
+    Engines are shared process-wide and keyed by connection string
     """
 
     @staticmethod
@@ -27,6 +99,77 @@ class MySqlEngine:
 
     @staticmethod
     def get_engine() -> Engine:
-        engine = create_engine(MySqlEngine.get_connection_string(), echo=True)
+        """
+        Return the pooled engine for the current connection string,
+        creating it on first use
+        """
+
+        connection_string: str = MySqlEngine.get_connection_string()
+        engine: Engine = _ENGINES.get(connection_string)
+
+        if engine is not None:
+            return engine
+
+        with _ENGINES_LOCK:
+            engine = _ENGINES.get(connection_string)
+
+            if engine is None:
+                engine = create_engine(
+                    connection_string,
+                    poolclass=MySqlPool,
+                    pool_size=ENVIRON_CONTEXT.ftl_db_pool_size,
+                    max_overflow=ENVIRON_CONTEXT.ftl_db_max_overflow,
+                    pool_timeout=ENVIRON_CONTEXT.ftl_db_pool_timeout,
+                    pool_recycle=ENVIRON_CONTEXT.ftl_db_pool_recycle,
+                    pool_pre_ping=ENVIRON_CONTEXT.ftl_db_pool_pre_ping,
+                    echo=ENVIRON_CONTEXT.ftl_db_echo,
+                )
+                _ENGINES[connection_string] = engine
+
+                LOGGER.logger.debug(
+                    f"Created pooled engine for {engine.url.render_as_string(hide_password=True)}"
+                )
 
         return engine
+
+    @staticmethod
+    def get_pool_statistics() -> Dict[str, Dict[str, Union[int, float]]]:
+        """
+        Return pool statistics for every registered engine,
+        keyed by connection string with the password hidden
+        """
+
+        return {
+            engine.url.render_as_string(hide_password=True): engine.pool.statistics()
+            for engine in list(_ENGINES.values())
+            if isinstance(engine.pool, MySqlPool)
+        }
+
+    @staticmethod
+    def dispose_all() -> None:
+        """
+        Close every pooled connection and drop all registered engines
+        """
+
+        with _ENGINES_LOCK:
+            for engine in _ENGINES.values():
+                engine.dispose()
+            _ENGINES.clear()
+
+    @staticmethod
+    def reset_after_fork() -> None:
+        """
+        Give a forked worker (gunicorn, uwsgi) fresh pools
+        without closing the connections still owned by the parent
+        """
+
+        global _ENGINES_LOCK  # pylint: disable=W0603
+
+        _ENGINES_LOCK = threading.Lock()
+
+        for engine in _ENGINES.values():
+            engine.dispose(close=False)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=MySqlEngine.reset_after_fork)
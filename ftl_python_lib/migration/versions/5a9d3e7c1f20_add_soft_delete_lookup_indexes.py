@@ -0,0 +1,133 @@
+"""add soft delete lookup indexes
+
+Revision ID: 5a9d3e7c1f20
+Revises: c4e1f7a9d2b3
+Create Date: 2026-10-18 13:24:41.506117
+
+"""
+from alembic import op
+
+from ftl_python_lib.models.sql.account import ModelAccount
+from ftl_python_lib.models.sql.config import ModelConfig
+from ftl_python_lib.models.sql.history_transaction import ModelHistoryTransaction
+from ftl_python_lib.models.sql.mapping import ModelMapping
+from ftl_python_lib.models.sql.member import ModelMember
+from ftl_python_lib.models.sql.message import ModelMessage
+from ftl_python_lib.models.sql.message_category import ModelMessageCategory
+from ftl_python_lib.models.sql.message_definition import ModelMessageDefinition
+from ftl_python_lib.models.sql.message_target import ModelMessageTarget
+from ftl_python_lib.models.sql.microservice import ModelMicroservice
+from ftl_python_lib.models.sql.provider import ModelProvider
+from ftl_python_lib.models.sql.provider_category import ModelProviderCategory
+from ftl_python_lib.models.sql.provider_subcategory import ModelProviderSubcategory
+from ftl_python_lib.models.sql.transaction import ModelTransaction
+from ftl_python_lib.models.sql.transaction_type import ModelTransactionType
+
+# revision identifiers, used by Alembic.
+revision = "5a9d3e7c1f20"
+down_revision = "c4e1f7a9d2b3"
+branch_labels = None
+depends_on = None
+
+# Helpers look rows up by reference_id / name among the not deleted ones
+# (`deleted_by IS NULL AND deleted_at IS NULL`); the plain `name` indexes
+# are replaced by their soft delete aware counterparts
+reference_id_tables = [
+    ModelAccount.__tablename__,
+    ModelConfig.__tablename__,
+    ModelMember.__tablename__,
+    ModelMessage.__tablename__,
+    ModelMessageCategory.__tablename__,
+    ModelMessageDefinition.__tablename__,
+    ModelMessageTarget.__tablename__,
+    ModelMicroservice.__tablename__,
+    ModelProvider.__tablename__,
+    ModelProviderCategory.__tablename__,
+    ModelProviderSubcategory.__tablename__,
+    ModelTransaction.__tablename__,
+    ModelTransactionType.__tablename__,
+]
+name_tables = [
+    ModelMessageCategory.__tablename__,
+    ModelMessageDefinition.__tablename__,
+    ModelMessageTarget.__tablename__,
+    ModelMicroservice.__tablename__,
+    ModelProvider.__tablename__,
+    ModelProviderCategory.__tablename__,
+    ModelProviderSubcategory.__tablename__,
+    ModelTransaction.__tablename__,
+    ModelTransactionType.__tablename__,
+]
+
+# The message (unique_type, version_*, deleted_at, deleted_by) lookup is
+# already served by the message unique constraint
+indexes = (
+    [
+        (table, table + "_idx_reference_id", ["reference_id", "deleted_at"])
+        for table in reference_id_tables
+    ]
+    + [(table, table + "_idx_name", ["name", "deleted_at"]) for table in name_tables]
+    + [
+        (
+            ModelMember.__tablename__,
+            ModelMember.__tablename__ + "_idx_auth_id",
+            ["auth_id", "deleted_at"],
+        ),
+        (
+            ModelMessage.__tablename__,
+            ModelMessage.__tablename__ + "_idx_category_id",
+            ["category_id", "deleted_at"],
+        ),
+        (
+            ModelMessageDefinition.__tablename__,
+            ModelMessageDefinition.__tablename__ + "_idx_message_id",
+            ["message_id", "deleted_at", "element_index"],
+        ),
+        (
+            ModelConfig.__tablename__,
+            ModelConfig.__tablename__ + "_idx_ref",
+            ["ref_table", "ref_key", "deleted_at", "var_key"],
+        ),
+        (
+            ModelProvider.__tablename__,
+            ModelProvider.__tablename__ + "_idx_category_id",
+            ["category_id", "deleted_at"],
+        ),
+        (
+            ModelProvider.__tablename__,
+            ModelProvider.__tablename__ + "_idx_subcategory_id",
+            ["subcategory_id", "deleted_at"],
+        ),
+        (
+            ModelHistoryTransaction.__tablename__,
+            ModelHistoryTransaction.__tablename__ + "_idx_status_requested_at",
+            ["status", "requested_at"],
+        ),
+        (
+            ModelHistoryTransaction.__tablename__,
+            ModelHistoryTransaction.__tablename__ + "_idx_requested_at",
+            ["requested_at"],
+        ),
+        (
+            ModelMapping.__tablename__,
+            ModelMapping.__tablename__ + "_idx_source",
+            ["source", "source_type", "message_type"],
+        ),
+    ]
+)
+
+
+def upgrade():
+    for table, name, columns in indexes:
+        op.create_index(name, table, columns, unique=False)
+
+    for table in name_tables:
+        op.drop_index("name", table_name=table)
+
+
+def downgrade():
+    for table in name_tables:
+        op.create_index("name", table, ["name"], unique=False)
+
+    for table, name, _ in reversed(indexes):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,56 @@
+"""add history transaction rollup table
+
+Revision ID: b8f2c6d4e071
+Revises: 5a9d3e7c1f20
+Create Date: 2026-10-18 13:41:12.730554
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+from ftl_python_lib.constants.models.history_transaction import ConstantsHistoryTransactionRollupBucketFormat
+from ftl_python_lib.constants.models.history_transaction import ConstantsHistoryTransactionRollupGranularity
+from ftl_python_lib.models.sql.history_transaction import ModelHistoryTransaction
+from ftl_python_lib.models.sql.history_transaction_rollup import ModelHistoryTransactionRollup
+
+# revision identifiers, used by Alembic.
+revision = "b8f2c6d4e071"
+down_revision = "5a9d3e7c1f20"
+branch_labels = None
+depends_on = None
+
+backfill = """
+    INSERT INTO __rollup__ (granularity, bucket_at, status, volume, amount)
+    SELECT '__granularity__', DATE_FORMAT(requested_at, '__format__'), status,
+        COUNT(id), COALESCE(SUM(amount), 0)
+    FROM __tablename__
+    WHERE deleted_by IS NULL AND deleted_at IS NULL
+    GROUP BY DATE_FORMAT(requested_at, '__format__'), status;
+"""
+
+
+def upgrade():
+    op.create_table(
+        ModelHistoryTransactionRollup.__tablename__,
+        sa.Column("granularity", sa.String(length=32), nullable=False),
+        sa.Column("bucket_at", sa.DateTime(), nullable=False),
+        sa.Column("status", sa.String(length=255), nullable=False),
+        sa.Column("volume", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("amount", sa.Float(), server_default="0", nullable=False),
+        sa.PrimaryKeyConstraint("granularity", "bucket_at", "status"),
+    )
+
+    for granularity in ConstantsHistoryTransactionRollupGranularity:
+        op.execute(
+            backfill.replace("__rollup__", ModelHistoryTransactionRollup.__tablename__)
+            .replace("__tablename__", ModelHistoryTransaction.__tablename__)
+            .replace("__granularity__", granularity.value)
+            .replace(
+                "__format__",
+                ConstantsHistoryTransactionRollupBucketFormat[granularity.name].value,
+            )
+        )
+
+
+def downgrade():
+    op.drop_table(ModelHistoryTransactionRollup.__tablename__)
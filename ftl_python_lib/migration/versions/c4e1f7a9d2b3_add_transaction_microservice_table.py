@@ -0,0 +1,84 @@
+"""add transaction microservice table
+
+Revision ID: c4e1f7a9d2b3
+Revises: 7d087cf0d65e
+Create Date: 2026-10-18 13:10:04.218734
+
+"""
+import json
+
+import sqlalchemy as sa
+from alembic import op
+
+from ftl_python_lib.models.sql.transaction import ModelTransaction
+from ftl_python_lib.models.sql.transaction_microservice import ModelTransactionMicroservice
+
+# revision identifiers, used by Alembic.
+revision = "c4e1f7a9d2b3"
+down_revision = "7d087cf0d65e"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        ModelTransactionMicroservice.__tablename__,
+        sa.Column("transaction_id", sa.CHAR(length=36), nullable=False),
+        sa.Column("microservice_id", sa.CHAR(length=36), nullable=False),
+        sa.Column("position", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "created_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False
+        ),
+        sa.PrimaryKeyConstraint("transaction_id", "microservice_id"),
+    )
+
+    op.create_foreign_key(
+        ModelTransactionMicroservice.__tablename__ + "_fk_transaction_id",
+        ModelTransactionMicroservice.__tablename__,
+        ModelTransaction.__tablename__,
+        ["transaction_id"],
+        ["id"],
+    )
+
+    op.create_index(
+        ModelTransactionMicroservice.__tablename__ + "_idx_microservice_id",
+        ModelTransactionMicroservice.__tablename__,
+        ["microservice_id", "transaction_id"],
+        unique=False,
+    )
+
+    transactions = op.get_bind().execute(
+        sa.text(
+            f"SELECT id, microservices FROM {ModelTransaction.__tablename__} "
+            + "WHERE microservices IS NOT NULL"
+        )
+    )
+
+    links = []
+    for transaction_id, microservices in transactions:
+        for position, microservice_id in enumerate(
+            dict.fromkeys(json.loads(microservices))
+        ):
+            links.append(
+                {
+                    "transaction_id": transaction_id,
+                    "microservice_id": microservice_id,
+                    "position": position,
+                }
+            )
+
+    if len(links) > 0:
+        op.bulk_insert(ModelTransactionMicroservice.__table__, links)
+
+
+def downgrade():
+    op.drop_constraint(
+        ModelTransactionMicroservice.__tablename__ + "_fk_transaction_id",
+        ModelTransactionMicroservice.__tablename__,
+        type_="foreignkey",
+    )
+    op.drop_index(
+        ModelTransactionMicroservice.__tablename__ + "_idx_microservice_id",
+        table_name=ModelTransactionMicroservice.__tablename__,
+    )
+    op.drop_table(ModelTransactionMicroservice.__tablename__)
@@ -0,0 +1,27 @@
+from sqlalchemy import Column
+from sqlalchemy import DateTime
+from sqlalchemy import Float
+from sqlalchemy import Integer
+from sqlalchemy import String
+
+from ftl_python_lib.utils.iterable_base import IterableBase
+
+
+class ModelHistoryTransactionRollup(IterableBase):
+    __tablename__ = "history_transaction_rollup"
+    granularity = Column(String(length=32), primary_key=True)
+    bucket_at = Column(DateTime, primary_key=True)
+    status = Column(String(length=255), primary_key=True)
+    volume = Column(Integer, nullable=False, default=0)
+    amount = Column(Float, nullable=False, default=0)
+
+    def __repr__(self):
+        return (
+            "{"
+            + f'"granularity": "{self.granularity}",'
+            + f'"bucket_at": "{self.bucket_at}",'
+            + f'"status": "{self.status}",'
+            + f'"volume": "{self.volume}",'
+            + f'"amount": "{self.amount}"'
+            + "}"
+        )
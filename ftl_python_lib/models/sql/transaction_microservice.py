@@ -0,0 +1,36 @@
+from sqlalchemy import CHAR
+from sqlalchemy import Column
+from sqlalchemy import DateTime
+from sqlalchemy import ForeignKey
+from sqlalchemy import Index
+from sqlalchemy import Integer
+from sqlalchemy import func
+
+from ftl_python_lib.utils.iterable_base import IterableBase
+
+
+class ModelTransactionMicroservice(IterableBase):
+    __tablename__ = "transaction_microservice"
+    __identifier__ = "ftl-mgr-transaction-microservice"
+    __table_args__ = (
+        Index(
+            "transaction_microservice_idx_microservice_id",
+            "microservice_id",
+            "transaction_id",
+        ),
+    )
+    transaction_id = Column(
+        CHAR(length=36), ForeignKey("transaction.id"), primary_key=True
+    )
+    microservice_id = Column(CHAR(length=36), primary_key=True)
+    position = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+
+    def __repr__(self):
+        return (
+            "{"
+            + f'"transaction_id": "{self.transaction_id}",'
+            + f'"microservice_id": "{self.microservice_id}",'
+            + f'"position": "{self.position}"'
+            + "}"
+        )
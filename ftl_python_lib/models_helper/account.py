@@ -30,8 +30,8 @@ class HelperAccount:
         self.__request_context = request_context
         self.__environ_context = environ_context
 
-        session = SessionContext()
-        self.__session = session.get_session()
+        self.__session_context = SessionContext(request_context=self.__request_context)
+        self.__session = self.__session_context.get_session()
 
     def _clone_account_object(self, search_result):
         account = ModelAccount(
@@ -175,23 +175,23 @@ class HelperAccount:
                     created_by=owner_member_id,
                 )
             )
-            self.__session.commit()
+            self.__session_context.commit()
 
             return self.get_by_id(new_id)
         except InvalidRequestError as exc:
-            self.__session.rollback()
+            self.__session_context.rollback()
             LOGGER.logger.error(exc)
             raise exc
         except IntegrityError as exc:
-            self.__session.rollback()
+            self.__session_context.rollback()
             LOGGER.logger.error(exc)
             raise exc
         except SQLAlchemyError as exc:
-            self.__session.rollback()
+            self.__session_context.rollback()
             LOGGER.logger.error(f"Unexpected error when creating account: {exc}")
             raise exc
         except Exception as exc:
-            self.__session.rollback()
+            self.__session_context.rollback()
             LOGGER.logger.error(f"Unexpected error when update account: {str(exc)}")
             raise exc
 
@@ -220,7 +220,7 @@ class HelperAccount:
             )
 
             self.__session.execute(stmt)
-            self.__session.commit()
+            self.__session_context.commit()
         except Exception as exc:
             LOGGER.logger.error(f"Unexpected error when delete a account: {str(exc)}")
             raise exc
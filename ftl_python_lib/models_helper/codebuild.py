@@ -26,8 +26,8 @@ class HelperCodeBuild:
         self.__request_context = request_context
         self.__environ_context = environ_context
 
-        session = SessionContext()
-        self.__session = session.get_session()
+        self.__session_context = SessionContext(request_context=self.__request_context)
+        self.__session = self.__session_context.get_session()
 
         self.__codebuild_docker_active: ProviderCodeBuild = ProviderCodeBuild(
             request_context=self.__request_context,
@@ -32,8 +32,8 @@ class HelperConfig:
         self.__request_context = request_context
         self.__environ_context = environ_context
 
-        session = SessionContext()
-        self.__session = session.get_session()
+        self.__session_context = SessionContext(request_context=self.__request_context)
+        self.__session = self.__session_context.get_session()
 
         self.__provider_secretsmanager: ProviderSecretsManager = ProviderSecretsManager(
             environ_context=self.__environ_context
@@ -306,22 +306,22 @@ class HelperConfig:
                     created_by=owner_member_id,
                 )
             )
-            self.__session.commit()
+            self.__session_context.commit()
             return self.get_by_id(new_id)
         except InvalidRequestError as exc:
-            self.__session.rollback()
+            self.__session_context.rollback()
             LOGGER.logger.error(exc)
             raise exc
         except IntegrityError as exc:
-            self.__session.rollback()
+            self.__session_context.rollback()
             LOGGER.logger.error(exc)
             raise exc
         except SQLAlchemyError as exc:
-            self.__session.rollback()
+            self.__session_context.rollback()
             LOGGER.logger.error(f"Unexpected error when creating config: {exc}")
             raise exc
         except Exception as exc:
-            self.__session.rollback()
+            self.__session_context.rollback()
             LOGGER.logger.error(f"Unexpected error when update config: {str(exc)}")
             raise exc
 
@@ -345,7 +345,7 @@ class HelperConfig:
             config_new.var_value = None
 
             self.__session.add(config_new)
-            self.__session.commit()
+            self.__session_context.commit()
             member = self.get_by_id(new_id)
 
             return member
@@ -381,7 +381,7 @@ class HelperConfig:
             )
             self._set_secretsmanager(self.get_by_reference_id(id), True)
             self.__session.execute(stmt)
-            self.__session.commit()
+            self.__session_context.commit()
         except Exception as exc:
             LOGGER.logger.error(f"Unexpected error when delete a config: {str(exc)}")
             raise exc
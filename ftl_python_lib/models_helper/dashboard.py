@@ -1,8 +1,13 @@
 """Create records related to one another via SQLAlchemy's ORM."""
 
+import copy
+
+from ftl_python_lib.constants.models.history_transaction import ConstantsHistoryTransactionRollupGranularity
 from ftl_python_lib.core.context.environment import EnvironmentContext
 from ftl_python_lib.core.context.request import RequestContext
 from ftl_python_lib.core.log import LOGGER
+from ftl_python_lib.models_helper.dashboard_cache import DASHBOARD_CACHE
+from ftl_python_lib.models_helper.dashboard_cache import DASHBOARD_STATIC_INFO
 from ftl_python_lib.models_helper.history_transaction import HelperHistoryTransaction
 from ftl_python_lib.models_helper.message import HelperMessage
 from ftl_python_lib.models_helper.microservice import HelperMicroservice
@@ -30,6 +35,11 @@ class HelperDashboard:
         )
 
     def get_static_info(self):
+        return copy.deepcopy(
+            DASHBOARD_CACHE.get(DASHBOARD_STATIC_INFO, self._load_static_info)
+        )
+
+    def _load_static_info(self):
         message_helper = HelperMessage(
             request_context=self.__request_context,
             environ_context=self.__environ_context,
@@ -45,8 +55,8 @@ class HelperDashboard:
 
         response = {
             "message": {
-                "total": len(message_helper.get_all()),
-                "filtered": len(message_helper.get_all_active()),
+                "total": message_helper.count(),
+                "filtered": message_helper.count_active(),
             },
             "transaction": {
                 "total": transaction_helper.count(),
@@ -82,22 +92,51 @@ class HelperDashboard:
         return response
 
     def get_dynamic_info(self, from_date: str, to_date: str):
-        transaction_volume_accepted = (
-            self.__history_transaction_helper.get_volume_accepted(from_date, to_date)
-        )
-        transaction_volume_rejected = (
-            self.__history_transaction_helper.get_volume_rejected(from_date, to_date)
+        series = self.__history_transaction_helper.get_rollup_series(
+            from_date,
+            to_date,
+            ConstantsHistoryTransactionRollupGranularity.HOUR
+            if from_date[0:10] == to_date[0:10]
+            else ConstantsHistoryTransactionRollupGranularity.DAY,
         )
+
+        transaction_volume_accepted = 0
+        transaction_volume_rejected = 0
+        transaction_currency_accepted = 0
+        transaction_currency_rejected = 0
+        volume_graph = []
+        currency_graph = []
+
+        for (
+            time_key,
+            volume_accepted,
+            volume_rejected,
+            amount_accepted,
+            amount_rejected,
+        ) in series:
+            transaction_volume_accepted += int(volume_accepted or 0)
+            transaction_volume_rejected += int(volume_rejected or 0)
+            transaction_currency_accepted += float(amount_accepted or 0)
+            transaction_currency_rejected += float(amount_rejected or 0)
+
+            volume_graph.append(
+                {
+                    "timeData": str(time_key),
+                    "accepted": int(volume_accepted or 0),
+                    "rejected": int(volume_rejected or 0),
+                }
+            )
+            currency_graph.append(
+                {
+                    "timeData": str(time_key),
+                    "accepted": float(amount_accepted or 0),
+                    "rejected": float(amount_rejected or 0),
+                }
+            )
+
         transaction_volume_total = (
             transaction_volume_accepted + transaction_volume_rejected
         )
-
-        transaction_currency_accepted = (
-            self.__history_transaction_helper.get_currency_accepted(from_date, to_date)
-        )
-        transaction_currency_rejected = (
-            self.__history_transaction_helper.get_currency_rejected(from_date, to_date)
-        )
         transaction_currency_total = (
             transaction_currency_accepted + transaction_currency_rejected
         )
@@ -128,7 +167,7 @@ class HelperDashboard:
                         if transaction_volume_total > 0
                         else 0
                     ),
-                    "graph": [],
+                    "graph": volume_graph,
                 },
                 "currency": {
                     "total": transaction_currency_total,
@@ -154,59 +193,9 @@ class HelperDashboard:
                         if transaction_currency_total > 0
                         else 0
                     ),
-                    "graph": [],
+                    "graph": currency_graph,
                 },
             },
         }
 
-        self._get_volume_graph(from_date, to_date, response)
-        self._get_currency_graph(from_date, to_date, response)
-
         return response
-
-    def _get_volume_graph(self, from_date, to_date, response):
-        filter_by_time = []
-        if from_date[0:10] == to_date[0:10]:
-            filter_by_time = self.__history_transaction_helper.get_volume_by_hour(
-                from_date, to_date
-            )
-        else:
-            filter_by_time = self.__history_transaction_helper.get_volume_by_day(
-                from_date, to_date
-            )
-
-        response["transaction"]["volume"]["graph"] = self._get_graph(filter_by_time)
-
-    def _get_currency_graph(self, from_date, to_date, response):
-        filter_by_time = []
-        if from_date[0:10] == to_date[0:10]:
-            filter_by_time = self.__history_transaction_helper.get_currency_by_hour(
-                from_date, to_date
-            )
-        else:
-            filter_by_time = self.__history_transaction_helper.get_currency_by_day(
-                from_date, to_date
-            )
-        response["transaction"]["currency"]["graph"] = self._get_graph(filter_by_time)
-
-    def _get_graph(self, filter_by_time):
-        graph_map = {}
-        for item in filter_by_time:
-            time_key = str(item[0])
-            status_key = "accepted" if item[1] == "RELEASED" else "rejected"
-            if time_key not in graph_map:
-                graph_map[time_key] = {}
-            if status_key not in graph_map[time_key]:
-                graph_map[time_key][status_key] = {}
-            graph_map[time_key][status_key] = item[2]
-
-        graph = []
-        for key, value in graph_map.items():
-            graph.append(
-                {
-                    "timeData": key,
-                    "accepted": value["accepted"] if "accepted" in value.keys() else 0,
-                    "rejected": value["rejected"] if "rejected" in value.keys() else 0,
-                }
-            )
-        return graph
@@ -0,0 +1,10 @@
+"""Process-wide cache for the dashboard snapshots."""
+
+from ftl_python_lib.core.context.environment import EnvironmentContext
+from ftl_python_lib.utils.ttl_cache import UtilsTtlCache
+
+DASHBOARD_STATIC_INFO: str = "static_info"
+
+DASHBOARD_CACHE: UtilsTtlCache = UtilsTtlCache(
+    ttl=EnvironmentContext().ftl_dashboard_cache_ttl
+)
@@ -5,18 +5,42 @@ import uuid
 
 from sqlalchemy import CHAR
 from sqlalchemy import and_
+from sqlalchemy import case
+from sqlalchemy import delete
 from sqlalchemy import func
+from sqlalchemy import insert
+from sqlalchemy import literal
+from sqlalchemy import or_
+from sqlalchemy import select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.sql.expression import cast
 
+from ftl_python_lib.constants.models.history_transaction import ConstantsHistoryTransactionRollupBucketFormat
+from ftl_python_lib.constants.models.history_transaction import ConstantsHistoryTransactionRollupGranularity
 from ftl_python_lib.constants.models.transaction import ConstantsTransactionStatus
 from ftl_python_lib.core.context.environment import EnvironmentContext
+from ftl_python_lib.core.context.headers import HeadersContext
 from ftl_python_lib.core.context.request import RequestContext
 from ftl_python_lib.core.context.session import SessionContext
 from ftl_python_lib.core.log import LOGGER
 from ftl_python_lib.models.sql.history_transaction import ModelHistoryTransaction
+from ftl_python_lib.models.sql.history_transaction_rollup import ModelHistoryTransactionRollup
 from ftl_python_lib.models.sql.response import ModelResponse
+from ftl_python_lib.models_helper.dashboard_cache import DASHBOARD_CACHE
+from ftl_python_lib.utils.timedate import UtilsDatetime
+
+
+def run_rebuild_rollups() -> None:
+    """
+    Rebuild the history transaction rollups, run as the rebuild_rollups script
+    """
+
+    HelperHistoryTransaction(
+        request_context=RequestContext(headers_context=HeadersContext(headers={})),
+        environ_context=EnvironmentContext(),
+    ).rebuild_rollups()
 
 
 class HelperHistoryTransaction:
@@ -32,8 +56,8 @@ class HelperHistoryTransaction:
         self.__request_context = request_context
         self.__environ_context = environ_context
 
-        session = SessionContext()
-        self.__session = session.get_session()
+        self.__session_context = SessionContext(request_context=self.__request_context)
+        self.__session = self.__session_context.get_session()
 
     def create(
         self, history_transaction_new: ModelHistoryTransaction, owner_member_id: str
@@ -45,9 +69,13 @@ class HelperHistoryTransaction:
         try:
             history_transaction_new.id = str(uuid.uuid4())
             history_transaction_new.created_by = owner_member_id
+            history_transaction_new.requested_at = UtilsDatetime(
+                from_source=history_transaction_new.requested_at
+            ).now.naive()
 
             self.__session.add(history_transaction_new)
-            self.__session.commit()
+            self._add_to_rollups(history_transaction_new)
+            self.__session_context.commit(on_commit=DASHBOARD_CACHE.invalidate)
 
             return history_transaction_new
         except IntegrityError as exc:
@@ -59,6 +87,207 @@ class HelperHistoryTransaction:
             )
             raise exc
 
+    def _add_to_rollups(self, history_transaction: ModelHistoryTransaction) -> None:
+        """
+        Increment the hourly and daily rollup buckets of a new HistoryTransaction.
+        Buckets are cut from the naive requested_at that is persisted, the same
+        value rebuild_rollups buckets with DATE_FORMAT
+        """
+
+        requested_at = history_transaction.requested_at
+
+        try:
+            amount: float = (
+                float(history_transaction.amount)
+                if history_transaction.amount is not None
+                else 0.0
+            )
+        except ValueError:
+            LOGGER.logger.warning(
+                f"Amount {history_transaction.amount} is not a number, rolled up as 0"
+            )
+            amount = 0.0
+
+        rollup_table = ModelHistoryTransactionRollup.__table__
+
+        for granularity in ConstantsHistoryTransactionRollupGranularity:
+            stmt = mysql_insert(rollup_table).values(
+                granularity=granularity.value,
+                bucket_at=requested_at.start_of(granularity.value),
+                status=history_transaction.status,
+                volume=1,
+                amount=amount,
+            )
+            stmt = stmt.on_duplicate_key_update(
+                volume=rollup_table.c.volume + stmt.inserted.volume,
+                amount=rollup_table.c.amount + stmt.inserted.amount,
+            )
+
+            self.__session.execute(stmt)
+
+    def rebuild_rollups(self) -> None:
+        """
+        Rebuild every rollup bucket from the history_transaction table
+        """
+
+        rollup_table = ModelHistoryTransactionRollup.__table__
+
+        try:
+            self.__session.execute(delete(rollup_table))
+
+            for granularity in ConstantsHistoryTransactionRollupGranularity:
+                bucket_at = func.date_format(
+                    ModelHistoryTransaction.requested_at,
+                    ConstantsHistoryTransactionRollupBucketFormat[
+                        granularity.name
+                    ].value,
+                )
+
+                self.__session.execute(
+                    insert(rollup_table).from_select(
+                        ["granularity", "bucket_at", "status", "volume", "amount"],
+                        select(
+                            literal(granularity.value),
+                            bucket_at,
+                            ModelHistoryTransaction.status,
+                            func.count(ModelHistoryTransaction.id),
+                            func.coalesce(func.sum(ModelHistoryTransaction.amount), 0),
+                        )
+                        .where(
+                            and_(
+                                ModelHistoryTransaction.deleted_by.is_(None),
+                                ModelHistoryTransaction.deleted_at.is_(None),
+                            )
+                        )
+                        .group_by(bucket_at, ModelHistoryTransaction.status),
+                    )
+                )
+
+            self.__session_context.commit()
+        except SQLAlchemyError as exc:
+            self.__session_context.rollback()
+            LOGGER.logger.error(
+                f"Unexpected error when rebuilding history transaction rollups: {exc}"
+            )
+            raise exc
+
+    def _query_rollups(
+        self,
+        granularity: ConstantsHistoryTransactionRollupGranularity,
+        from_date: str,
+        to_date: str,
+        *columns,
+    ):
+        """
+        Query the rollup buckets covering [from_date, to_date]. Day buckets
+        are only read for the days the range covers whole, the partial days
+        at either edge are read from their hour buckets instead.
+        """
+
+        hour = ConstantsHistoryTransactionRollupGranularity.HOUR
+        day = ConstantsHistoryTransactionRollupGranularity.DAY
+        from_at = UtilsDatetime(from_source=from_date).now.naive()
+        to_at = UtilsDatetime(from_source=to_date).now.naive()
+
+        buckets = and_(
+            ModelHistoryTransactionRollup.granularity == hour.value,
+            ModelHistoryTransactionRollup.bucket_at >= from_at.start_of(hour.value),
+            ModelHistoryTransactionRollup.bucket_at <= to_at,
+        )
+
+        if granularity == day:
+            first_day = from_at.start_of(day.value)
+            if first_day < from_at:
+                first_day = first_day.add(days=1)
+            after_last_day = to_at.start_of(day.value)
+            if to_at >= to_at.end_of(day.value).replace(microsecond=0):
+                after_last_day = after_last_day.add(days=1)
+
+            buckets = or_(
+                and_(
+                    ModelHistoryTransactionRollup.granularity == day.value,
+                    ModelHistoryTransactionRollup.bucket_at >= first_day,
+                    ModelHistoryTransactionRollup.bucket_at < after_last_day,
+                ),
+                and_(
+                    buckets,
+                    or_(
+                        ModelHistoryTransactionRollup.bucket_at < first_day,
+                        ModelHistoryTransactionRollup.bucket_at >= after_last_day,
+                    ),
+                ),
+            )
+
+        return self.__session.query(*columns).filter(
+            and_(
+                ModelHistoryTransactionRollup.status.in_(
+                    [
+                        ConstantsTransactionStatus.RELEASED.value,
+                        ConstantsTransactionStatus.REJECTED.value,
+                    ]
+                ),
+                buckets,
+            )
+        )
+
+    def get_rollup_series(
+        self,
+        from_date: str,
+        to_date: str,
+        granularity: ConstantsHistoryTransactionRollupGranularity,
+    ):
+        """
+        Retrive accepted and rejected volume and amount per bucket label
+        (hour of day or day of month) in a single conditional aggregation.
+
+        :return: Session
+        """
+
+        try:
+            label = func.date_format(
+                ModelHistoryTransactionRollup.bucket_at,
+                "%H"
+                if granularity == ConstantsHistoryTransactionRollupGranularity.HOUR
+                else "%d",
+            )
+            accepted = (
+                ModelHistoryTransactionRollup.status
+                == ConstantsTransactionStatus.RELEASED.value
+            )
+            rejected = (
+                ModelHistoryTransactionRollup.status
+                == ConstantsTransactionStatus.REJECTED.value
+            )
+
+            return (
+                self._query_rollups(
+                    granularity,
+                    from_date,
+                    to_date,
+                    label,
+                    func.sum(
+                        case((accepted, ModelHistoryTransactionRollup.volume), else_=0)
+                    ),
+                    func.sum(
+                        case((rejected, ModelHistoryTransactionRollup.volume), else_=0)
+                    ),
+                    func.sum(
+                        case((accepted, ModelHistoryTransactionRollup.amount), else_=0)
+                    ),
+                    func.sum(
+                        case((rejected, ModelHistoryTransactionRollup.amount), else_=0)
+                    ),
+                )
+                .group_by(label)
+                .order_by(label)
+                .all()
+            )
+        except Exception as exc:
+            LOGGER.logger.error(
+                f"Unexpected error when get rollup series by date: {str(exc)}"
+            )
+            raise exc
+
     def get_last_execution(self):
         """
         Retrive last 10 execution.
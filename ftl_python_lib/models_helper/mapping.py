@@ -22,8 +22,8 @@ class HelperMapping:
         self.__request_context = request_context
         self.__environ_context = environ_context
 
-        session = SessionContext()
-        self.__session = session.get_session()
+        self.__session_context = SessionContext(request_context=self.__request_context)
+        self.__session = self.__session_context.get_session()
 
     def _clone_mapping_object(self, search_result):
         if search_result is None:
@@ -2,6 +2,9 @@
 
 import uuid
 from types import NoneType
+from typing import Iterator
+from typing import List
+from typing import Optional
 
 from sqlalchemy import and_
 from sqlalchemy import func
@@ -15,6 +18,7 @@ from ftl_python_lib.core.context.session import SessionContext
 from ftl_python_lib.core.log import LOGGER
 from ftl_python_lib.core.providers.aws.cognito import ProviderCognito
 from ftl_python_lib.models.sql.member import ModelMember
+from ftl_python_lib.utils.keyset_pagination import UtilsKeysetPagination
 
 
 class HelperMember:
@@ -30,8 +34,8 @@ class HelperMember:
         self.__request_context = request_context
         self.__environ_context = environ_context
 
-        session = SessionContext()
-        self.__session = session.get_session()
+        self.__session_context = SessionContext(request_context=self.__request_context)
+        self.__session = self.__session_context.get_session()
         self.__cognito = ProviderCognito(
             request_context=self.__request_context,
             environ_context=self.__environ_context,
@@ -140,6 +144,37 @@ class HelperMember:
             LOGGER.logger.error(f"Unexpected error when get all members: {str(exc)}")
             raise exc
 
+    def get_page(
+        self, after: Optional[str] = None, limit: int = 100
+    ) -> List[ModelMember]:
+        """
+        Retrive a page of records ordered by reference_id, starting after `after`.
+
+        :return: List[ModelMember]
+        """
+
+        return list(
+            UtilsKeysetPagination.paginate(
+                self.__session.query(ModelMember),
+                ModelMember.reference_id,
+                after=after,
+                limit=limit,
+            )
+        )
+
+    def iter_all(self, batch_size: int = 500) -> Iterator[ModelMember]:
+        """
+        Iterate over all records in reference_id order, batch by batch.
+
+        :return: Iterator[ModelMember]
+        """
+
+        return UtilsKeysetPagination.paginate(
+            self.__session.query(ModelMember),
+            ModelMember.reference_id,
+            batch_size=batch_size,
+        )
+
     def update(self, member_update: ModelMember, owner_member_id: str) -> ModelMember:
         """
         Update record.
@@ -164,11 +199,11 @@ class HelperMember:
                     created_by=owner_member_id,
                 )
             )
-            self.__session.commit()
+            self.__session_context.commit()
 
             return self.get_by_id(new_id)
         except Exception as exc:
-            self.__session.rollback()
+            self.__session_context.rollback()
             LOGGER.logger.error(f"Unexpected error when update member: {str(exc)}")
             raise exc
 
@@ -192,7 +227,7 @@ class HelperMember:
             member_new.created_by = owner_member_id
 
             self.__session.add(member_new)
-            self.__session.commit()
+            self.__session_context.commit()
 
             member = self.get_by_id(new_id)
 
@@ -226,7 +261,7 @@ class HelperMember:
             )
 
             self.__session.execute(stmt)
-            self.__session.commit()
+            self.__session_context.commit()
         except Exception as exc:
             LOGGER.logger.error(f"Unexpected error when delete a member: {str(exc)}")
             raise exc
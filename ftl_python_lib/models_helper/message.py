@@ -2,15 +2,21 @@
 
 import os
 import uuid
+from typing import Iterator
+from typing import List
+from typing import Optional
 
 from sqlalchemy import and_
 from sqlalchemy import asc
 from sqlalchemy import desc
+from sqlalchemy import exists
 from sqlalchemy import func
+from sqlalchemy import tuple_
 from sqlalchemy import update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import aliased
 
 from ftl_python_lib.core.context.environment import EnvironmentContext
 from ftl_python_lib.core.context.headers import HeadersContext
@@ -19,8 +25,10 @@ from ftl_python_lib.core.context.session import SessionContext
 from ftl_python_lib.core.log import LOGGER
 from ftl_python_lib.core.providers.aws.s3 import ProviderS3
 from ftl_python_lib.models.sql.message import ModelMessage
+from ftl_python_lib.models_helper.dashboard_cache import DASHBOARD_CACHE
 from ftl_python_lib.models_helper.message_definition import HelperMessageDefinition
 from ftl_python_lib.typings.providers.aws.s3object import TypeS3Object
+from ftl_python_lib.utils.keyset_pagination import UtilsKeysetPagination
 
 
 class HelperMessage:
@@ -36,8 +44,8 @@ class HelperMessage:
         self.__request_context = request_context
         self.__environ_context = environ_context
 
-        session = SessionContext()
-        self.__session = session.get_session()
+        self.__session_context = SessionContext(request_context=self.__request_context)
+        self.__session = self.__session_context.get_session()
         self.__provider_s3: ProviderS3 = ProviderS3(
             request_context=self.__request_context,
             environ_context=self.__environ_context,
@@ -239,6 +247,70 @@ class HelperMessage:
             LOGGER.logger.error(f"Unexpected error when get all message: {str(exc)}")
             raise exc
 
+    def _query_latest_versions(self):
+        """
+        Query the one record get_all keeps per unique_key: the first one in
+        unique_type, version_major ascending, version_minor and version_patch
+        descending order, ties broken by reference_id.
+        """
+
+        other = aliased(ModelMessage)
+
+        return self.__session.query(ModelMessage).filter(
+            ~exists().where(
+                and_(
+                    other.unique_key == ModelMessage.unique_key,
+                    other.deleted_by.is_(None),
+                    other.deleted_at.is_(None),
+                    tuple_(
+                        other.unique_type,
+                        other.version_major,
+                        ModelMessage.version_minor,
+                        ModelMessage.version_patch,
+                        other.reference_id,
+                    )
+                    < tuple_(
+                        ModelMessage.unique_type,
+                        ModelMessage.version_major,
+                        other.version_minor,
+                        other.version_patch,
+                        ModelMessage.reference_id,
+                    ),
+                )
+            )
+        )
+
+    def get_page(
+        self, after: Optional[str] = None, limit: int = 100
+    ) -> List[ModelMessage]:
+        """
+        Retrive a page of records ordered by reference_id, starting after `after`.
+
+        :return: List[ModelMessage]
+        """
+
+        return list(
+            UtilsKeysetPagination.paginate(
+                self._query_latest_versions(),
+                ModelMessage.reference_id,
+                after=after,
+                limit=limit,
+            )
+        )
+
+    def iter_all(self, batch_size: int = 500) -> Iterator[ModelMessage]:
+        """
+        Iterate over all records in reference_id order, batch by batch.
+
+        :return: Iterator[ModelMessage]
+        """
+
+        return UtilsKeysetPagination.paginate(
+            self._query_latest_versions(),
+            ModelMessage.reference_id,
+            batch_size=batch_size,
+        )
+
     def get_all_active(self):
         """
         Retrive all active records.
@@ -277,6 +349,57 @@ class HelperMessage:
             )
             raise exc
 
+    def count(self):
+        """
+        Retrive count of all distinct message keys.
+
+        :return: Session
+        """
+
+        try:
+            return (
+                self.__session.query(func.count(func.distinct(ModelMessage.unique_key)))
+                .filter(
+                    and_(
+                        ModelMessage.deleted_by.is_(None),
+                        ModelMessage.deleted_at.is_(None),
+                    )
+                )
+                .scalar()
+                or 0
+            )
+        except Exception as exc:
+            LOGGER.logger.error(
+                f"Unexpected error when get count all message: {str(exc)}"
+            )
+            raise exc
+
+    def count_active(self):
+        """
+        Retrive count of all active distinct message keys.
+
+        :return: Session
+        """
+
+        try:
+            return (
+                self.__session.query(func.count(func.distinct(ModelMessage.unique_key)))
+                .filter(
+                    and_(
+                        ModelMessage.active.is_(True),
+                        ModelMessage.deleted_by.is_(None),
+                        ModelMessage.deleted_at.is_(None),
+                    )
+                )
+                .scalar()
+                or 0
+            )
+        except Exception as exc:
+            LOGGER.logger.error(
+                f"Unexpected error when get count all active message: {str(exc)}"
+            )
+            raise exc
+
     def get_all_unique_keys(self):
         """
         Retrive all records.
@@ -337,7 +460,7 @@ class HelperMessage:
                     created_by=owner_member_id,
                 )
             )
-            self.__session.commit()
+            self.__session_context.commit(on_commit=DASHBOARD_CACHE.invalidate)
 
             message = self.get_by_id(new_id)
 
@@ -355,19 +478,19 @@ class HelperMessage:
 
             return message
         except InvalidRequestError as exc:
-            self.__session.rollback()
+            self.__session_context.rollback()
             LOGGER.logger.error(exc)
             raise exc
         except IntegrityError as exc:
-            self.__session.rollback()
+            self.__session_context.rollback()
             LOGGER.logger.error(exc)
             raise exc
         except SQLAlchemyError as exc:
-            self.__session.rollback()
+            self.__session_context.rollback()
             LOGGER.logger.error(f"Unexpected error when creating message: {exc}")
             raise exc
         except Exception as exc:
-            self.__session.rollback()
+            self.__session_context.rollback()
             LOGGER.logger.error(f"Unexpected error when update message: {str(exc)}")
             raise exc
 
@@ -399,7 +522,7 @@ class HelperMessage:
             )
 
             self.__session.add(message_new)
-            self.__session.commit()
+            self.__session_context.commit(on_commit=DASHBOARD_CACHE.invalidate)
 
             message = self.get_by_id(new_id)
 
@@ -451,7 +574,7 @@ class HelperMessage:
             )
 
             self.__session.execute(stmt)
-            self.__session.commit()
+            self.__session_context.commit(on_commit=DASHBOARD_CACHE.invalidate)
         except Exception as exc:
             LOGGER.logger.error(f"Unexpected error when delete a message: {str(exc)}")
             raise exc
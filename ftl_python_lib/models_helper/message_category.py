@@ -1,6 +1,9 @@
 """Create records related to one another via SQLAlchemy's ORM."""
 
 import uuid
+from typing import Iterator
+from typing import List
+from typing import Optional
 
 from sqlalchemy import and_
 from sqlalchemy import asc
@@ -15,6 +18,7 @@ from ftl_python_lib.core.context.request import RequestContext
 from ftl_python_lib.core.context.session import SessionContext
 from ftl_python_lib.core.log import LOGGER
 from ftl_python_lib.models.sql.message_category import ModelMessageCategory
+from ftl_python_lib.utils.keyset_pagination import UtilsKeysetPagination
 
 
 class HelperMessageCategory:
@@ -30,8 +34,8 @@ class HelperMessageCategory:
         self.__request_context = request_context
         self.__environ_context = environ_context
 
-        session = SessionContext()
-        self.__session = session.get_session()
+        self.__session_context = SessionContext(request_context=self.__request_context)
+        self.__session = self.__session_context.get_session()
 
     def _clone_message_category_object(self, search_result):
         message_category = ModelMessageCategory(
@@ -155,6 +159,37 @@ class HelperMessageCategory:
             )
             raise exc
 
+    def get_page(
+        self, after: Optional[str] = None, limit: int = 100
+    ) -> List[ModelMessageCategory]:
+        """
+        Retrive a page of records ordered by reference_id, starting after `after`.
+
+        :return: List[ModelMessageCategory]
+        """
+
+        return list(
+            UtilsKeysetPagination.paginate(
+                self.__session.query(ModelMessageCategory),
+                ModelMessageCategory.reference_id,
+                after=after,
+                limit=limit,
+            )
+        )
+
+    def iter_all(self, batch_size: int = 500) -> Iterator[ModelMessageCategory]:
+        """
+        Iterate over all records in reference_id order, batch by batch.
+
+        :return: Iterator[ModelMessageCategory]
+        """
+
+        return UtilsKeysetPagination.paginate(
+            self.__session.query(ModelMessageCategory),
+            ModelMessageCategory.reference_id,
+            batch_size=batch_size,
+        )
+
     def update(
         self, message_category_update: ModelMessageCategory, owner_member_id: str
     ) -> ModelMessageCategory:
@@ -176,25 +211,25 @@ class HelperMessageCategory:
                     created_by=owner_member_id,
                 )
             )
-            self.__session.commit()
+            self.__session_context.commit()
 
             return self.get_by_id(new_id)
         except InvalidRequestError as exc:
-            self.__session.rollback()
+            self.__session_context.rollback()
             LOGGER.logger.error(exc)
             raise exc
         except IntegrityError as exc:
-            self.__session.rollback()
+            self.__session_context.rollback()
             LOGGER.logger.error(exc)
             raise exc
         except SQLAlchemyError as exc:
-            self.__session.rollback()
+            self.__session_context.rollback()
             LOGGER.logger.error(
                 f"Unexpected error when creating message_category: {exc}"
             )
             raise exc
         except Exception as exc:
-            self.__session.rollback()
+            self.__session_context.rollback()
             LOGGER.logger.error(
                 f"Unexpected error when update message_category: {str(exc)}"
             )
@@ -220,7 +255,7 @@ class HelperMessageCategory:
             message_category_new.created_by = owner_member_id
 
             self.__session.add(message_category_new)
-            self.__session.commit()
+            self.__session_context.commit()
 
             member = self.get_by_id(new_id)
 
@@ -259,7 +294,7 @@ class HelperMessageCategory:
             )
 
             self.__session.execute(stmt)
-            self.__session.commit()
+            self.__session_context.commit()
         except Exception as exc:
             LOGGER.logger.error(
                 f"Unexpected error when delete a message_category: {str(exc)}"
@@ -1,11 +1,17 @@
 """Create records related to one another via SQLAlchemy's ORM."""
 
 import uuid
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
 
-from bs4 import BeautifulSoup
 from sqlalchemy import and_
 from sqlalchemy import asc
 from sqlalchemy import func
+from sqlalchemy import insert
 from sqlalchemy import update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.exc import InvalidRequestError
@@ -16,7 +22,10 @@ from ftl_python_lib.core.context.request import RequestContext
 from ftl_python_lib.core.context.session import SessionContext
 from ftl_python_lib.core.log import LOGGER
 from ftl_python_lib.models.sql.message_definition import ModelMessageDefinition
-from ftl_python_lib.utils.to_str import bytes_to_str
+from ftl_python_lib.utils.keyset_pagination import UtilsKeysetPagination
+from ftl_python_lib.utils.xml.parser import UtilsXmlParser
+
+XSD_NAMESPACE: str = "{http://www.w3.org/2001/XMLSchema}"
 
 
 class HelperMessageDefinition:
@@ -32,8 +41,8 @@ class HelperMessageDefinition:
         self.__request_context = request_context
         self.__environ_context = environ_context
 
-        session = SessionContext()
-        self.__session = session.get_session()
+        self.__session_context = SessionContext(request_context=self.__request_context)
+        self.__session = self.__session_context.get_session()
 
     def _clone_message_definition_object(self, search_result):
         message_definition = ModelMessageDefinition(
@@ -189,6 +198,37 @@ class HelperMessageDefinition:
             )
             raise exc
 
+    def get_page(
+        self, after: Optional[str] = None, limit: int = 100
+    ) -> List[ModelMessageDefinition]:
+        """
+        Retrive a page of records ordered by reference_id, starting after `after`.
+
+        :return: List[ModelMessageDefinition]
+        """
+
+        return list(
+            UtilsKeysetPagination.paginate(
+                self.__session.query(ModelMessageDefinition),
+                ModelMessageDefinition.reference_id,
+                after=after,
+                limit=limit,
+            )
+        )
+
+    def iter_all(self, batch_size: int = 500) -> Iterator[ModelMessageDefinition]:
+        """
+        Iterate over all records in reference_id order, batch by batch.
+
+        :return: Iterator[ModelMessageDefinition]
+        """
+
+        return UtilsKeysetPagination.paginate(
+            self.__session.query(ModelMessageDefinition),
+            ModelMessageDefinition.reference_id,
+            batch_size=batch_size,
+        )
+
     def update(
         self, message_definition_update: ModelMessageDefinition, owner_member_id: str
     ) -> ModelMessageDefinition:
@@ -221,25 +261,25 @@ class HelperMessageDefinition:
                     created_by=owner_member_id,
                 )
             )
-            self.__session.commit()
+            self.__session_context.commit()
 
             return self.get_by_id(new_id)
         except InvalidRequestError as exc:
-            self.__session.rollback()
+            self.__session_context.rollback()
             LOGGER.logger.error(exc)
             raise exc
         except IntegrityError as exc:
-            self.__session.rollback()
+            self.__session_context.rollback()
             LOGGER.logger.error(exc)
             raise exc
         except SQLAlchemyError as exc:
-            self.__session.rollback()
+            self.__session_context.rollback()
             LOGGER.logger.error(
                 f"Unexpected error when creating message_definition: {exc}"
             )
             raise exc
         except Exception as exc:
-            self.__session.rollback()
+            self.__session_context.rollback()
             LOGGER.logger.error(
                 f"Unexpected error when update message_definition: {str(exc)}"
             )
@@ -265,7 +305,7 @@ class HelperMessageDefinition:
             message_definition_new.created_by = owner_member_id
 
             self.__session.add(message_definition_new)
-            self.__session.commit()
+            self.__session_context.commit()
 
             member = self.get_by_id(new_id)
 
@@ -294,34 +334,42 @@ class HelperMessageDefinition:
         """
 
         try:
-            soup = BeautifulSoup(bytes_to_str(src=content), "xml")
+            schema = UtilsXmlParser.fromstring(src=content)
 
             LOGGER.logger.debug("[INFO] Message definitions are beeing generated")
-            message_definition = []
-            tree = self._get_tree(soup)
-            element_index = 0
-            for item in tree:
-                message_definition.append(
-                    ModelMessageDefinition(
-                        id=item["id"],
-                        message_id=reference_id,
-                        xsd_tag=item["xsd_tag"],
-                        name=item["name"],
-                        type=item["type"],
-                        annotation_name=item["annotation_name"],
-                        annotation_definition=item["annotation_definition"],
-                        parent_id=item["parent_id"],
-                        level=item["level"],
-                        is_leaf=item["is_leaf"],
-                        target_column=item["target_column"],
-                        target_type=item["target_type"],
-                        element_index=element_index,
-                        created_by=owner_member_id,
-                    )
+            rows = [
+                {
+                    "id": item["id"],
+                    "message_id": reference_id,
+                    "xsd_tag": item["xsd_tag"],
+                    "name": item["name"],
+                    "type": item["type"],
+                    "annotation_name": item["annotation_name"],
+                    "annotation_definition": item["annotation_definition"],
+                    "parent_id": item["parent_id"],
+                    "level": item["level"],
+                    "is_leaf": item["is_leaf"],
+                    "target_column": item["target_column"],
+                    "target_type": item["target_type"],
+                    "element_index": element_index,
+                    "created_by": owner_member_id,
+                }
+                for element_index, item in enumerate(self._get_tree(schema))
+            ]
+
+            # Core executemany in chunks, bypassing the ORM unit of work
+            # and the IterableBase attribute bookkeeping per element
+            chunk_size: int = self.__environ_context.ftl_db_bulk_insert_chunk_size
+            for start in range(0, len(rows), chunk_size):
+                self.__session.execute(
+                    insert(ModelMessageDefinition.__table__),
+                    rows[start : start + chunk_size],
                 )
-                element_index = element_index + 1
-            self.__session.add_all(message_definition)
-            self.__session.commit()
+            self.__session_context.commit()
+
+            LOGGER.logger.debug(
+                f"[INFO] {len(rows)} message definitions inserted in chunks of {chunk_size}"
+            )
         except IntegrityError as exc:
             LOGGER.logger.error(exc)
             raise exc
@@ -356,7 +404,7 @@ class HelperMessageDefinition:
             )
 
             self.__session.execute(stmt)
-            self.__session.commit()
+            self.__session_context.commit()
         except Exception as exc:
             LOGGER.logger.error(
                 f"Unexpected error when delete a message_definition: {str(exc)}"
@@ -388,78 +436,120 @@ class HelperMessageDefinition:
             )
 
             self.__session.execute(stmt)
-            self.__session.commit()
+            self.__session_context.commit()
         except Exception as exc:
             LOGGER.logger.error(
                 f"Unexpected error when delete a message_definition: {str(exc)}"
             )
             raise exc
 
+    def _index_schema(
+        self, schema
+    ) -> Tuple[Dict[Tuple[str, str], Any], Dict[str, Any]]:
+        """
+        Index the schema once: (name, type) -> xs:element and name -> xs:complexType,
+        keeping the first occurrence of each like a document order search would
+
+        :return: Tuple[Dict[Tuple[str, str], Any], Dict[str, Any]]
+        """
+
+        elements: Dict[Tuple[str, str], Any] = {}
+        complex_types: Dict[str, Any] = {}
+
+        for node in schema.iter(
+            XSD_NAMESPACE + "element", XSD_NAMESPACE + "complexType"
+        ):
+            name: Optional[str] = node.get("name")
+
+            if name is None:
+                continue
+
+            if node.tag == XSD_NAMESPACE + "element":
+                elements.setdefault((name, node.get("type")), node)
+            else:
+                complex_types.setdefault(name, node)
+
+        return elements, complex_types
+
+    def _get_documentation(self, element, source: str) -> Optional[str]:
+        """
+        Retrive the text of the first xs:documentation with the given source
+
+        :return: Optional[str]
+        """
+
+        for documentation in element.iter(XSD_NAMESPACE + "documentation"):
+            if documentation.get("source") == source:
+                return "".join(documentation.itertext())
+
+        return None
+
+    def _get_children(self, complex_type) -> List[Any]:
+        """
+        Retrive the child xs:element nodes of a complex type
+
+        :return: List[Any]
+        """
+
+        for tag in ("sequence", "simpleContent", "choice"):
+            search = complex_type.find(".//" + XSD_NAMESPACE + tag)
+
+            if search is not None:
+                return list(search.iter(XSD_NAMESPACE + "element"))
+
+        return []
+
     def _get_tree(
         self,
-        soup,
+        schema,
         element_name: str = "Document",
         element_type: str = "Document",
         parent_id: str = str(uuid.uuid4()),
         level: int = 0,
-    ):
-        result = []
-
-        element = soup.find("xs:element", {"name": element_name, "type": element_type})
+    ) -> List[Dict[str, Any]]:
+        result: List[Dict[str, Any]] = []
 
-        if element is not None:
-            _name = element.find("xs:documentation", {"source": "Name"})
-            if _name is not None:
-                _name = _name.get_text()
+        elements, complex_types = self._index_schema(schema)
 
-            _def = element.find("xs:documentation", {"source": "Definition"})
-            if _def is not None:
-                _def = _def.get_text()
-
-            _new_id = str(uuid.uuid4())
-            result.append(
-                {
-                    "id": _new_id,
-                    "xsd_tag": "element",
-                    "name": element["name"],
-                    "type": element["type"],
-                    "annotation_name": _name,
-                    "annotation_definition": _def,
-                    "parent_id": parent_id,
-                    "level": level,
-                    "is_leaf": False,
-                    "target_column": "",
-                    "target_type": "",
-                }
-            )
-            parent_id = _new_id
+        # Depth-first, children pushed in reverse to keep document order
+        stack: List[Tuple[str, str, str, int]] = [
+            (element_name, element_type, parent_id, level)
+        ]
 
-            last = len(result) - 1
+        while stack:
+            name, type_, parent_id, level = stack.pop()
 
-            complex_type = soup.find("xs:complexType", {"name": element["type"]})
-            if complex_type is not None:
-                search = complex_type.find("xs:sequence")
+            element = elements.get((name, type_))
+            if element is None:
+                continue
 
-                if search is None:
-                    search = complex_type.find("xs:simpleContent")
-
-                if search is None:
-                    search = complex_type.find("xs:choice")
-
-                children = search.find_all("xs:element")
-
-                if len(children) > 0:
-                    for i in range(len(children)):
-                        result = result + self._get_tree(
-                            soup,
-                            children[i]["name"],
-                            children[i]["type"],
-                            parent_id,
-                            level + 1,
-                        )
-                else:
-                    result[last]["is_leaf"] = True
-            else:
-                result[last]["is_leaf"] = True
+            _new_id = str(uuid.uuid4())
+            item: Dict[str, Any] = {
+                "id": _new_id,
+                "xsd_tag": "element",
+                "name": name,
+                "type": type_,
+                "annotation_name": self._get_documentation(element, "Name"),
+                "annotation_definition": self._get_documentation(element, "Definition"),
+                "parent_id": parent_id,
+                "level": level,
+                "is_leaf": True,
+                "target_column": "",
+                "target_type": "",
+            }
+            result.append(item)
+
+            complex_type = complex_types.get(type_)
+            if complex_type is None:
+                continue
+
+            children = self._get_children(complex_type)
+            if len(children) > 0:
+                item["is_leaf"] = False
+
+                for child in reversed(children):
+                    stack.append(
+                        (child.get("name"), child.get("type"), _new_id, level + 1)
+                    )
 
         return result
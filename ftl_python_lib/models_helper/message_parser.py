@@ -18,7 +18,6 @@ from ftl_python_lib.models.sql.message import ModelMessage
 from ftl_python_lib.models.sql.message_category import ModelMessageCategory
 from ftl_python_lib.models_helper.message import HelperMessage
 from ftl_python_lib.models_helper.message_category import HelperMessageCategory
-from ftl_python_lib.utils.to_bytes import UtilsConversionsToBytes
 
 
 class HelperMessageParser:
@@ -34,8 +33,8 @@ class HelperMessageParser:
         self.__request_context = request_context
         self.__environ_context = environ_context
 
-        session = SessionContext()
-        self.__session = session.get_session()
+        self.__session_context = SessionContext(request_context=self.__request_context)
+        self.__session = self.__session_context.get_session()
 
     def parser(self, owner_member_id: str):
         """
@@ -92,19 +91,19 @@ class HelperMessageParser:
                             msg,
                         )
         except InvalidRequestError as exc:
-            self.__session.rollback()
+            self.__session_context.rollback()
             LOGGER.logger.error(exc)
             raise exc
         except IntegrityError as exc:
-            self.__session.rollback()
+            self.__session_context.rollback()
             LOGGER.logger.error(exc)
             raise exc
         except SQLAlchemyError as exc:
-            self.__session.rollback()
+            self.__session_context.rollback()
             LOGGER.logger.error(f"Unexpected error when creating message: {exc}")
             raise exc
         except Exception as exc:
-            self.__session.rollback()
+            self.__session_context.rollback()
             LOGGER.logger.error(f"Unexpected error when update message: {str(exc)}")
             raise exc
 
@@ -154,7 +153,8 @@ class HelperMessageParser:
                     with ZipFile(filename, "r") as _zip_object:
                         _final_file_name = filename.replace(".zip", ".xsd")
                         _zip_object.extract(_final_file_name)
-                file = open(_final_file_name, "r")
+                with open(_final_file_name, "rb") as file:
+                    content: bytes = file.read()
                 _message_helper.create(
                     message_new=ModelMessage(
                         unique_key=f"{unique_type}.{version_major}",
@@ -169,7 +169,7 @@ class HelperMessageParser:
                         category_id=_message_category.reference_id,
                     ),
                     owner_member_id=owner_member_id,
-                    content=UtilsConversionsToBytes.str_to_bytes(file.read()),
+                    content=content,
                 )
             except Exception as exc:
                 LOGGER.logger.error(
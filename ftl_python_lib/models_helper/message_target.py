@@ -1,6 +1,9 @@
 """Create records related to one another via SQLAlchemy's ORM."""
 
 import uuid
+from typing import Iterator
+from typing import List
+from typing import Optional
 
 from sqlalchemy import and_
 from sqlalchemy import func
@@ -14,6 +17,7 @@ from ftl_python_lib.core.context.request import RequestContext
 from ftl_python_lib.core.context.session import SessionContext
 from ftl_python_lib.core.log import LOGGER
 from ftl_python_lib.models.sql.message_target import ModelMessageTarget
+from ftl_python_lib.utils.keyset_pagination import UtilsKeysetPagination
 
 
 class HelperMessageTarget:
@@ -29,8 +33,8 @@ class HelperMessageTarget:
         self.__request_context = request_context
         self.__environ_context = environ_context
 
-        session = SessionContext()
-        self.__session = session.get_session()
+        self.__session_context = SessionContext(request_context=self.__request_context)
+        self.__session = self.__session_context.get_session()
 
     def _clone_message_target_object(self, search_result):
         message_target = ModelMessageTarget(
@@ -153,6 +157,37 @@ class HelperMessageTarget:
             )
             raise exc
 
+    def get_page(
+        self, after: Optional[str] = None, limit: int = 100
+    ) -> List[ModelMessageTarget]:
+        """
+        Retrive a page of records ordered by reference_id, starting after `after`.
+
+        :return: List[ModelMessageTarget]
+        """
+
+        return list(
+            UtilsKeysetPagination.paginate(
+                self.__session.query(ModelMessageTarget),
+                ModelMessageTarget.reference_id,
+                after=after,
+                limit=limit,
+            )
+        )
+
+    def iter_all(self, batch_size: int = 500) -> Iterator[ModelMessageTarget]:
+        """
+        Iterate over all records in reference_id order, batch by batch.
+
+        :return: Iterator[ModelMessageTarget]
+        """
+
+        return UtilsKeysetPagination.paginate(
+            self.__session.query(ModelMessageTarget),
+            ModelMessageTarget.reference_id,
+            batch_size=batch_size,
+        )
+
     def update(
         self, message_target_update: ModelMessageTarget, owner_member_id: str
     ) -> ModelMessageTarget:
@@ -174,23 +209,23 @@ class HelperMessageTarget:
                     created_by=owner_member_id,
                 )
             )
-            self.__session.commit()
+            self.__session_context.commit()
 
             return self.get_by_id(new_id)
         except InvalidRequestError as exc:
-            self.__session.rollback()
+            self.__session_context.rollback()
             LOGGER.logger.error(exc)
             raise exc
         except IntegrityError as exc:
-            self.__session.rollback()
+            self.__session_context.rollback()
             LOGGER.logger.error(exc)
             raise exc
         except SQLAlchemyError as exc:
-            self.__session.rollback()
+            self.__session_context.rollback()
             LOGGER.logger.error(f"Unexpected error when creating message_target: {exc}")
             raise exc
         except Exception as exc:
-            self.__session.rollback()
+            self.__session_context.rollback()
             LOGGER.logger.error(
                 f"Unexpected error when update message_target: {str(exc)}"
             )
@@ -216,7 +251,7 @@ class HelperMessageTarget:
             message_target_new.created_by = owner_member_id
 
             self.__session.add(message_target_new)
-            self.__session.commit()
+            self.__session_context.commit()
 
             member = self.get_by_id(new_id)
 
@@ -253,7 +288,7 @@ class HelperMessageTarget:
             )
 
             self.__session.execute(stmt)
-            self.__session.commit()
+            self.__session_context.commit()
         except Exception as exc:
             LOGGER.logger.error(
                 f"Unexpected error when delete a message_target: {str(exc)}"
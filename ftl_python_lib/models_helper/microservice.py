@@ -2,6 +2,10 @@
 
 import json
 import uuid
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
 
 from boto3 import client
 from sqlalchemy import and_
@@ -21,7 +25,10 @@ from ftl_python_lib.core.log import LOGGER
 from ftl_python_lib.core.providers.aws.s3 import ProviderS3
 from ftl_python_lib.models.sql.microservice import ModelMicroservice
 from ftl_python_lib.models.sql.transaction import ModelTransaction
+from ftl_python_lib.models.sql.transaction_microservice import ModelTransactionMicroservice
+from ftl_python_lib.models_helper.dashboard_cache import DASHBOARD_CACHE
 from ftl_python_lib.typings.providers.aws.s3object import TypeS3Object
+from ftl_python_lib.utils.keyset_pagination import UtilsKeysetPagination
 
 
 class HelperMicroservice:
@@ -37,8 +44,8 @@ class HelperMicroservice:
         self.__request_context = request_context
         self.__environ_context = environ_context
 
-        session = SessionContext()
-        self.__session = session.get_session()
+        self.__session_context = SessionContext(request_context=self.__request_context)
+        self.__session = self.__session_context.get_session()
         self.__provider_s3: ProviderS3 = ProviderS3(
             request_context=self.__request_context,
             environ_context=self.__environ_context,
@@ -94,19 +101,58 @@ class HelperMicroservice:
             )
             raise exc
 
+    def get_by_reference_ids(self, ids: List[str]) -> Dict[str, ModelMicroservice]:
+        """
+        Retrive records by a list of reference ids with a single query.
+
+        :return: Dict[str, ModelMicroservice]
+        """
+
+        if len(ids) == 0:
+            return {}
+
+        try:
+            search_result = (
+                self.__session.query(ModelMicroservice)
+                .filter(
+                    and_(
+                        ModelMicroservice.reference_id.in_(set(ids)),
+                        ModelMicroservice.deleted_by.is_(None),
+                        ModelMicroservice.deleted_at.is_(None),
+                    )
+                )
+                .all()
+            )
+
+            return {
+                microservice.reference_id: microservice
+                for microservice in search_result
+            }
+        except Exception as exc:
+            LOGGER.logger.error(
+                f"Unexpected error when get microservices by reference_ids: {str(exc)}"
+            )
+            raise exc
+
     def get_by_microservice_id(self, id: str) -> int:
         """
-        Retrive record by id.
+        Retrive count of active transactions using the microservice.
 
-        :return: Session
+        :return: int
         """
 
         try:
             search_result = (
-                self.__session.query(ModelTransaction)
+                self.__session.query(
+                    func.count(ModelTransactionMicroservice.transaction_id)
+                )
+                .join(
+                    ModelTransaction,
+                    ModelTransaction.id == ModelTransactionMicroservice.transaction_id,
+                )
                 .filter(
                     and_(
-                        ModelTransaction.microservices.like('%"' + id + '"%'),
+                        ModelTransactionMicroservice.microservice_id == id,
                         ModelTransaction.deleted_by.is_(None),
                         ModelTransaction.deleted_at.is_(None),
                     )
@@ -173,6 +219,37 @@ class HelperMicroservice:
             )
             raise exc
 
+    def get_page(
+        self, after: Optional[str] = None, limit: int = 100
+    ) -> List[ModelMicroservice]:
+        """
+        Retrive a page of records ordered by reference_id, starting after `after`.
+
+        :return: List[ModelMicroservice]
+        """
+
+        return list(
+            UtilsKeysetPagination.paginate(
+                self.__session.query(ModelMicroservice),
+                ModelMicroservice.reference_id,
+                after=after,
+                limit=limit,
+            )
+        )
+
+    def iter_all(self, batch_size: int = 500) -> Iterator[ModelMicroservice]:
+        """
+        Iterate over all records in reference_id order, batch by batch.
+
+        :return: Iterator[ModelMicroservice]
+        """
+
+        return UtilsKeysetPagination.paginate(
+            self.__session.query(ModelMicroservice),
+            ModelMicroservice.reference_id,
+            batch_size=batch_size,
+        )
+
     def count(self):
         """
         Retrive count of all records.
@@ -261,23 +338,23 @@ class HelperMicroservice:
                     )
                 )
 
-            self.__session.commit()
+            self.__session_context.commit(on_commit=DASHBOARD_CACHE.invalidate)
 
             return self.get_by_id(new_id)
         except InvalidRequestError as exc:
-            self.__session.rollback()
+            self.__session_context.rollback()
             LOGGER.logger.error(exc)
             raise exc
         except IntegrityError as exc:
-            self.__session.rollback()
+            self.__session_context.rollback()
             LOGGER.logger.error(exc)
             raise exc
         except SQLAlchemyError as exc:
-            self.__session.rollback()
+            self.__session_context.rollback()
             LOGGER.logger.error(f"Unexpected error when creating microservice: {exc}")
             raise exc
         except Exception as exc:
-            self.__session.rollback()
+            self.__session_context.rollback()
             LOGGER.logger.error(
                 f"Unexpected error when update microservice: {str(exc)}"
             )
@@ -375,7 +452,7 @@ class HelperMicroservice:
                 microservice_new.active = text(microservice_new.active)
 
             self.__session.add(microservice_new)
-            self.__session.commit()
+            self.__session_context.commit(on_commit=DASHBOARD_CACHE.invalidate)
 
             return microservice_new
         except IntegrityError as exc:
@@ -411,7 +488,7 @@ class HelperMicroservice:
             )
 
             self.__session.execute(stmt)
-            self.__session.commit()
+            self.__session_context.commit(on_commit=DASHBOARD_CACHE.invalidate)
         except Exception as exc:
             LOGGER.logger.error(
                 f"Unexpected error when delete a microservice: {str(exc)}"
@@ -1,6 +1,9 @@
 """Create records related to one another via SQLAlchemy's ORM."""
 
 import uuid
+from typing import Iterator
+from typing import List
+from typing import Optional
 
 from sqlalchemy import and_
 from sqlalchemy import asc
@@ -15,6 +18,7 @@ from ftl_python_lib.core.context.request import RequestContext
 from ftl_python_lib.core.context.session import SessionContext
 from ftl_python_lib.core.log import LOGGER
 from ftl_python_lib.models.sql.provider import ModelProvider
+from ftl_python_lib.utils.keyset_pagination import UtilsKeysetPagination
 
 
 class HelperProvider:
@@ -30,8 +34,8 @@ class HelperProvider:
         self.__request_context = request_context
         self.__environ_context = environ_context
 
-        session = SessionContext()
-        self.__session = session.get_session()
+        self.__session_context = SessionContext(request_context=self.__request_context)
+        self.__session = self.__session_context.get_session()
 
     def _clone_provider_object(self, search_result):
         provider = ModelProvider(
@@ -215,6 +219,37 @@ class HelperProvider:
             LOGGER.logger.error(f"Unexpected error when get all provider: {str(exc)}")
             raise exc
 
+    def get_page(
+        self, after: Optional[str] = None, limit: int = 100
+    ) -> List[ModelProvider]:
+        """
+        Retrive a page of records ordered by reference_id, starting after `after`.
+
+        :return: List[ModelProvider]
+        """
+
+        return list(
+            UtilsKeysetPagination.paginate(
+                self.__session.query(ModelProvider),
+                ModelProvider.reference_id,
+                after=after,
+                limit=limit,
+            )
+        )
+
+    def iter_all(self, batch_size: int = 500) -> Iterator[ModelProvider]:
+        """
+        Iterate over all records in reference_id order, batch by batch.
+
+        :return: Iterator[ModelProvider]
+        """
+
+        return UtilsKeysetPagination.paginate(
+            self.__session.query(ModelProvider),
+            ModelProvider.reference_id,
+            batch_size=batch_size,
+        )
+
     def update(
         self, provider_update: ModelProvider, owner_member_id: str
     ) -> ModelProvider:
@@ -241,23 +276,23 @@ class HelperProvider:
                     created_by=owner_member_id,
                 )
             )
-            self.__session.commit()
+            self.__session_context.commit()
 
             return self.get_by_id(new_id)
         except InvalidRequestError as exc:
-            self.__session.rollback()
+            self.__session_context.rollback()
             LOGGER.logger.error(exc)
             raise exc
         except IntegrityError as exc:
-            self.__session.rollback()
+            self.__session_context.rollback()
             LOGGER.logger.error(exc)
             raise exc
         except SQLAlchemyError as exc:
-            self.__session.rollback()
+            self.__session_context.rollback()
             LOGGER.logger.error(f"Unexpected error when creating provider: {exc}")
             raise exc
         except Exception as exc:
-            self.__session.rollback()
+            self.__session_context.rollback()
             LOGGER.logger.error(f"Unexpected error when update provider: {str(exc)}")
             raise exc
 
@@ -281,7 +316,7 @@ class HelperProvider:
             provider_new.created_by = owner_member_id
 
             self.__session.add(provider_new)
-            self.__session.commit()
+            self.__session_context.commit()
 
             member = self.get_by_id(new_id)
 
@@ -318,7 +353,7 @@ class HelperProvider:
             )
 
             self.__session.execute(stmt)
-            self.__session.commit()
+            self.__session_context.commit()
         except Exception as exc:
             LOGGER.logger.error(f"Unexpected error when delete a provider: {str(exc)}")
             raise exc
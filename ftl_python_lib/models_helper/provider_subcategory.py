@@ -1,6 +1,9 @@
 """Create records related to one another via SQLAlchemy's ORM."""
 
 import uuid
+from typing import Iterator
+from typing import List
+from typing import Optional
 
 from sqlalchemy import and_
 from sqlalchemy import asc
@@ -16,6 +19,7 @@ from ftl_python_lib.core.context.session import SessionContext
 from ftl_python_lib.core.log import LOGGER
 from ftl_python_lib.models.sql.provider_subcategory import ModelProviderSubcategory
 from ftl_python_lib.models_helper.provider import HelperProvider
+from ftl_python_lib.utils.keyset_pagination import UtilsKeysetPagination
 
 
 class HelperProviderSubcategory:
@@ -31,8 +35,8 @@ class HelperProviderSubcategory:
         self.__request_context = request_context
         self.__environ_context = environ_context
 
-        session = SessionContext()
-        self.__session = session.get_session()
+        self.__session_context = SessionContext(request_context=self.__request_context)
+        self.__session = self.__session_context.get_session()
 
     def _clone_provider_subcategory_object(self, search_result):
         provider_subcategory = ModelProviderSubcategory(
@@ -195,6 +199,37 @@ class HelperProviderSubcategory:
             )
             raise exc
 
+    def get_page(
+        self, after: Optional[str] = None, limit: int = 100
+    ) -> List[ModelProviderSubcategory]:
+        """
+        Retrive a page of records ordered by reference_id, starting after `after`.
+
+        :return: List[ModelProviderSubcategory]
+        """
+
+        return list(
+            UtilsKeysetPagination.paginate(
+                self.__session.query(ModelProviderSubcategory),
+                ModelProviderSubcategory.reference_id,
+                after=after,
+                limit=limit,
+            )
+        )
+
+    def iter_all(self, batch_size: int = 500) -> Iterator[ModelProviderSubcategory]:
+        """
+        Iterate over all records in reference_id order, batch by batch.
+
+        :return: Iterator[ModelProviderSubcategory]
+        """
+
+        return UtilsKeysetPagination.paginate(
+            self.__session.query(ModelProviderSubcategory),
+            ModelProviderSubcategory.reference_id,
+            batch_size=batch_size,
+        )
+
     def update(
         self,
         provider_subcategory_update: ModelProviderSubcategory,
@@ -219,25 +254,25 @@ class HelperProviderSubcategory:
                     created_by=owner_member_id,
                 )
             )
-            self.__session.commit()
+            self.__session_context.commit()
 
             return self.get_by_id(new_id)
         except InvalidRequestError as exc:
-            self.__session.rollback()
+            self.__session_context.rollback()
             LOGGER.logger.error(exc)
             raise exc
         except IntegrityError as exc:
-            self.__session.rollback()
+            self.__session_context.rollback()
             LOGGER.logger.error(exc)
             raise exc
         except SQLAlchemyError as exc:
-            self.__session.rollback()
+            self.__session_context.rollback()
             LOGGER.logger.error(
                 f"Unexpected error when creating provider_subcategory: {exc}"
             )
             raise exc
         except Exception as exc:
-            self.__session.rollback()
+            self.__session_context.rollback()
             LOGGER.logger.error(
                 f"Unexpected error when update provider_subcategory: {str(exc)}"
             )
@@ -263,7 +298,7 @@ class HelperProviderSubcategory:
             provider_subcategory_new.created_by = owner_member_id
 
             self.__session.add(provider_subcategory_new)
-            self.__session.commit()
+            self.__session_context.commit()
 
             member = self.get_by_id(new_id)
 
@@ -302,7 +337,7 @@ class HelperProviderSubcategory:
             )
 
             self.__session.execute(stmt)
-            self.__session.commit()
+            self.__session_context.commit()
         except Exception as exc:
             LOGGER.logger.error(
                 f"Unexpected error when delete a provider_subcategory: {str(exc)}"
@@ -2,6 +2,11 @@
 
 import json
 import uuid
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Set
 
 from sqlalchemy import and_
 from sqlalchemy import func
@@ -14,8 +19,12 @@ from ftl_python_lib.core.context.environment import EnvironmentContext
 from ftl_python_lib.core.context.request import RequestContext
 from ftl_python_lib.core.context.session import SessionContext
 from ftl_python_lib.core.log import LOGGER
+from ftl_python_lib.models.sql.microservice import ModelMicroservice
 from ftl_python_lib.models.sql.transaction import ModelTransaction
+from ftl_python_lib.models.sql.transaction_microservice import ModelTransactionMicroservice
+from ftl_python_lib.models_helper.dashboard_cache import DASHBOARD_CACHE
 from ftl_python_lib.models_helper.microservice import HelperMicroservice
+from ftl_python_lib.utils.keyset_pagination import UtilsKeysetPagination
 
 
 class HelperTransaction:
@@ -31,18 +40,105 @@ class HelperTransaction:
         self.__request_context = request_context
         self.__environ_context = environ_context
 
-        session = SessionContext()
-        self.__session = session.get_session()
-
-    def _clone_transaction_object(self, search_result, raw: bool = False):
-        microservices = []
-        microservice_ids = json.loads(search_result.microservices)
-        microservice_helper = HelperMicroservice(
+        self.__session_context = SessionContext(request_context=self.__request_context)
+        self.__session = self.__session_context.get_session()
+        self.__microservice_helper = HelperMicroservice(
             request_context=self.__request_context,
             environ_context=self.__environ_context,
         )
-        for microservice_id in microservice_ids:
-            microservice = microservice_helper.get_by_reference_id(microservice_id)
+
+    def _add_microservice_links(self, transaction_id: str, microservice_ids) -> None:
+        """
+        Add the transaction_microservice rows for a transaction record.
+        """
+
+        for position, microservice_id in enumerate(
+            dict.fromkeys(microservice_ids or [])
+        ):
+            self.__session.add(
+                ModelTransactionMicroservice(
+                    transaction_id=transaction_id,
+                    microservice_id=microservice_id,
+                    position=position,
+                )
+            )
+
+    def _get_microservice_ids(self, search_results) -> Dict[str, List[str]]:
+        """
+        Read the ordered microservice ids of the given transaction rows
+        from the transaction_microservice table in one query; rows without
+        links fall back to the JSON microservices column.
+
+        :return: Dict[str, List[str]]
+        """
+
+        transaction_ids: List[str] = [
+            search_result.id for search_result in search_results
+        ]
+        result: Dict[str, List[str]] = {
+            transaction_id: [] for transaction_id in transaction_ids
+        }
+
+        if len(transaction_ids) == 0:
+            return result
+
+        links = (
+            self.__session.query(
+                ModelTransactionMicroservice.transaction_id,
+                ModelTransactionMicroservice.microservice_id,
+            )
+            .filter(ModelTransactionMicroservice.transaction_id.in_(transaction_ids))
+            .order_by(
+                ModelTransactionMicroservice.transaction_id,
+                ModelTransactionMicroservice.position,
+            )
+            .all()
+        )
+        for transaction_id, microservice_id in links:
+            result[transaction_id].append(microservice_id)
+
+        for search_result in search_results:
+            if len(result[search_result.id]) == 0:
+                result[search_result.id] = json.loads(
+                    search_result.microservices or "[]"
+                )
+
+        return result
+
+    def _resolve_microservices(self, microservice_ids) -> Dict[str, ModelMicroservice]:
+        """
+        Resolve every microservice referenced by the given transaction rows
+        with a single IN (...) query.
+
+        :return: Dict[str, ModelMicroservice]
+        """
+
+        unique_ids: Set[str] = set()
+        for ids in microservice_ids.values():
+            unique_ids.update(ids)
+
+        return self.__microservice_helper.get_by_reference_ids(list(unique_ids))
+
+    def _clone_transaction_object(
+        self,
+        search_result,
+        raw: bool = False,
+        microservice_ids: Optional[Dict[str, List[str]]] = None,
+        microservices_map: Optional[Dict[str, ModelMicroservice]] = None,
+    ):
+        if microservice_ids is None:
+            microservice_ids = self._get_microservice_ids([search_result])
+        if microservices_map is None:
+            microservices_map = self._resolve_microservices(microservice_ids)
+
+        microservices = []
+        for microservice_id in microservice_ids[search_result.id]:
+            microservice = microservices_map.get(microservice_id)
+            if microservice is None:
+                LOGGER.logger.warning(
+                    f"Microservice {microservice_id} of transaction {search_result.id} was not found"
+                )
+                continue
             if raw:
                 microservices.append(microservice.reference_id)
             else:
@@ -173,6 +269,62 @@ class HelperTransaction:
             )
             raise exc
 
+    def get_page(
+        self, after: Optional[str] = None, limit: int = 100
+    ) -> List[ModelTransaction]:
+        """
+        Retrive a page of records ordered by reference_id, starting after `after`.
+
+        :return: List[ModelTransaction]
+        """
+
+        return list(
+            UtilsKeysetPagination.paginate(
+                self.__session.query(ModelTransaction),
+                ModelTransaction.reference_id,
+                after=after,
+                limit=limit,
+            )
+        )
+
+    def iter_all(self, batch_size: int = 500) -> Iterator[ModelTransaction]:
+        """
+        Iterate over all records in reference_id order, batch by batch.
+
+        :return: Iterator[ModelTransaction]
+        """
+
+        return UtilsKeysetPagination.paginate(
+            self.__session.query(ModelTransaction),
+            ModelTransaction.reference_id,
+            batch_size=batch_size,
+        )
+
+    def get_all_hydrated(self, raw: bool = False) -> List[ModelTransaction]:
+        """
+        Retrive all records with their microservices resolved
+        in one batched query.
+
+        :return: List[ModelTransaction]
+        """
+
+        try:
+            search_results = self.get_all()
+            microservice_ids = self._get_microservice_ids(search_results)
+            microservices_map = self._resolve_microservices(microservice_ids)
+
+            return [
+                self._clone_transaction_object(
+                    search_result, raw, microservice_ids, microservices_map
+                )
+                for search_result in search_results
+            ]
+        except Exception as exc:
+            LOGGER.logger.error(
+                f"Unexpected error when get all hydrated transaction: {str(exc)}"
+            )
+            raise exc
+
     def count(self):
         """
         Retrive count of all records.
@@ -246,23 +398,24 @@ class HelperTransaction:
                     created_by=owner_member_id,
                 )
             )
-            self.__session.commit()
+            self._add_microservice_links(new_id, transaction_update.microservices)
+            self.__session_context.commit(on_commit=DASHBOARD_CACHE.invalidate)
 
             return self.get_by_id(new_id)
         except InvalidRequestError as exc:
-            self.__session.rollback()
+            self.__session_context.rollback()
             LOGGER.logger.error(exc)
             raise exc
         except IntegrityError as exc:
-            self.__session.rollback()
+            self.__session_context.rollback()
             LOGGER.logger.error(exc)
             raise exc
         except SQLAlchemyError as exc:
-            self.__session.rollback()
+            self.__session_context.rollback()
             LOGGER.logger.error(f"Unexpected error when creating transaction: {exc}")
             raise exc
         except Exception as exc:
-            self.__session.rollback()
+            self.__session_context.rollback()
             LOGGER.logger.error(f"Unexpected error when update transaction: {str(exc)}")
             raise exc
 
@@ -284,10 +437,12 @@ class HelperTransaction:
             new_id = str(uuid.uuid4())
             transaction_new.id = new_id
             transaction_new.created_by = owner_member_id
-            transaction_new.microservices = json.dumps(transaction_new.microservices)
+            microservice_ids = transaction_new.microservices
+            transaction_new.microservices = json.dumps(microservice_ids)
 
             self.__session.add(transaction_new)
-            self.__session.commit()
+            self._add_microservice_links(new_id, microservice_ids)
+            self.__session_context.commit(on_commit=DASHBOARD_CACHE.invalidate)
 
             member = self.get_by_id(new_id)
 
@@ -324,7 +479,7 @@ class HelperTransaction:
             )
 
             self.__session.execute(stmt)
-            self.__session.commit()
+            self.__session_context.commit(on_commit=DASHBOARD_CACHE.invalidate)
         except Exception as exc:
             LOGGER.logger.error(
                 f"Unexpected error when delete a transaction: {str(exc)}"
@@ -1,6 +1,9 @@
 """Create records related to one another via SQLAlchemy's ORM."""
 
 import uuid
+from typing import Iterator
+from typing import List
+from typing import Optional
 
 from sqlalchemy import and_
 from sqlalchemy import func
@@ -14,6 +17,7 @@ from ftl_python_lib.core.context.request import RequestContext
 from ftl_python_lib.core.context.session import SessionContext
 from ftl_python_lib.core.log import LOGGER
 from ftl_python_lib.models.sql.transaction_type import ModelTransactionType
+from ftl_python_lib.utils.keyset_pagination import UtilsKeysetPagination
 
 
 class HelperTransactionType:
@@ -29,8 +33,8 @@ class HelperTransactionType:
         self.__request_context = request_context
         self.__environ_context = environ_context
 
-        session = SessionContext()
-        self.__session = session.get_session()
+        self.__session_context = SessionContext(request_context=self.__request_context)
+        self.__session = self.__session_context.get_session()
 
     def _clone_transaction_type_object(self, search_result):
         transaction_type = ModelTransactionType(
@@ -153,6 +157,37 @@ class HelperTransactionType:
             )
             raise exc
 
+    def get_page(
+        self, after: Optional[str] = None, limit: int = 100
+    ) -> List[ModelTransactionType]:
+        """
+        Retrive a page of records ordered by reference_id, starting after `after`.
+
+        :return: List[ModelTransactionType]
+        """
+
+        return list(
+            UtilsKeysetPagination.paginate(
+                self.__session.query(ModelTransactionType),
+                ModelTransactionType.reference_id,
+                after=after,
+                limit=limit,
+            )
+        )
+
+    def iter_all(self, batch_size: int = 500) -> Iterator[ModelTransactionType]:
+        """
+        Iterate over all records in reference_id order, batch by batch.
+
+        :return: Iterator[ModelTransactionType]
+        """
+
+        return UtilsKeysetPagination.paginate(
+            self.__session.query(ModelTransactionType),
+            ModelTransactionType.reference_id,
+            batch_size=batch_size,
+        )
+
     def update(
         self, transaction_type_update: ModelTransactionType, owner_member_id: str
     ) -> ModelTransactionType:
@@ -174,25 +209,25 @@ class HelperTransactionType:
                     created_by=owner_member_id,
                 )
             )
-            self.__session.commit()
+            self.__session_context.commit()
 
             return self.get_by_id(new_id)
         except InvalidRequestError as exc:
-            self.__session.rollback()
+            self.__session_context.rollback()
             LOGGER.logger.error(exc)
             raise exc
         except IntegrityError as exc:
-            self.__session.rollback()
+            self.__session_context.rollback()
             LOGGER.logger.error(exc)
             raise exc
         except SQLAlchemyError as exc:
-            self.__session.rollback()
+            self.__session_context.rollback()
             LOGGER.logger.error(
                 f"Unexpected error when creating transaction_type: {exc}"
             )
             raise exc
         except Exception as exc:
-            self.__session.rollback()
+            self.__session_context.rollback()
             LOGGER.logger.error(
                 f"Unexpected error when update transaction_type: {str(exc)}"
             )
@@ -218,7 +253,7 @@ class HelperTransactionType:
             transaction_type_new.created_by = owner_member_id
 
             self.__session.add(transaction_type_new)
-            self.__session.commit()
+            self.__session_context.commit()
 
             member = self.get_by_id(new_id)
 
@@ -257,7 +292,7 @@ class HelperTransactionType:
             )
 
             self.__session.execute(stmt)
-            self.__session.commit()
+            self.__session_context.commit()
         except Exception as exc:
             LOGGER.logger.error(
                 f"Unexpected error when delete a transaction_type: {str(exc)}"
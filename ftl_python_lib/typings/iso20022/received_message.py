@@ -1,20 +1,42 @@
 import json
 from typing import Dict
+from typing import Iterator
 from typing import List
+from typing import Optional
+from typing import Tuple
 from typing import Union
 
+from ftl_python_lib.constants.messages import ConstantsMessagesPacs008Fields
+from ftl_python_lib.constants.messages import ConstantsMessagesPacs008Paths
+from ftl_python_lib.constants.messages import ConstantsMessagesPacs008TransactionFields
 from ftl_python_lib.constants.models.mapping import ConstantsMappingInFailedOut
 from ftl_python_lib.core.context.environment import EnvironmentContext
 from ftl_python_lib.core.context.request import RequestContext
 from ftl_python_lib.core.providers.aws.s3 import ProviderS3
 from ftl_python_lib.typings.providers.aws.s3object import TypeS3Object
+from ftl_python_lib.utils.conversion_counter import UtilsConversionCounter
 from ftl_python_lib.utils.mime import mime_is_json
 from ftl_python_lib.utils.mime import mime_is_xml
 from ftl_python_lib.utils.to_str import bytes_to_str
+from ftl_python_lib.utils.xml.extractor import UtilsXmlFieldExtractor
+from ftl_python_lib.utils.xml.parser import UtilsXmlParser
 from ftl_python_lib.utils.xml.processing import parse as xml_parse
 from ftl_python_lib.utils.xml.processing import unparse as xml_unparse
 from ftl_python_lib.utils.xml.storage import storage_key
 
+PACS_008_FIELDS_EXTRACTOR: UtilsXmlFieldExtractor = UtilsXmlFieldExtractor(
+    paths=[field.value for field in ConstantsMessagesPacs008Fields]
+)
+PACS_008_TRANSACTION_EXTRACTOR: UtilsXmlFieldExtractor = UtilsXmlFieldExtractor(
+    paths=[field.value for field in ConstantsMessagesPacs008TransactionFields]
+)
+PACS_008_TRANSACTION_FIELD_INDEXES: Dict[
+    ConstantsMessagesPacs008TransactionFields, int
+] = {
+    field: index
+    for index, field in enumerate(ConstantsMessagesPacs008TransactionFields)
+}
+
 
 class TypeReceivedMessageVersionKeys:
     def __init__(
@@ -46,6 +68,71 @@ class TypeReceivedMessageVersionKeys:
         return self.__version_patch
 
 
+class TypeReceivedMessageTransaction:
+    """
+    Lightweight, tuple-backed view over one CdtTrfTxInf of a pacs.008
+    Values are ordered as ConstantsMessagesPacs008TransactionFields
+    """
+
+    __slots__ = ("__values",)
+
+    def __init__(self, values: Tuple[Optional[str], ...]) -> None:
+        self.__values = values
+
+    def __get(self, field: ConstantsMessagesPacs008TransactionFields) -> Optional[str]:
+        return self.__values[PACS_008_TRANSACTION_FIELD_INDEXES[field]]
+
+    @property
+    def instruction_id(self) -> Optional[str]:
+        return self.__get(ConstantsMessagesPacs008TransactionFields.INSTRUCTION_ID)
+
+    @property
+    def end_to_end_id(self) -> Optional[str]:
+        return self.__get(ConstantsMessagesPacs008TransactionFields.END_TO_END_ID)
+
+    @property
+    def transaction_id(self) -> Optional[str]:
+        return self.__get(ConstantsMessagesPacs008TransactionFields.TRANSACTION_ID)
+
+    @property
+    def creditor_name(self) -> str:
+        value = self.__get(ConstantsMessagesPacs008TransactionFields.CREDITOR_NAME)
+
+        return value if value is not None else "N/A"
+
+    @property
+    def creditor_account(self) -> str:
+        value = self.__get(ConstantsMessagesPacs008TransactionFields.CREDITOR_ACCOUNT)
+
+        return value if value is not None else "N/A"
+
+    @property
+    def debitor_name(self) -> str:
+        value = self.__get(ConstantsMessagesPacs008TransactionFields.DEBITOR_NAME)
+
+        return value if value is not None else "N/A"
+
+    @property
+    def debitor_account(self) -> str:
+        value = self.__get(ConstantsMessagesPacs008TransactionFields.DEBITOR_ACCOUNT)
+
+        return value if value is not None else "N/A"
+
+    @property
+    def amount(self) -> int:
+        amount = self.__get(ConstantsMessagesPacs008TransactionFields.AMOUNT)
+
+        if amount is not None and amount.isdigit():
+            return int(amount)
+        return 0
+
+    @property
+    def currency(self) -> str:
+        value = self.__get(ConstantsMessagesPacs008TransactionFields.CURRENCY)
+
+        return value if value is not None else "N/A"
+
+
 class TypeReceivedMessageProc:
     __message_type = None
     __message_version = None
@@ -54,16 +141,21 @@ class TypeReceivedMessageProc:
 
     __xml = None
     __proc = None
+    __fields = None
+    __namespace = None
 
     def __init__(
         self,
-        message_proc: Union[Dict[str, str], dict],
+        message_proc: Optional[Union[Dict[str, str], dict]],
         request_context: RequestContext,
         environ_context: EnvironmentContext,
+        message_xml: Optional[Union[str, bytes]] = None,
     ) -> None:
-        if message_proc is None:
+        if message_proc is None and message_xml is None:
             raise ValueError("Processed message content must not be NoneType")
+        # An XML message is only converted to dict when to_dict() is called
         self.__message_proc = message_proc
+        self.__message_xml = message_xml
         self.__request_context = request_context
         self.__environ_context = environ_context
 
@@ -71,7 +163,12 @@ class TypeReceivedMessageProc:
         if self.__xml is not None:
             return self.__xml
 
-        self.__xml = xml_unparse(src=self.__message_proc)
+        if isinstance(self.__message_xml, bytes):
+            self.__xml = bytes_to_str(src=self.__message_xml)
+        elif self.__message_xml is not None:
+            self.__xml = self.__message_xml
+        else:
+            self.__xml = xml_unparse(src=self.__message_proc)
 
         return self.__xml
 
@@ -79,18 +176,73 @@ class TypeReceivedMessageProc:
         if self.__proc is not None:
             return self.__proc
 
+        if self.__message_proc is None:
+            self.__message_proc = xml_parse(src=self.__message_xml)
+
         self.__proc = self.__message_proc
 
         return self.__proc
 
+    def fill_message_fields(self) -> None:
+        if self.__fields is not None:
+            return
+
+        if self.__message_proc is None:
+            self.__fields = PACS_008_FIELDS_EXTRACTOR.extract(src=self.__message_xml)
+        else:
+            self.__fields = {
+                field.value: UtilsXmlFieldExtractor.from_dict(
+                    src=self.__message_proc, path=field.value
+                )
+                for field in ConstantsMessagesPacs008Fields
+            }
+
+    def __get_field(self, field: ConstantsMessagesPacs008Fields) -> Optional[str]:
+        self.fill_message_fields()
+
+        return self.__fields.get(field.value)
+
+    def iter_transactions(self) -> Iterator[TypeReceivedMessageTransaction]:
+        """
+        Iterate over the CdtTrfTxInf of the message, one view per transaction
+        XML messages are streamed, so they are never converted to dict
+        """
+
+        if self.__message_proc is None:
+            records = PACS_008_TRANSACTION_EXTRACTOR.iterate(
+                src=self.__message_xml,
+                record_path=ConstantsMessagesPacs008Paths.TRANSACTION.value,
+            )
+        else:
+            records = PACS_008_TRANSACTION_EXTRACTOR.iterate_dict(
+                src=self.__message_proc,
+                record_path=ConstantsMessagesPacs008Paths.TRANSACTION.value,
+            )
+
+        for values in records:
+            yield TypeReceivedMessageTransaction(values=values)
+
+    @property
+    def namespace(self) -> Optional[str]:
+        """
+        Namespace of the Document element, sniffed from the start of XML
+        messages without converting them to dict
+        """
+
+        if self.__namespace is None:
+            if self.__message_proc is None:
+                self.__namespace = UtilsXmlParser.sniff_namespace(
+                    src=self.__message_xml
+                )
+            else:
+                self.__namespace = self.__message_proc.get("Document").get("@xmlns")
+
+        return self.__namespace
+
     def fill_message_type(self) -> None:
         try:
             self.__message_type = ".".join(
-                self.__message_proc.get("Document")
-                .get("@xmlns")
-                .split(":")
-                .pop()
-                .split(".")[:2]
+                self.namespace.split(":").pop().split(".")[:2]
             )
         except Exception as exception:
             raise ValueError(
@@ -99,9 +251,7 @@ class TypeReceivedMessageProc:
 
     def fill_message_version(self) -> None:
         try:
-            self.__message_version = (
-                self.__message_proc.get("Document").get("@xmlns").split(":").pop()
-            )
+            self.__message_version = self.namespace.split(":").pop()
         except Exception as exception:
             raise ValueError(
                 f"Could not retrieve 'message_version' from 'message_proc' due to invalid message: {exception}"
@@ -164,16 +314,11 @@ class TypeReceivedMessageProc:
         Get creditor's name
         """
 
-        try:
-            return (
-                self.__message_proc.get("Document")
-                .get("FIToFICstmrCdtTrf")
-                .get("CdtTrfTxInf")
-                .get("Cdtr")
-                .get("Nm")
-            )
-        except (ValueError, KeyError):
-            return "N/A"
+        value: Optional[str] = self.__get_field(
+            ConstantsMessagesPacs008Fields.CREDITOR_NAME
+        )
+
+        return value if value is not None else "N/A"
 
     @property
     def creditor_account(self) -> str:
@@ -181,18 +326,11 @@ class TypeReceivedMessageProc:
         Get creditor's account
         """
 
-        try:
-            return (
-                self.__message_proc.get("Document")
-                .get("FIToFICstmrCdtTrf")
-                .get("CdtTrfTxInf")
-                .get("CdtrAcct")
-                .get("Id")
-                .get("Othr")
-                .get("Id")
-            )
-        except (ValueError, KeyError):
-            return "N/A"
+        value: Optional[str] = self.__get_field(
+            ConstantsMessagesPacs008Fields.CREDITOR_ACCOUNT
+        )
+
+        return value if value is not None else "N/A"
 
     @property
     def debitor_name(self) -> str:
@@ -200,16 +338,11 @@ class TypeReceivedMessageProc:
         Get debitor's name
         """
 
-        try:
-            return (
-                self.__message_proc.get("Document")
-                .get("FIToFICstmrCdtTrf")
-                .get("CdtTrfTxInf")
-                .get("Dbtr")
-                .get("Nm")
-            )
-        except (ValueError, KeyError):
-            return "N/A"
+        value: Optional[str] = self.__get_field(
+            ConstantsMessagesPacs008Fields.DEBITOR_NAME
+        )
+
+        return value if value is not None else "N/A"
 
     @property
     def debitor_account(self) -> str:
@@ -217,18 +350,11 @@ class TypeReceivedMessageProc:
         Get debitor's account
         """
 
-        try:
-            return (
-                self.__message_proc.get("Document")
-                .get("FIToFICstmrCdtTrf")
-                .get("CdtTrfTxInf")
-                .get("DbtrAcct")
-                .get("Id")
-                .get("Othr")
-                .get("Id")
-            )
-        except (ValueError, KeyError):
-            return "N/A"
+        value: Optional[str] = self.__get_field(
+            ConstantsMessagesPacs008Fields.DEBITOR_ACCOUNT
+        )
+
+        return value if value is not None else "N/A"
 
     @property
     def amount(self) -> int:
@@ -236,20 +362,11 @@ class TypeReceivedMessageProc:
         Get transfer amount
         """
 
-        try:
-            amount: str = (
-                self.__message_proc.get("Document")
-                .get("FIToFICstmrCdtTrf")
-                .get("CdtTrfTxInf")
-                .get("IntrBkSttlmAmt")
-                .get("#text")
-            )
+        amount: Optional[str] = self.__get_field(ConstantsMessagesPacs008Fields.AMOUNT)
 
-            if amount.isdigit():
-                return int(amount)
-            return 0
-        except (ValueError, KeyError):
-            return 0
+        if amount is not None and amount.isdigit():
+            return int(amount)
+        return 0
 
     @property
     def currency(self) -> str:
@@ -257,16 +374,9 @@ class TypeReceivedMessageProc:
         Get transfer currency
         """
 
-        try:
-            return (
-                self.__message_proc.get("Document")
-                .get("FIToFICstmrCdtTrf")
-                .get("CdtTrfTxInf")
-                .get("IntrBkSttlmAmt")
-                .get("@Ccy")
-            )
-        except (ValueError, KeyError):
-            return "N/A"
+        value: Optional[str] = self.__get_field(ConstantsMessagesPacs008Fields.CURRENCY)
+
+        return value if value is not None else "N/A"
 
 
 class TypeReceivedMessageOut:
@@ -367,6 +477,22 @@ class TypeReceivedMessageOut:
 
     #     storage_provider.put_object(object=self.__storage_path)
 
+    def __get_field(self, field: ConstantsMessagesPacs008Fields) -> Optional[str]:
+        return UtilsXmlFieldExtractor.from_dict(
+            src=self.__message_out, path=field.value
+        )
+
+    def iter_transactions(self) -> Iterator[TypeReceivedMessageTransaction]:
+        """
+        Iterate over the CdtTrfTxInf of the message, one view per transaction
+        """
+
+        for values in PACS_008_TRANSACTION_EXTRACTOR.iterate_dict(
+            src=self.__message_out,
+            record_path=ConstantsMessagesPacs008Paths.TRANSACTION.value,
+        ):
+            yield TypeReceivedMessageTransaction(values=values)
+
     @property
     def message_out(self) -> Union[Dict[str, str], dict]:
         return self.__message_out
@@ -405,16 +531,11 @@ class TypeReceivedMessageOut:
         Get creditor's name
         """
 
-        try:
-            return (
-                self.__message_out.get("Document")
-                .get("FIToFICstmrCdtTrf")
-                .get("CdtTrfTxInf")
-                .get("Cdtr")
-                .get("Nm")
-            )
-        except (ValueError, KeyError):
-            return "N/A"
+        value: Optional[str] = self.__get_field(
+            ConstantsMessagesPacs008Fields.CREDITOR_NAME
+        )
+
+        return value if value is not None else "N/A"
 
     @property
     def creditor_account(self) -> str:
@@ -422,18 +543,11 @@ class TypeReceivedMessageOut:
         Get creditor's account
         """
 
-        try:
-            return (
-                self.__message_out.get("Document")
-                .get("FIToFICstmrCdtTrf")
-                .get("CdtTrfTxInf")
-                .get("CdtrAcct")
-                .get("Id")
-                .get("Othr")
-                .get("Id")
-            )
-        except (ValueError, KeyError):
-            return "N/A"
+        value: Optional[str] = self.__get_field(
+            ConstantsMessagesPacs008Fields.CREDITOR_ACCOUNT
+        )
+
+        return value if value is not None else "N/A"
 
     @property
     def debitor_name(self) -> str:
@@ -441,16 +555,11 @@ class TypeReceivedMessageOut:
         Get debitor's name
         """
 
-        try:
-            return (
-                self.__message_out.get("Document")
-                .get("FIToFICstmrCdtTrf")
-                .get("CdtTrfTxInf")
-                .get("Dbtr")
-                .get("Nm")
-            )
-        except (ValueError, KeyError):
-            return "N/A"
+        value: Optional[str] = self.__get_field(
+            ConstantsMessagesPacs008Fields.DEBITOR_NAME
+        )
+
+        return value if value is not None else "N/A"
 
     @property
     def debitor_account(self) -> str:
@@ -458,18 +567,11 @@ class TypeReceivedMessageOut:
         Get debitor's account
         """
 
-        try:
-            return (
-                self.__message_out.get("Document")
-                .get("FIToFICstmrCdtTrf")
-                .get("CdtTrfTxInf")
-                .get("DbtrAcct")
-                .get("Id")
-                .get("Othr")
-                .get("Id")
-            )
-        except (ValueError, KeyError):
-            return "N/A"
+        value: Optional[str] = self.__get_field(
+            ConstantsMessagesPacs008Fields.DEBITOR_ACCOUNT
+        )
+
+        return value if value is not None else "N/A"
 
     @property
     def amount(self) -> int:
@@ -477,20 +579,11 @@ class TypeReceivedMessageOut:
         Get transfer amount
         """
 
-        try:
-            amount: str = (
-                self.__message_out.get("Document")
-                .get("FIToFICstmrCdtTrf")
-                .get("CdtTrfTxInf")
-                .get("IntrBkSttlmAmt")
-                .get("#text")
-            )
+        amount: Optional[str] = self.__get_field(ConstantsMessagesPacs008Fields.AMOUNT)
 
-            if amount.isdigit():
-                return int(amount)
-            return 0
-        except (ValueError, KeyError):
-            return 0
+        if amount is not None and amount.isdigit():
+            return int(amount)
+        return 0
 
     @property
     def currency(self) -> str:
@@ -498,19 +591,13 @@ class TypeReceivedMessageOut:
         Get transfer currency
         """
 
-        try:
-            return (
-                self.__message_out.get("Document")
-                .get("FIToFICstmrCdtTrf")
-                .get("CdtTrfTxInf")
-                .get("IntrBkSttlmAmt")
-                .get("@Ccy")
-            )
-        except (ValueError, KeyError):
-            return "N/A"
+        value: Optional[str] = self.__get_field(ConstantsMessagesPacs008Fields.CURRENCY)
+
+        return value if value is not None else "N/A"
 
 
 class TypeReceivedMessage:
+    __namespace = None
     __message_proc = None
     __message_out = None
     __message_xml = None
@@ -531,6 +618,8 @@ class TypeReceivedMessage:
 
         self.__content_type = content_type
         self.__message_raw = message_raw
+        # str <-> bytes conversions made while handling this message
+        self.__conversions_at = UtilsConversionCounter.count()
 
     @property
     def request_id(self) -> str:
@@ -544,6 +633,10 @@ class TypeReceivedMessage:
     def content_type(self) -> str:
         return self.__content_type
 
+    @property
+    def conversions(self) -> int:
+        return UtilsConversionCounter.count() - self.__conversions_at
+
     @property
     def message_raw(self) -> Union[Dict[str, str], str, bytes]:
         return self.__message_raw
@@ -633,11 +726,14 @@ class TypeReceivedMessage:
             isinstance(self.__message_raw, (str, bytes))
         ):
             try:
-                self.__message_proc = TypeReceivedMessageProc(
-                    message_proc=xml_parse(src=self.__message_raw),
+                message_proc: TypeReceivedMessageProc = TypeReceivedMessageProc(
+                    message_proc=None,
                     request_context=self.__request_context,
                     environ_context=self.__environ_context,
+                    message_xml=self.__message_raw,
                 )
+                message_proc.fill_message_fields()
+                self.__message_proc = message_proc
                 return
             except Exception as exception:
                 raise ValueError(
@@ -680,15 +776,31 @@ class TypeReceivedMessage:
         # Nothing to do here yet
         pass
 
+    @property
+    def namespace(self) -> Optional[str]:
+        """
+        Namespace of the Document element; for XML messages it is sniffed
+        from the raw bytes, so routing decisions need no full parse
+        """
+
+        if self.__namespace is not None:
+            return self.__namespace
+
+        if self.__message_proc is not None:
+            self.__namespace = self.__message_proc.namespace
+        elif mime_is_xml(mime=self.__content_type) and isinstance(
+            self.__message_raw, (str, bytes)
+        ):
+            self.__namespace = UtilsXmlParser.sniff_namespace(src=self.__message_raw)
+        elif isinstance(self.__message_raw, dict):
+            self.__namespace = self.__message_raw.get("Document").get("@xmlns")
+
+        return self.__namespace
+
     def fill_message_type(self) -> None:
         try:
             self.__message_type = ".".join(
-                self.__message_proc.to_dict()
-                .get("Document")
-                .get("@xmlns")
-                .split(":")
-                .pop()
-                .split(".")[:2]
+                self.namespace.split(":").pop().split(".")[:2]
             )
         except Exception as exception:
             raise ValueError(
@@ -700,13 +812,7 @@ class TypeReceivedMessage:
             self.__message_version = from_header
             return
         try:
-            self.__message_version = (
-                self.__message_proc.to_dict()
-                .get("Document")
-                .get("@xmlns")
-                .split(":")
-                .pop()
-            )
+            self.__message_version = self.namespace.split(":").pop()
         except Exception:
             self.__message_version = None
             # raise ValueError(
@@ -747,7 +853,7 @@ class TypeReceivedMessage:
             key=key,
             body=self.__message_raw
             if isinstance(self.__message_raw, (str, bytes))
-            else json.dumps(bytes_to_str(src=self.__message_raw)),
+            else json.dumps(self.__message_raw),
             bucket=self.__environ_context.deploy_bucket,
         )
 
@@ -0,0 +1,38 @@
+"""
+Custom typing for ISO20022 pacs.002 status reports
+"""
+
+
+class TypeStatusReportHeader:
+    """
+    Group header of a pacs.002 status report and the identifiers of the
+    original message it reports on
+    """
+
+    def __init__(
+        self,
+        message_id: str,
+        created_at: str,
+        original_message_id: str,
+        original_message_name_id: str,
+    ) -> None:
+        self.__message_id = message_id
+        self.__created_at = created_at
+        self.__original_message_id = original_message_id
+        self.__original_message_name_id = original_message_name_id
+
+    @property
+    def message_id(self) -> str:
+        return self.__message_id
+
+    @property
+    def created_at(self) -> str:
+        return self.__created_at
+
+    @property
+    def original_message_id(self) -> str:
+        return self.__original_message_id
+
+    @property
+    def original_message_name_id(self) -> str:
+        return self.__original_message_name_id
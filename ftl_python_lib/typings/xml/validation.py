@@ -0,0 +1,101 @@
+"""
+XML validation result type definitions
+"""
+
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Union
+
+
+class TypeXmlValidationError:
+    """
+    Single validation or syntax error reported by lxml
+    """
+
+    def __init__(
+        self,
+        message: str,
+        line: Optional[int],
+        column: Optional[int],
+        path: Optional[str],
+        level: Optional[str],
+    ) -> None:
+        self.__message = message
+        self.__line = line
+        self.__column = column
+        self.__path = path
+        self.__level = level
+
+    @staticmethod
+    def from_log_entry(entry) -> "TypeXmlValidationError":
+        """
+        Build the error from an lxml error log entry
+        """
+
+        return TypeXmlValidationError(
+            message=entry.message,
+            line=entry.line,
+            column=entry.column,
+            path=entry.path,
+            level=entry.level_name,
+        )
+
+    @property
+    def message(self) -> str:
+        return self.__message
+
+    @property
+    def line(self) -> Optional[int]:
+        return self.__line
+
+    @property
+    def column(self) -> Optional[int]:
+        return self.__column
+
+    @property
+    def path(self) -> Optional[str]:
+        return self.__path
+
+    @property
+    def level(self) -> Optional[str]:
+        return self.__level
+
+    def to_dict(self) -> Dict[str, Union[str, int, None]]:
+        return {
+            "message": self.__message,
+            "line": self.__line,
+            "column": self.__column,
+            "path": self.__path,
+            "level": self.__level,
+        }
+
+    def __repr__(self) -> str:
+        return f"{self.__line}:{self.__column} {self.__path} {self.__message}"
+
+
+class TypeXmlValidationResult:
+    """
+    Outcome of an XML validation; truthy when the document is valid
+    """
+
+    def __init__(self, valid: bool, errors: List[TypeXmlValidationError]) -> None:
+        self.__valid = valid
+        self.__errors = errors
+
+    @property
+    def valid(self) -> bool:
+        return self.__valid
+
+    @property
+    def errors(self) -> List[TypeXmlValidationError]:
+        return self.__errors
+
+    def __bool__(self) -> bool:
+        return self.__valid
+
+    def to_dict(self) -> Dict[str, Union[bool, List[Dict]]]:
+        return {
+            "valid": self.__valid,
+            "errors": [error.to_dict() for error in self.__errors],
+        }
@@ -0,0 +1,31 @@
+"""
+Utility for counting str <-> bytes conversions
+"""
+
+from contextvars import ContextVar
+
+_CONVERSIONS: ContextVar = ContextVar("ftl_conversions", default=0)
+
+
+class UtilsConversionCounter:
+    """
+    Count str <-> bytes conversions of the current thread or task
+    Compare two readings to get the conversions done in between,
+    e.g. while processing one message
+    """
+
+    @staticmethod
+    def increment() -> None:
+        """
+        Record one conversion
+        """
+
+        _CONVERSIONS.set(_CONVERSIONS.get() + 1)
+
+    @staticmethod
+    def count() -> int:
+        """
+        Return the number of conversions recorded so far
+        """
+
+        return _CONVERSIONS.get()
@@ -0,0 +1,73 @@
+"""
+Utilities for keyset (seek) pagination of SQLAlchemy queries
+"""
+
+from typing import Iterator
+from typing import List
+from typing import Optional
+
+from sqlalchemy import and_
+from sqlalchemy import asc
+from sqlalchemy.orm import Query
+
+from ftl_python_lib.core.log import LOGGER
+
+
+class UtilsKeysetPagination:
+    """
+    Paginate queries by seeking past the last key seen instead of using
+    OFFSET, so every batch is an index range scan of at most `batch_size` rows
+    """
+
+    @staticmethod
+    def paginate(
+        query: Query,
+        key_column,
+        after: Optional[str] = None,
+        limit: Optional[int] = None,
+        batch_size: int = 500,
+    ) -> Iterator:
+        """
+        Yield the live rows of `query` ordered by `key_column`, starting after
+        `after`, loading `batch_size` rows at a time; no cursor is held between
+        batches. Rows soft deleted on the model of `key_column` are skipped
+        :param query: Query to paginate
+        :type query: Query
+        :param key_column: Unique, indexed column to seek on
+        :param after: Last key of the previous page, None to start from the first row
+        :type after: Optional[str]
+        :param limit: Maximum number of rows, None for every row
+        :type limit: Optional[int]
+        :param batch_size: Number of rows loaded per round trip
+        :type batch_size: int
+        """
+
+        model = key_column.class_
+        query = query.filter(
+            and_(
+                key_column.isnot(None),
+                model.deleted_by.is_(None),
+                model.deleted_at.is_(None),
+            )
+        ).order_by(None)
+
+        while limit is None or limit > 0:
+            size: int = batch_size if limit is None else min(batch_size, limit)
+            seek: Query = query if after is None else query.filter(key_column > after)
+
+            try:
+                batch: List = seek.order_by(asc(key_column)).limit(size).all()
+            except Exception as exc:
+                LOGGER.logger.error(
+                    f"Unexpected error when get page of {model.__tablename__}: {exc}"
+                )
+                raise exc
+
+            yield from batch
+
+            if len(batch) < size:
+                return
+
+            after = getattr(batch[-1], key_column.key)
+            if limit is not None:
+                limit -= size
@@ -3,8 +3,10 @@ Utilities for converting data types to bytes (array)
 """
 
 from typing import Optional
+from typing import Union
 
 from ftl_python_lib.core.log import LOGGER
+from ftl_python_lib.utils.conversion_counter import UtilsConversionCounter
 
 
 class UtilsConversionsToBytes:
@@ -13,20 +15,24 @@ class UtilsConversionsToBytes:
     """
 
     @staticmethod
-    def str_to_bytes(src: str) -> Optional[bytes]:
+    def str_to_bytes(src: Union[str, bytes, bytearray, memoryview]) -> Optional[bytes]:
         """
-        Convert bytes to string
+        Convert string to bytes, returning bytes as they are
+        Other bytes-like objects are copied to bytes without any decoding,
+        lxml's feed parser and bytes.count do not take a memoryview
         :param src: Source data
-        :type src: str
-        :param encoding: Result's encoding
-        :type encoding: bytes
+        :type src: Union[str, bytes, bytearray, memoryview]
         """
 
         if src is None:
             LOGGER.logger.warning("Empty str will not be converted to bytes")
 
             return None
+        if isinstance(src, bytes):
+            return src
+        if isinstance(src, (bytearray, memoryview)):
+            return bytes(src)
 
-        LOGGER.logger.debug("Converting string to bytes")
+        UtilsConversionCounter.increment()
 
         return src.encode()
@@ -6,13 +6,14 @@ from typing import Optional
 from typing import Union
 
 from ftl_python_lib.core.log import LOGGER
+from ftl_python_lib.utils.conversion_counter import UtilsConversionCounter
 
 
 def bytes_to_str(
     src: Union[bytes, str], encoding: Optional[str] = "utf-8"
 ) -> Optional[str]:
     """
-    Convert bytes to string
+    Convert bytes to string, returning strings as they are
     :param src: Source data
     :type src: bytes
     :param encoding: Result's encoding
@@ -24,10 +25,8 @@ def bytes_to_str(
 
         return None
     if isinstance(src, str):
-        LOGGER.logger.warning("Source data is already a string")
+        return src
 
-        return str
+    UtilsConversionCounter.increment()
 
-    LOGGER.logger.debug("Converting bytes to string")
-
-    return src.decode(encoding=encoding)
+    return str(src, encoding=encoding)
@@ -0,0 +1,96 @@
+"""
+Utility for caching values for a limited time
+"""
+
+import threading
+import time
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Hashable
+from typing import Optional
+from typing import Tuple
+
+from ftl_python_lib.core.log import LOGGER
+
+
+class UtilsTtlCache:
+    """
+    Thread-safe, process-wide cache with a time to live
+    Concurrent misses on the same key are collapsed: only one caller runs
+    the loader, the others wait for it and reuse its value
+    :param __ttl: Seconds a cached value stays valid
+    :type __ttl: float
+    """
+
+    def __init__(self, ttl: float) -> None:
+        """
+        Constructor
+        :param ttl: Seconds a cached value stays valid
+        :type ttl: float
+        """
+
+        self.__ttl = ttl
+        self.__entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self.__locks: Dict[Hashable, threading.Lock] = {}
+        self.__locks_lock: threading.Lock = threading.Lock()
+        self.__generation: int = 0
+
+    def __get_fresh(self, key: Hashable) -> Tuple[bool, Any]:
+        entry: Optional[Tuple[float, Any]] = self.__entries.get(key)
+
+        if entry is not None and entry[0] > time.monotonic():
+            return True, entry[1]
+
+        return False, None
+
+    def __get_lock(self, key: Hashable) -> threading.Lock:
+        with self.__locks_lock:
+            return self.__locks.setdefault(key, threading.Lock())
+
+    def get(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Return the cached value of `key`, calling `loader` to refresh it
+        when it is missing or expired
+        :param key: Cache key
+        :type key: Hashable
+        :param loader: Function computing the value
+        :type loader: Callable[[], Any]
+        """
+
+        found, value = self.__get_fresh(key)
+
+        if found:
+            return value
+
+        with self.__get_lock(key):
+            found, value = self.__get_fresh(key)
+
+            if found:
+                return value
+
+            LOGGER.logger.debug(f"Cache miss for {key}")
+
+            generation: int = self.__generation
+            value = loader()
+
+            # Skip storing a value computed across an invalidation
+            if generation == self.__generation and self.__ttl > 0:
+                self.__entries[key] = (time.monotonic() + self.__ttl, value)
+
+            return value
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """
+        Drop one cached key, or every key when `key` is None
+        :param key: Cache key
+        :type key: Optional[Hashable]
+        """
+
+        with self.__locks_lock:
+            self.__generation += 1
+
+            if key is None:
+                self.__entries.clear()
+            else:
+                self.__entries.pop(key, None)
@@ -0,0 +1,217 @@
+"""
+Utility for extracting a few fields from XML without building a dict
+"""
+
+import io
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+from lxml import etree
+
+from ftl_python_lib.utils.to_bytes import UtilsConversionsToBytes
+
+
+class UtilsXmlFieldExtractor:
+    """
+    Extract declared fields in one streaming iterparse pass
+    Paths are compiled once into tuples of local names, e.g.
+    "Document/FIToFICstmrCdtTrf/CdtTrfTxInf/IntrBkSttlmAmt/@Ccy";
+    namespaces are ignored and the first occurrence of a path wins;
+    once every field has been found the rest of the document is only
+    checked for well-formedness, so truncated input is still rejected
+    :param __paths: Paths of the fields to extract
+    :type __paths: List[str]
+    """
+
+    def __init__(self, paths: Iterable[str]) -> None:
+        """
+        Constructor
+        :param paths: Paths of the fields to extract
+        :type paths: Iterable[str]
+        """
+
+        self.__paths: List[str] = list(paths)
+        # element path -> [(field index, attribute name or None for text)]
+        self.__compiled: Dict[Tuple[str, ...], List[Tuple[int, Optional[str]]]] = {}
+
+        for index, path in enumerate(self.__paths):
+            segments: List[str] = path.split("/")
+            attribute: Optional[str] = None
+
+            if segments[-1].startswith("@"):
+                attribute = segments.pop()[1:]
+
+            self.__compiled.setdefault(tuple(segments), []).append((index, attribute))
+
+    @staticmethod
+    def __local_name(tag: str) -> str:
+        return tag.rsplit("}", 1)[-1]
+
+    @staticmethod
+    def __iterparse(src: Union[bytes, str]):
+        src = UtilsConversionsToBytes.str_to_bytes(src=src)
+
+        return etree.iterparse(
+            io.BytesIO(src),
+            events=("start", "end"),
+            resolve_entities=False,
+            no_network=True,
+            load_dtd=False,
+            huge_tree=False,
+        )
+
+    @staticmethod
+    def __release(element) -> None:
+        # Drop what has been read to keep memory flat on large documents
+        element.clear()
+        while element.getprevious() is not None:
+            del element.getparent()[0]
+
+    def __read(
+        self, element, path: Tuple[str, ...], start: bool, values: List[Optional[str]]
+    ) -> int:
+        found: int = 0
+
+        for index, attribute in self.__compiled.get(path, ()):
+            if values[index] is not None or start == (attribute is None):
+                continue
+
+            values[index] = element.get(attribute) if start else element.text
+
+            if values[index] is not None:
+                found += 1
+
+        return found
+
+    def extract(self, src: Union[bytes, str]) -> Dict[str, Optional[str]]:
+        """
+        Return the value of every declared path, None when it is missing
+        :param src: XML content
+        :type src: Union[bytes, str]
+        """
+
+        values: List[Optional[str]] = [None] * len(self.__paths)
+        remaining: int = len(self.__paths)
+        stack: List[str] = []
+
+        for event, element in UtilsXmlFieldExtractor.__iterparse(src):
+            start: bool = event == "start"
+
+            if start:
+                stack.append(UtilsXmlFieldExtractor.__local_name(element.tag))
+
+            if remaining > 0:
+                remaining -= self.__read(element, tuple(stack), start, values)
+
+            if not start:
+                stack.pop()
+                UtilsXmlFieldExtractor.__release(element)
+
+        return dict(zip(self.__paths, values))
+
+    def iterate(
+        self, src: Union[bytes, str], record_path: str
+    ) -> Iterator[Tuple[Optional[str], ...]]:
+        """
+        Yield, for every element at `record_path`, the declared paths
+        (relative to that element) as a tuple in declaration order
+        Records are released once read, so memory stays flat whatever
+        the number of records
+        :param src: XML content
+        :type src: Union[bytes, str]
+        :param record_path: Path of the repeated element
+        :type record_path: str
+        """
+
+        record: Tuple[str, ...] = tuple(record_path.split("/"))
+        depth: int = len(record)
+        values: Optional[List[Optional[str]]] = None
+        stack: List[str] = []
+
+        for event, element in UtilsXmlFieldExtractor.__iterparse(src):
+            start: bool = event == "start"
+
+            if start:
+                stack.append(UtilsXmlFieldExtractor.__local_name(element.tag))
+
+                if values is None and tuple(stack) == record:
+                    values = [None] * len(self.__paths)
+
+            if values is not None and len(stack) > depth:
+                self.__read(element, tuple(stack[depth:]), start, values)
+
+            if start:
+                continue
+
+            if values is not None and len(stack) == depth:
+                yield tuple(values)
+                values = None
+
+            stack.pop()
+            UtilsXmlFieldExtractor.__release(element)
+
+    def iterate_dict(
+        self, src: dict, record_path: str
+    ) -> Iterator[Tuple[Optional[str], ...]]:
+        """
+        Same as iterate() for an xmltodict-like dict, where a repeated
+        element is either a dict or a list of dicts
+        :param src: Parsed message
+        :type src: dict
+        :param record_path: Path of the repeated element
+        :type record_path: str
+        """
+
+        records = src
+
+        for segment in record_path.split("/"):
+            if not isinstance(records, dict):
+                return
+
+            records = records.get(segment)
+
+        if isinstance(records, dict):
+            records = [records]
+
+        if not isinstance(records, list):
+            return
+
+        for record in records:
+            yield tuple(
+                UtilsXmlFieldExtractor.from_dict(src=record, path=path)
+                for path in self.__paths
+            )
+
+    @staticmethod
+    def from_dict(src: dict, path: str) -> Optional[str]:
+        """
+        Read a path from an xmltodict-like dict, taking the first item of lists
+        :param src: Parsed message
+        :type src: dict
+        :param path: Path of the field
+        :type path: str
+        """
+
+        value = src
+
+        for segment in path.split("/"):
+            if isinstance(value, list):
+                value = value[0] if len(value) > 0 else None
+
+            if not isinstance(value, dict):
+                return None
+
+            value = value.get(segment)
+
+        if isinstance(value, list):
+            value = value[0] if len(value) > 0 else None
+
+        if isinstance(value, dict):
+            value = value.get("#text")
+
+        return value
@@ -0,0 +1,87 @@
+"""
+Utility for parsing untrusted XML
+"""
+
+import threading
+from typing import Optional
+from typing import Union
+
+from lxml import etree
+
+from ftl_python_lib.utils.to_bytes import UtilsConversionsToBytes
+
+_PARSERS: threading.local = threading.local()
+
+SNIFF_CHUNK_SIZE: int = 1024
+
+
+class UtilsXmlParser:
+    """
+    Parse XML from memory with a hardened parser: no entity expansion,
+    no network access, no DTD loading and no huge trees
+    Parsers are kept per thread since lxml parser objects are not meant
+    to be used by several threads at once
+    """
+
+    @staticmethod
+    def hardened() -> etree.XMLParser:
+        """
+        Return the hardened parser of the current thread
+        """
+
+        parser: etree.XMLParser = getattr(_PARSERS, "parser", None)
+
+        if parser is None:
+            parser = etree.XMLParser(
+                resolve_entities=False,
+                no_network=True,
+                load_dtd=False,
+                huge_tree=False,
+            )
+            _PARSERS.parser = parser
+
+        return parser
+
+    @staticmethod
+    def fromstring(src: Union[bytes, str]) -> etree._Element:
+        """
+        Parse in-memory XML with the hardened parser
+        :param src: XML content
+        :type src: Union[bytes, str]
+        """
+
+        src = UtilsConversionsToBytes.str_to_bytes(src=src)
+
+        return etree.fromstring(src, parser=UtilsXmlParser.hardened())
+
+    @staticmethod
+    def sniff_namespace(src: Union[bytes, str], tag: str = "Document") -> Optional[str]:
+        """
+        Return the namespace of the first `tag` element, reading the
+        document only up to that element's start tag
+        :param src: XML content
+        :type src: Union[bytes, str]
+        :param tag: Local name of the element
+        :type tag: str
+        """
+
+        src = UtilsConversionsToBytes.str_to_bytes(src=src)
+        parser: etree.XMLPullParser = etree.XMLPullParser(
+            events=("start",),
+            resolve_entities=False,
+            no_network=True,
+            load_dtd=False,
+            huge_tree=False,
+        )
+
+        # Feed small chunks and stop at the element, the rest is never read
+        for offset in range(0, len(src), SNIFF_CHUNK_SIZE):
+            parser.feed(src[offset : offset + SNIFF_CHUNK_SIZE])
+
+            for _, element in parser.read_events():
+                qname: etree.QName = etree.QName(element)
+
+                if qname.localname == tag:
+                    return qname.namespace
+
+        return None
@@ -1,28 +1,260 @@
 """
 Utility for XML processing
+The XML <-> dict codec is selected with FTL_XML_CODEC; every codec
+produces the xmltodict dict shape ("@attr" keys, "#text" for text
+next to attributes or children, lists for repeated elements)
 """
 
 from typing import Dict
+from typing import List
+from typing import Optional
 from typing import Union
 
 import xmltodict
+from lxml import etree
 
-from ftl_python_lib.utils.to_str import bytes_to_str
+from ftl_python_lib.constants.xml import ConstantsXmlCodec
+from ftl_python_lib.core.context.environment import EnvironmentContext
+from ftl_python_lib.utils.to_bytes import UtilsConversionsToBytes
+from ftl_python_lib.utils.xml.parser import UtilsXmlParser
+
+ENVIRON_CONTEXT: EnvironmentContext = EnvironmentContext()
+
+
+class UtilsXmlCodecXmltodict:
+    """
+    Pure Python codec backed by xmltodict
+    """
+
+    @staticmethod
+    def unparse(src: Union[Dict[str, str], dict]) -> str:
+        return xmltodict.unparse(input_dict=src)
+
+    @staticmethod
+    def parse(src: Union[str, bytes]) -> Union[Dict[str, str], dict]:
+        # expat reads bytes directly, honouring the XML declaration encoding
+        return xmltodict.parse(xml_input=src)
+
+
+class UtilsXmlCodecLxml:
+    """
+    Codec backed by lxml, parsing in C and producing the xmltodict shape
+    Namespaces are not processed: tags keep their prefix ("p:Tag") and
+    declarations show up as "@xmlns" / "@xmlns:p" attributes.
+    lxml cannot write names it cannot resolve, e.g. a prefix that is not
+    declared in the dict; unparse then falls back to xmltodict, which
+    writes them as-is
+    """
+
+    @staticmethod
+    def __tag_name(element) -> str:
+        tag: str = element.tag
+
+        if tag[0] == "{":
+            tag = tag.split("}", 1)[1]
+
+        return tag if element.prefix is None else element.prefix + ":" + tag
+
+    @staticmethod
+    def __attribute_name(element, name: str) -> str:
+        if name[0] != "{":
+            return name
+
+        uri, local = name[1:].split("}", 1)
+
+        for prefix, value in element.nsmap.items():
+            if value == uri and prefix is not None:
+                return prefix + ":" + local
+
+        return local
+
+    @staticmethod
+    def __to_dict(
+        element, parent_nsmap: Optional[Dict[Optional[str], str]], nested: bool
+    ):
+        """
+        Convert an element; namespace declarations are looked up only when
+        `parent_nsmap` is given, i.e. for the root and, when the document
+        has `nested` declarations, for every element, which spares building
+        every element's nsmap (the costly part of the walk) in the common case
+        """
+
+        item: dict = {}
+        nsmap: Optional[Dict[Optional[str], str]] = None
+
+        if parent_nsmap is not None:
+            nsmap = element.nsmap
+
+            for prefix, uri in nsmap.items():
+                if parent_nsmap.get(prefix) != uri:
+                    item["@xmlns" if prefix is None else "@xmlns:" + prefix] = uri
+
+        for name, value in element.attrib.items():
+            item["@" + UtilsXmlCodecLxml.__attribute_name(element, name)] = value
+
+        text: Optional[str] = element.text
+        tails: List[str] = []
+
+        for child in element:
+            if child.tail is not None:
+                tails.append(child.tail)
+
+            if not isinstance(child.tag, str):
+                continue
+
+            key: str = UtilsXmlCodecLxml.__tag_name(child)
+            value = UtilsXmlCodecLxml.__to_dict(
+                child, nsmap if nested else None, nested
+            )
+
+            if key not in item:
+                item[key] = value
+            elif isinstance(item[key], list):
+                item[key].append(value)
+            else:
+                item[key] = [item[key], value]
+
+        if len(tails) > 0:
+            text = (text or "") + "".join(tails)
+
+        text = text.strip() if text is not None else ""
+
+        if len(item) == 0:
+            return text if len(text) > 0 else None
+
+        if len(text) > 0:
+            item["#text"] = text
+
+        return item
+
+    @staticmethod
+    def __clark_name(name: str, scope: Dict[Optional[str], str], default: bool) -> str:
+        # "p:Tag" -> "{uri}Tag"; unprefixed attributes have no namespace
+        prefix, _, local = name.rpartition(":")
+        uri: Optional[str] = scope.get(prefix or None) if prefix or default else None
+
+        return name if uri is None else "{" + uri + "}" + local
+
+    @staticmethod
+    def __to_text(value) -> Optional[str]:
+        if value is None:
+            return None
+        if isinstance(value, bool):
+            return "true" if value else "false"
+
+        return str(value)
+
+    @staticmethod
+    def __to_element(
+        parent, name: str, value, nsmap: Dict[Optional[str], str]
+    ) -> Optional[etree._Element]:
+        if isinstance(value, list):
+            for item in value:
+                UtilsXmlCodecLxml.__to_element(parent, name, item, nsmap)
+            return None
+
+        attributes: Dict[str, str] = {}
+        declared: Dict[Optional[str], str] = {}
+        children: dict = {}
+        text: Optional[str] = None
+
+        if isinstance(value, dict):
+            for key, item in value.items():
+                if key == "#text":
+                    text = UtilsXmlCodecLxml.__to_text(item)
+                elif key == "@xmlns":
+                    declared[None] = item
+                elif key.startswith("@xmlns:"):
+                    declared[key[7:]] = item
+                elif key.startswith("@"):
+                    attributes[key[1:]] = UtilsXmlCodecLxml.__to_text(item)
+                else:
+                    children[key] = item
+        else:
+            text = UtilsXmlCodecLxml.__to_text(value)
+
+        scope: Dict[Optional[str], str] = (
+            {**nsmap, **declared} if len(declared) > 0 else nsmap
+        )
+        tag: str = UtilsXmlCodecLxml.__clark_name(name, scope, default=True)
+
+        if parent is None:
+            element = etree.Element(tag, nsmap=declared or None)
+        else:
+            element = etree.SubElement(parent, tag, nsmap=declared or None)
+
+        for key, item in attributes.items():
+            element.set(UtilsXmlCodecLxml.__clark_name(key, scope, default=False), item)
+
+        for key, item in children.items():
+            UtilsXmlCodecLxml.__to_element(element, key, item, scope)
+
+        # Like xmltodict: text goes after the children, empty elements
+        # are written as a start and an end tag
+        if len(element) > 0:
+            element[-1].tail = text
+        else:
+            element.text = text if text is not None else ""
+
+        return element
+
+    @staticmethod
+    def unparse(src: Union[Dict[str, str], dict]) -> str:
+        if len(src) != 1:
+            raise ValueError("Document must have exactly one root")
+
+        name, value = next(iter(src.items()))
+
+        try:
+            root = UtilsXmlCodecLxml.__to_element(None, name, value, {})
+        except ValueError:
+            # Invalid tag or attribute name for lxml, e.g. an undeclared prefix
+            return UtilsXmlCodecXmltodict.unparse(src=src)
+
+        return '<?xml version="1.0" encoding="utf-8"?>\n' + etree.tostring(
+            root, encoding="unicode"
+        )
+
+    @staticmethod
+    def parse(src: Union[str, bytes]) -> Union[Dict[str, str], dict]:
+        src = UtilsConversionsToBytes.str_to_bytes(src=src)
+
+        root = UtilsXmlParser.fromstring(src=src)
+        # Declarations below the root are only tracked when the root does not hold them all
+        nested: bool = src.count(b"xmlns") > len(root.nsmap)
+
+        return {
+            UtilsXmlCodecLxml.__tag_name(root): UtilsXmlCodecLxml.__to_dict(
+                root, {}, nested
+            )
+        }
+
+
+XML_CODECS: Dict[str, type] = {
+    ConstantsXmlCodec.XMLTODICT.value: UtilsXmlCodecXmltodict,
+    ConstantsXmlCodec.LXML.value: UtilsXmlCodecLxml,
+}
+
+
+def get_codec() -> type:
+    """
+    Return the codec selected with FTL_XML_CODEC, xmltodict by default
+    """
+
+    return XML_CODECS.get(ENVIRON_CONTEXT.ftl_xml_codec, UtilsXmlCodecXmltodict)
 
 
 def unparse(src: Union[Dict[str, str], dict]) -> str:
     """
     Convert Python dict to XML string
     """
-    return xmltodict.unparse(input_dict=src)
+
+    return get_codec().unparse(src=src)
 
 
 def parse(src: Union[str, bytes]) -> Union[Dict[str, str], dict]:
     """
-    Convert Python dict to XML string
+    Convert XML string to Python dict
     """
 
-    if isinstance(src, bytes):
-        return xmltodict.parse(xml_input=bytes_to_str(src=src))
-
-    return xmltodict.parse(xml_input=src)
+    return get_codec().parse(src=src)
@@ -0,0 +1,166 @@
+"""
+Utility for caching compiled XSD schemas
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+from lxml import etree
+
+from ftl_python_lib.core.context.environment import EnvironmentContext
+from ftl_python_lib.core.log import LOGGER
+from ftl_python_lib.utils.to_bytes import UtilsConversionsToBytes
+from ftl_python_lib.utils.xml.parser import UtilsXmlParser
+
+
+class UtilsXmlCompiledSchema:
+    """
+    Compiled XSD schema shared between threads
+    lxml releases the GIL while parsing and a compiled XMLSchema can be
+    used from any thread, but every validate() call resets and fills the
+    schema's error_log; validation is therefore serialized per schema so
+    the result and its error log always belong to the same document
+    :param __schema: Compiled schema
+    :type __schema: etree.XMLSchema
+    """
+
+    __slots__ = ("__schema", "__lock")
+
+    def __init__(self, schema: etree.XMLSchema) -> None:
+        """
+        Constructor
+        :param schema: Compiled schema
+        :type schema: etree.XMLSchema
+        """
+
+        self.__schema = schema
+        self.__lock: threading.Lock = threading.Lock()
+
+    def validate(self, document) -> Tuple[bool, List]:
+        """
+        Validate a parsed document, returning the result and a copy of the error log
+        :param document: Parsed XML document or element
+        """
+
+        with self.__lock:
+            result: bool = self.__schema.validate(document)
+
+            return result, list(self.__schema.error_log)
+
+
+class UtilsXmlSchemaCache:
+    """
+    Thread-safe, process-wide LRU of compiled XSD schemas, keyed by the
+    SHA-256 of the XSD bytes or by an explicit key (e.g. message unique_key)
+    Concurrent misses on the same key compile the schema only once
+    :param __max_size: Maximum number of compiled schemas kept
+    :type __max_size: int
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """
+        Constructor
+        :param max_size: Maximum number of compiled schemas kept
+        :type max_size: int
+        """
+
+        self.__max_size = max_size
+        self.__entries: OrderedDict = OrderedDict()
+        self.__entries_lock: threading.Lock = threading.Lock()
+        self.__locks: Dict[str, threading.Lock] = {}
+        self.__hits: int = 0
+        self.__misses: int = 0
+        self.__evictions: int = 0
+
+    def __get_cached(self, key: str) -> Optional[UtilsXmlCompiledSchema]:
+        with self.__entries_lock:
+            schema: Optional[UtilsXmlCompiledSchema] = self.__entries.get(key)
+
+            if schema is not None:
+                self.__entries.move_to_end(key)
+                self.__hits += 1
+
+            return schema
+
+    def __get_lock(self, key: str) -> threading.Lock:
+        with self.__entries_lock:
+            return self.__locks.setdefault(key, threading.Lock())
+
+    def get(
+        self, xsd: Union[bytes, str], key: Optional[str] = None
+    ) -> UtilsXmlCompiledSchema:
+        """
+        Return the compiled schema for `xsd`, compiling it on a miss
+        :param xsd: XSD schema
+        :type xsd: Union[bytes, str]
+        :param key: Cache key, defaults to the SHA-256 of the XSD bytes
+        :type key: Optional[str]
+        """
+
+        xsd = UtilsConversionsToBytes.str_to_bytes(src=xsd)
+
+        if key is None:
+            key = hashlib.sha256(xsd).hexdigest()
+
+        schema: Optional[UtilsXmlCompiledSchema] = self.__get_cached(key)
+
+        if schema is not None:
+            return schema
+
+        lock: threading.Lock = self.__get_lock(key)
+
+        with lock:
+            schema = self.__get_cached(key)
+
+            if schema is not None:
+                return schema
+
+            LOGGER.logger.debug(f"Compiling XSD schema {key}")
+
+            schema = UtilsXmlCompiledSchema(
+                schema=etree.XMLSchema(etree=UtilsXmlParser.fromstring(src=xsd))
+            )
+
+            with self.__entries_lock:
+                self.__misses += 1
+                self.__entries[key] = schema
+                self.__locks.pop(key, None)
+
+                while len(self.__entries) > self.__max_size:
+                    self.__entries.popitem(last=False)
+                    self.__evictions += 1
+
+            return schema
+
+    def statistics(self) -> Dict[str, int]:
+        """
+        Return a snapshot of the cache usage statistics
+        """
+
+        with self.__entries_lock:
+            return {
+                "size": len(self.__entries),
+                "max_size": self.__max_size,
+                "hits": self.__hits,
+                "misses": self.__misses,
+                "evictions": self.__evictions,
+            }
+
+    def clear(self) -> None:
+        """
+        Drop every compiled schema
+        """
+
+        with self.__entries_lock:
+            self.__entries.clear()
+
+
+XML_SCHEMA_CACHE: UtilsXmlSchemaCache = UtilsXmlSchemaCache(
+    max_size=EnvironmentContext().ftl_xml_schema_cache_size
+)
@@ -3,9 +3,21 @@ PACS-008 & PACS-002 messages conversions
 """
 
 import copy
+import io
+from typing import Any
+from typing import BinaryIO
 from typing import Dict
+from typing import Iterable
+from typing import Optional
+from typing import Tuple
 from typing import Union
 
+from lxml import etree
+
+from ftl_python_lib.typings.iso20022.status_report import TypeStatusReportHeader
+
+PACS_002_NAMESPACE: str = "urn:iso:std:iso:20022:tech:xsd:pacs.002.001.12"
+
 
 def pacs_008_to_pacs_002(
     src: Union[Dict[str, str], dict]
@@ -15,6 +27,76 @@ def pacs_008_to_pacs_002(
             f"Received invalid type '{type(src).__name__}'. Must be 'dict'"
         )
     res = copy.deepcopy(src)
-    res["Document"]["@xmlns"] = "urn:iso:std:iso:20022:tech:xsd:pacs.002.001.12"
+    res["Document"]["@xmlns"] = PACS_002_NAMESPACE
 
     return res
+
+
+def _write_element(writer, tag: str, text: Optional[str]) -> None:
+    if text is None:
+        return
+
+    with writer.element(tag):
+        writer.write(text)
+
+
+def pacs_002_status_report(
+    header: TypeStatusReportHeader,
+    transactions: Iterable[Tuple[Any, str, Optional[str]]],
+    group_status: Optional[str] = None,
+    output: Optional[BinaryIO] = None,
+) -> Optional[bytes]:
+    """
+    Build a pacs.002 FIToFIPmtStsRpt for a pacs.008, streaming the XML
+    through lxml.etree.xmlfile instead of copying the original document
+    :param header: MsgId and CreDtTm of the status report, MsgId and
+        message name (e.g. pacs.008.001.10) of the original pacs.008
+    :type header: TypeStatusReportHeader
+    :param transactions: (transaction, status, reason code) per original
+        transaction; transaction exposes instruction_id, end_to_end_id and
+        transaction_id, like TypeReceivedMessageTransaction
+    :type transactions: Iterable[Tuple[Any, str, Optional[str]]]
+    :param group_status: Status of the whole group, if any
+    :type group_status: Optional[str]
+    :param output: Binary stream to write to, the XML is returned when None
+    :type output: Optional[BinaryIO]
+    """
+
+    target: BinaryIO = output if output is not None else io.BytesIO()
+
+    with etree.xmlfile(target, encoding="UTF-8") as writer:
+        writer.write_declaration()
+
+        with writer.element("Document", nsmap={None: PACS_002_NAMESPACE}):
+            with writer.element("FIToFIPmtStsRpt"):
+                with writer.element("GrpHdr"):
+                    _write_element(writer, "MsgId", header.message_id)
+                    _write_element(writer, "CreDtTm", header.created_at)
+
+                with writer.element("OrgnlGrpInfAndSts"):
+                    _write_element(writer, "OrgnlMsgId", header.original_message_id)
+                    _write_element(
+                        writer, "OrgnlMsgNmId", header.original_message_name_id
+                    )
+                    _write_element(writer, "GrpSts", group_status)
+
+                for transaction, status, reason in transactions:
+                    with writer.element("TxInfAndSts"):
+                        _write_element(
+                            writer, "OrgnlInstrId", transaction.instruction_id
+                        )
+                        _write_element(
+                            writer, "OrgnlEndToEndId", transaction.end_to_end_id
+                        )
+                        _write_element(writer, "OrgnlTxId", transaction.transaction_id)
+                        _write_element(writer, "TxSts", status)
+
+                        if reason is not None:
+                            with writer.element("StsRsnInf"):
+                                with writer.element("Rsn"):
+                                    _write_element(writer, "Cd", reason)
+
+    if output is None:
+        return target.getvalue()
+
+    return None
@@ -2,87 +2,67 @@
 Utility for XML validation
 """
 
-import os
-import tempfile
+from collections import deque
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
 from types import TracebackType
+from typing import Deque
+from typing import Iterable
+from typing import Iterator
+from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Type
 from typing import Union
-from xml.etree import ElementTree
 
 from lxml import etree
 
 from ftl_python_lib.core.log import LOGGER
-from ftl_python_lib.utils.to_str import bytes_to_str
+from ftl_python_lib.typings.xml.validation import TypeXmlValidationError
+from ftl_python_lib.typings.xml.validation import TypeXmlValidationResult
+from ftl_python_lib.utils.xml.parser import UtilsXmlParser
+from ftl_python_lib.utils.xml.schema_cache import XML_SCHEMA_CACHE
+from ftl_python_lib.utils.xml.schema_cache import UtilsXmlCompiledSchema
 
 
 class UtilsXmlValidation:
     """
     Validate XML using XSD schema
+    Both documents are parsed from memory; the context manager API is
+    kept for compatibility and no longer touches the disk
     """
 
-    # XML path on local disk
-    __xmlp: str = None
-    # XSD path on local disk
-    __xsdp: str = None
-    # etree Schema
-    __xmlschema: etree.XMLSchema = None
+    # Compiled schema, shared through the process-wide cache
+    __xmlschema: UtilsXmlCompiledSchema = None
 
-    def __init__(self, xsd: Union[bytes, str], xml: Union[bytes, str]) -> None:
+    def __init__(
+        self,
+        xsd: Union[bytes, str],
+        xml: Union[bytes, str],
+        key: Optional[str] = None,
+    ) -> None:
         """
         Constructor
         :param xsd: XSD schema
         :type xsd: Union[bytes, str]
         :param xml: XML which needs to be validated
         :type xml: Union[bytes, str]
+        :param key: Schema cache key (e.g. message unique_key), defaults to the XSD hash
+        :type key: Optional[str]
         """
 
         LOGGER.logger.debug("Constructing new XML Validation")
 
         self.__xsd = xsd
         self.__xml = xml
+        self.__key = key
 
     def __enter__(self):
         """
         Entry point of the context
         """
 
-        # Saving XSD to file
-        LOGGER.logger.debug("Writing XSD to file")
-
-        with tempfile.NamedTemporaryFile(mode="w+", delete=False) as tmp_xsd:
-            if isinstance(self.__xsd, bytes):
-                LOGGER.logger.debug("XSD is in bytes format. Converting")
-
-                tmp_xsd.write(bytes_to_str(src=self.__xsd))
-            else:
-                LOGGER.logger.debug("XSD is in string format. Skip conversion")
-
-                tmp_xsd.write(self.__xsd)
-
-            self.__xsdp = tmp_xsd.name
-
-            LOGGER.logger.debug(f"XSD written to file {self.__xsdp}")
-
-        _xsd: ElementTree = etree.parse(source=self.__xsdp)
-        self.__xmlschema = etree.XMLSchema(etree=_xsd)
-
-        # Saving XML to file
-        LOGGER.logger.debug("Writing XML to file")
-
-        with tempfile.NamedTemporaryFile(mode="w+", delete=False) as tmp_xml:
-            if isinstance(self.__xml, bytes):
-                LOGGER.logger.debug("XML is in bytes format. Converting")
-
-                tmp_xml.write(bytes_to_str(src=self.__xml))
-            else:
-                LOGGER.logger.debug("XML is in string format. Skip conversion")
-
-                tmp_xml.write(self.__xml)
-
-            self.__xmlp = tmp_xml.name
-
-            LOGGER.logger.debug(f"XML written to file {self.__xmlp}")
+        self.__get_schema()
 
         return self
 
@@ -104,26 +84,133 @@ class UtilsXmlValidation:
 
         LOGGER.logger.debug("Destroying context for XML Validation")
 
-        if os.path.isfile(self.__xmlp):
-            os.remove(self.__xmlp)
+    def __get_schema(self) -> UtilsXmlCompiledSchema:
+        if self.__xmlschema is None:
+            self.__xmlschema = XML_SCHEMA_CACHE.get(xsd=self.__xsd, key=self.__key)
 
-            LOGGER.logger.debug(f"Deleted file {self.__xmlp}")
+        return self.__xmlschema
 
-        if os.path.isfile(self.__xsdp):
-            os.remove(self.__xsdp)
+    @staticmethod
+    def validate_with(
+        schema: UtilsXmlCompiledSchema, xml: Union[bytes, str]
+    ) -> TypeXmlValidationResult:
+        """
+        Parse in-memory XML and validate it against a compiled schema
+        Syntax errors are reported the same way as validation errors
+        :param schema: Compiled schema
+        :type schema: UtilsXmlCompiledSchema
+        :param xml: XML which needs to be validated
+        :type xml: Union[bytes, str]
+        """
 
-            LOGGER.logger.debug(f"Deleted file {self.__xsdp}")
+        try:
+            document = UtilsXmlParser.fromstring(src=xml)
+        except etree.XMLSyntaxError as exc:
+            LOGGER.logger.debug(f"XML is not well-formed: {str(exc)}")
+
+            return TypeXmlValidationResult(
+                valid=False,
+                errors=[
+                    TypeXmlValidationError.from_log_entry(entry)
+                    # exc.error_log is the thread's global log and keeps the
+                    # errors of earlier documents, the parser's log is reset
+                    # on every parse
+                    for entry in UtilsXmlParser.hardened().error_log
+                    if entry.domain_name == "PARSER"
+                ],
+            )
+
+        try:
+            valid, error_log = schema.validate(document=document)
+        except etree.XMLSchemaValidateError as exc:
+            # e.g. unexpanded entity references left by the hardened parser
+            LOGGER.logger.debug(f"XML could not be validated: {str(exc)}")
+
+            return TypeXmlValidationResult(
+                valid=False,
+                errors=[
+                    TypeXmlValidationError(
+                        message=str(exc),
+                        line=None,
+                        column=None,
+                        path=None,
+                        level="FATAL",
+                    )
+                ],
+            )
+
+        return TypeXmlValidationResult(
+            valid=valid,
+            errors=[
+                TypeXmlValidationError.from_log_entry(entry) for entry in error_log
+            ],
+        )
+
+    def validate(self) -> TypeXmlValidationResult:
+        """
+        Validate the given XML, returning the result with its errors
+        """
+
+        LOGGER.logger.debug("Validating XML")
+
+        result: TypeXmlValidationResult = UtilsXmlValidation.validate_with(
+            schema=self.__get_schema(), xml=self.__xml
+        )
+
+        LOGGER.logger.debug(f"XML validation result: {result.valid}")
+
+        return result
 
     def is_valid(self) -> bool:
         """
         Check if the given XMl is a valid one
         """
 
-        LOGGER.logger.debug("Validating XML")
+        return self.validate().valid
 
-        _xml: ElementTree = etree.parse(source=self.__xmlp)
-        result = self.__xmlschema.validate(_xml)
+    @staticmethod
+    def validate_many(
+        xsd: Union[bytes, str],
+        xmls: Iterable[Union[bytes, str]],
+        key: Optional[str] = None,
+        workers: int = 4,
+    ) -> Iterator[Tuple[int, bool, List[TypeXmlValidationError]]]:
+        """
+        Validate many XML documents against one schema, compiled once
+        Documents are parsed in a thread pool (lxml releases the GIL while
+        parsing) and results are yielded in input order as they complete;
+        at most `workers * 2` documents are in flight, so the input is
+        consumed lazily and large batches never sit fully in memory
+        :param xsd: XSD schema
+        :type xsd: Union[bytes, str]
+        :param xmls: XML documents which need to be validated
+        :type xmls: Iterable[Union[bytes, str]]
+        :param key: Schema cache key (e.g. message unique_key), defaults to the XSD hash
+        :type key: Optional[str]
+        :param workers: Number of validation threads
+        :type workers: int
+        """
 
-        LOGGER.logger.debug(f"XML validation result: {result}")
+        schema: UtilsXmlCompiledSchema = XML_SCHEMA_CACHE.get(xsd=xsd, key=key)
+        in_flight: Deque[Tuple[int, Future]] = deque()
 
-        return result
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for index, xml in enumerate(xmls):
+                in_flight.append(
+                    (
+                        index,
+                        executor.submit(UtilsXmlValidation.validate_with, schema, xml),
+                    )
+                )
+
+                if len(in_flight) >= workers * 2:
+                    done_index, future = in_flight.popleft()
+                    result: TypeXmlValidationResult = future.result()
+
+                    yield done_index, result.valid, result.errors
+
+            while in_flight:
+                done_index, future = in_flight.popleft()
+                result = future.result()
+
+                yield done_index, result.valid, result.errors
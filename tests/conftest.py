@@ -0,0 +1,130 @@
+"""
+Shared fixtures
+"""
+
+import os
+import time
+from typing import Callable
+
+import pytest
+
+# Rounds of every benchmark, raise it for stable figures
+BENCHMARK_ROUNDS: int = int(os.environ.get("FTL_BENCHMARK_ROUNDS", "3"))
+
+PACS_008_NAMESPACE: str = "urn:iso:std:iso:20022:tech:xsd:pacs.008.001.08"
+
+PACS_008_TRANSACTION: str = """
+    <CdtTrfTxInf>
+      <PmtId>
+        <InstrId>INSTR-{index}</InstrId>
+        <EndToEndId>E2E-{index}</EndToEndId>
+        <TxId>TX-{index}</TxId>
+      </PmtId>
+      <IntrBkSttlmAmt Ccy="EUR">{index}.50</IntrBkSttlmAmt>
+      <Dbtr><Nm>Debtor {index}</Nm></Dbtr>
+      <DbtrAcct><Id><Othr><Id>DA-{index}</Id></Othr></Id></DbtrAcct>
+      <Cdtr><Nm>Creditor {index}</Nm></Cdtr>
+      <CdtrAcct><Id><Othr><Id>CA-{index}</Id></Othr></Id></CdtrAcct>
+    </CdtTrfTxInf>"""
+
+
+def build_pacs_008(transactions: int = 1) -> bytes:
+    """
+    Build a pacs.008 message with the given number of CdtTrfTxInf
+    """
+
+    return (
+        f"""<?xml version="1.0" encoding="UTF-8"?>
+<Document xmlns="{PACS_008_NAMESPACE}">
+  <FIToFICstmrCdtTrf>
+    <GrpHdr>
+      <MsgId>MSG-1</MsgId>
+      <CreDtTm>2022-05-01T10:00:00</CreDtTm>
+      <NbOfTxs>{transactions}</NbOfTxs>
+    </GrpHdr>"""
+        + "".join(
+            PACS_008_TRANSACTION.format(index=index) for index in range(transactions)
+        )
+        + """
+  </FIToFICstmrCdtTrf>
+</Document>
+"""
+    ).encode()
+
+
+XSD_ELEMENT: str = """
+        <xs:element name="{name}" type="{type}">
+          <xs:annotation>
+            <xs:documentation source="Name" xml:lang="EN">{name}</xs:documentation>
+            <xs:documentation source="Definition" xml:lang="EN">Definition of {name}.</xs:documentation>
+          </xs:annotation>
+        </xs:element>"""
+
+
+def build_pacs_008_xsd(depth: int = 5, width: int = 4) -> bytes:
+    """
+    Build a pacs.008 shaped XSD: Document, then `depth` levels of complex
+    types with `width` annotated child elements each, reused like the ISO
+    20022 catalogue does, so the element tree holds width ** depth leaves
+    """
+
+    types: list = [
+        '<xs:complexType name="Document"><xs:sequence>'
+        + XSD_ELEMENT.format(
+            name="FIToFICstmrCdtTrf", type="FIToFICustomerCreditTransferV08"
+        )
+        + "</xs:sequence></xs:complexType>"
+    ]
+
+    for level in range(depth):
+        name: str = "FIToFICustomerCreditTransferV08" if level == 0 else f"Level{level}"
+        child_type: str = f"Level{level + 1}" if level + 1 < depth else "Max35Text"
+        types.append(
+            f'<xs:complexType name="{name}"><xs:sequence>'
+            + "".join(
+                XSD_ELEMENT.format(name=f"Elm{level}x{index}", type=child_type)
+                for index in range(width)
+            )
+            + "</xs:sequence></xs:complexType>"
+        )
+
+    return (
+        f"""<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema" xmlns="{PACS_008_NAMESPACE}" targetNamespace="{PACS_008_NAMESPACE}" elementFormDefault="qualified">
+  <xs:element name="Document" type="Document"/>
+  {"".join(types)}
+  <xs:simpleType name="Max35Text">
+    <xs:restriction base="xs:string"><xs:maxLength value="35"/></xs:restriction>
+  </xs:simpleType>
+</xs:schema>
+"""
+    ).encode()
+
+
+@pytest.fixture(name="pacs_008")
+def fixture_pacs_008() -> bytes:
+    return build_pacs_008(transactions=3)
+
+
+@pytest.fixture(name="benchmark")
+def fixture_benchmark(record_property) -> Callable[[str, Callable[[], object]], float]:
+    """
+    Time a function over BENCHMARK_ROUNDS calls, report the calls per
+    second (printed with -s and recorded in the junit properties) and
+    return the mean seconds per call
+    """
+
+    def run(name: str, func: Callable[[], object]) -> float:
+        func()
+
+        started: float = time.perf_counter()
+        for _ in range(BENCHMARK_ROUNDS):
+            func()
+        elapsed: float = (time.perf_counter() - started) / BENCHMARK_ROUNDS
+
+        record_property(name, elapsed)
+        print(f"{name}: {1 / elapsed:.1f} calls/s ({elapsed * 1000:.2f} ms)")
+
+        return elapsed
+
+    return run
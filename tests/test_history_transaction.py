@@ -0,0 +1,128 @@
+"""
+Tests for the history transaction rollups kept by HelperHistoryTransaction
+"""
+
+import datetime
+
+import mock
+import pendulum
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy import event
+from sqlalchemy.dialects import sqlite
+
+from ftl_python_lib.core.context.headers import HeadersContext
+from ftl_python_lib.core.context.request import RequestContext
+from ftl_python_lib.models.sql import history_transaction_rollup
+from ftl_python_lib.models.sql.history_transaction import ModelHistoryTransaction
+from ftl_python_lib.models_helper import history_transaction
+from ftl_python_lib.models_helper.dashboard_cache import DASHBOARD_CACHE
+from ftl_python_lib.models_helper.dashboard_cache import DASHBOARD_STATIC_INFO
+
+# (requested_at, status, amount), the first two cross an hour and a day in UTC
+TRANSACTIONS = [
+    (pendulum.datetime(2022, 5, 1, 0, 30, tz="Europe/Bucharest"), "RELEASED", 10.0),
+    (pendulum.datetime(2022, 5, 1, 23, 45, tz="America/New_York"), "REJECTED", 5.0),
+    (pendulum.datetime(2022, 5, 1, 0, 10, tz="Europe/Bucharest"), "RELEASED", 20.0),
+    (pendulum.datetime(2022, 5, 2, 9, 0, tz="UTC"), "RELEASED", None),
+]
+
+
+class SqliteUpsert(sqlite.Insert):
+    """
+    SQLite stand-in for the MySQL INSERT ... ON DUPLICATE KEY UPDATE
+    """
+
+    inherit_cache = False
+
+    @property
+    def inserted(self):
+        return self.excluded
+
+    def on_duplicate_key_update(self, **kwargs):
+        return self.on_conflict_do_update(
+            index_elements=list(self.table.primary_key.columns), set_=kwargs
+        )
+
+
+def date_format(value, pattern):
+    return datetime.datetime.fromisoformat(str(value)).strftime(pattern)
+
+
+@pytest.fixture(name="helper")
+def fixture_helper(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'history.db'}")
+    event.listen(
+        engine,
+        "connect",
+        lambda connection, _: connection.create_function("date_format", 2, date_format),
+    )
+    ModelHistoryTransaction.__table__.create(engine)
+    history_transaction_rollup.ModelHistoryTransactionRollup.__table__.create(engine)
+
+    with mock.patch(
+        "ftl_python_lib.core.context.session.MySqlEngine.get_engine",
+        return_value=engine,
+    ), mock.patch.object(history_transaction, "mysql_insert", SqliteUpsert):
+        yield history_transaction.HelperHistoryTransaction(
+            request_context=RequestContext(headers_context=HeadersContext(headers={})),
+            environ_context=mock.Mock(),
+        )
+
+
+def rollups(helper) -> list:
+    model = history_transaction_rollup.ModelHistoryTransactionRollup
+
+    # pylint: disable=W0212
+    session = helper._HelperHistoryTransaction__session
+    session.expire_all()
+
+    return sorted(
+        (row.granularity, row.bucket_at, row.status, row.volume, row.amount)
+        for row in session.query(model).all()
+    )
+
+
+def test_create_buckets_match_rebuild(helper):
+    for requested_at, status, amount in TRANSACTIONS:
+        helper.create(
+            ModelHistoryTransaction(
+                request_id="request",
+                requested_at=requested_at,
+                transaction_id="transaction",
+                status=status,
+                amount=amount,
+            ),
+            owner_member_id="member",
+        )
+
+    created = rollups(helper)
+    helper.rebuild_rollups()
+
+    assert created == rollups(helper)
+    assert created == [
+        ("day", datetime.datetime(2022, 5, 1), "REJECTED", 1, 5.0),
+        ("day", datetime.datetime(2022, 5, 1), "RELEASED", 2, 30.0),
+        ("day", datetime.datetime(2022, 5, 2), "RELEASED", 1, 0.0),
+        ("hour", datetime.datetime(2022, 5, 1, 0), "RELEASED", 2, 30.0),
+        ("hour", datetime.datetime(2022, 5, 1, 23), "REJECTED", 1, 5.0),
+        ("hour", datetime.datetime(2022, 5, 2, 9), "RELEASED", 1, 0.0),
+    ]
+
+
+def test_create_invalidates_dashboard_cache(helper):
+    DASHBOARD_CACHE.get(DASHBOARD_STATIC_INFO, lambda: "stale")
+
+    requested_at, status, amount = TRANSACTIONS[0]
+    helper.create(
+        ModelHistoryTransaction(
+            request_id="request",
+            requested_at=requested_at,
+            transaction_id="transaction",
+            status=status,
+            amount=amount,
+        ),
+        owner_member_id="member",
+    )
+
+    assert DASHBOARD_CACHE.get(DASHBOARD_STATIC_INFO, lambda: "fresh") == "fresh"
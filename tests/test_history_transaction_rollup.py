@@ -0,0 +1,118 @@
+"""
+Tests for the dashboard series read from the history transaction rollups
+"""
+
+import datetime
+
+import mock
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy import event
+
+from ftl_python_lib.core.context.headers import HeadersContext
+from ftl_python_lib.core.context.request import RequestContext
+from ftl_python_lib.models.sql import history_transaction_rollup
+from ftl_python_lib.models_helper.dashboard import HelperDashboard
+
+# (requested_at, status, amount) of the rolled up transactions
+TRANSACTIONS = [
+    ("2022-05-01 08:15:00", "RELEASED", 10.0),
+    ("2022-05-01 20:30:00", "RELEASED", 20.0),
+    ("2022-05-02 09:00:00", "REJECTED", 5.0),
+    ("2022-05-02 23:10:00", "RELEASED", 40.0),
+    ("2022-05-03 01:45:00", "RELEASED", 80.0),
+    ("2022-05-03 14:00:00", "REJECTED", 160.0),
+]
+
+
+def date_format(value, pattern):
+    return datetime.datetime.fromisoformat(str(value)).strftime(pattern)
+
+
+@pytest.fixture(name="engine")
+def fixture_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'rollup.db'}")
+    event.listen(
+        engine,
+        "connect",
+        lambda connection, _: connection.create_function("date_format", 2, date_format),
+    )
+    rollup_table = history_transaction_rollup.ModelHistoryTransactionRollup.__table__
+    rollup_table.create(engine)
+
+    buckets: dict = {}
+    for requested_at, status, amount in TRANSACTIONS:
+        requested_at = datetime.datetime.fromisoformat(requested_at)
+        for granularity, bucket_at in (
+            ("hour", requested_at.replace(minute=0)),
+            ("day", requested_at.replace(hour=0, minute=0)),
+        ):
+            volume, total = buckets.get((granularity, bucket_at, status), (0, 0.0))
+            buckets[(granularity, bucket_at, status)] = (volume + 1, total + amount)
+
+    with engine.begin() as connection:
+        connection.execute(
+            rollup_table.insert(),
+            [
+                {
+                    "granularity": granularity,
+                    "bucket_at": bucket_at,
+                    "status": status,
+                    "volume": volume,
+                    "amount": amount,
+                }
+                for (granularity, bucket_at, status), (
+                    volume,
+                    amount,
+                ) in buckets.items()
+            ],
+        )
+
+    with mock.patch(
+        "ftl_python_lib.core.context.session.MySqlEngine.get_engine",
+        return_value=engine,
+    ):
+        yield engine
+
+
+@pytest.fixture(name="dashboard")
+def fixture_dashboard(engine):
+    return HelperDashboard(
+        request_context=RequestContext(headers_context=HeadersContext(headers={})),
+        environ_context=mock.Mock(),
+    )
+
+
+def test_whole_days_read_day_buckets(dashboard):
+    volume = dashboard.get_dynamic_info("2022-05-01 00:00:00", "2022-05-03 23:59:59")[
+        "transaction"
+    ]["volume"]
+
+    assert volume["accepted"] == 4
+    assert volume["rejected"] == 2
+    assert [item["timeData"] for item in volume["graph"]] == ["01", "02", "03"]
+
+
+def test_partial_edge_days_read_hour_buckets(dashboard):
+    response = dashboard.get_dynamic_info("2022-05-01 12:00:00", "2022-05-03 02:00:00")
+    volume = response["transaction"]["volume"]
+    currency = response["transaction"]["currency"]
+
+    assert volume["accepted"] == 3
+    assert volume["rejected"] == 1
+    assert currency["accepted"] == 140.0
+    assert currency["rejected"] == 5.0
+    assert volume["graph"] == [
+        {"timeData": "01", "accepted": 1, "rejected": 0},
+        {"timeData": "02", "accepted": 1, "rejected": 1},
+        {"timeData": "03", "accepted": 1, "rejected": 0},
+    ]
+
+
+def test_single_day_reads_hour_buckets(dashboard):
+    volume = dashboard.get_dynamic_info("2022-05-02 00:00:00", "2022-05-02 12:00:00")[
+        "transaction"
+    ]["volume"]
+
+    assert volume["total"] == 1
+    assert volume["graph"] == [{"timeData": "09", "accepted": 0, "rejected": 1}]
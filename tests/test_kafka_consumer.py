@@ -0,0 +1,207 @@
+"""
+Tests for the ProviderKafkaConsumer configuration, batches and commits
+"""
+
+from typing import Optional
+
+import mock
+import pytest
+from confluent_kafka import KafkaError
+from confluent_kafka import KafkaException
+from confluent_kafka import TopicPartition
+
+from ftl_python_lib.constants.kafka import ConstantsKafkaCommitMode
+from ftl_python_lib.core.context.environment import EnvironmentContext
+from ftl_python_lib.core.context.headers import HeadersContext
+from ftl_python_lib.core.context.request import RequestContext
+from ftl_python_lib.core.providers.clients.kafka.consumer import ProviderKafkaConsumer
+
+
+class FakeMessage:
+    def __init__(
+        self, partition: int, offset: int, error: Optional[KafkaError] = None
+    ) -> None:
+        self.__partition = partition
+        self.__offset = offset
+        self.__error = error
+
+    def topic(self) -> str:
+        return "topic"
+
+    def partition(self) -> int:
+        return self.__partition
+
+    def offset(self) -> int:
+        return self.__offset
+
+    def error(self) -> Optional[KafkaError]:
+        return self.__error
+
+
+@pytest.fixture(name="config")
+def fixture_config(monkeypatch):
+    monkeypatch.setenv("KAFKA_BROKER", "localhost:9092")
+
+    def build() -> dict:
+        with mock.patch(
+            "ftl_python_lib.core.providers.clients.kafka.consumer.Consumer"
+        ) as consumer:
+            ProviderKafkaConsumer(
+                request_context=RequestContext(
+                    headers_context=HeadersContext(headers={})
+                ),
+                environ_context=EnvironmentContext(),
+            )
+
+        return consumer.call_args[0][0]
+
+    return build
+
+
+def test_own_group_defaults_to_cooperative_sticky(monkeypatch, config):
+    monkeypatch.setenv("KAFKA_CONSUMER_GROUP_ID", "ftl-msa-msg-in")
+
+    assert config()["group.id"] == "ftl-msa-msg-in"
+    assert config()["partition.assignment.strategy"] == "cooperative-sticky"
+
+
+def test_shared_group_keeps_the_eager_strategy(monkeypatch, config):
+    monkeypatch.delenv("KAFKA_CONSUMER_GROUP_ID", raising=False)
+
+    assert config()["group.id"] == "ftl_python_lib.core.providers.clients.kafka"
+    assert config()["partition.assignment.strategy"] == "range,roundrobin"
+
+
+@pytest.mark.parametrize("group_id", [None, "ftl-msa-msg-in"])
+def test_explicit_strategy_wins(monkeypatch, config, group_id):
+    if group_id is not None:
+        monkeypatch.setenv("KAFKA_CONSUMER_GROUP_ID", group_id)
+    else:
+        monkeypatch.delenv("KAFKA_CONSUMER_GROUP_ID", raising=False)
+    monkeypatch.setenv("KAFKA_CONSUMER_ASSIGNMENT_STRATEGY", "roundrobin")
+
+    assert config()["partition.assignment.strategy"] == "roundrobin"
+
+
+@pytest.fixture(name="subscribed")
+def fixture_subscribed(monkeypatch):
+    monkeypatch.setenv("KAFKA_BROKER", "localhost:9092")
+
+    def build(commit_mode: str = "batch", commit_interval_ms: int = 5000):
+        monkeypatch.setenv("KAFKA_CONSUMER_COMMIT_MODE", commit_mode)
+        monkeypatch.setenv("KAFKA_CONSUMER_COMMIT_INTERVAL_MS", str(commit_interval_ms))
+
+        with mock.patch(
+            "ftl_python_lib.core.providers.clients.kafka.consumer.Consumer"
+        ) as consumer:
+            provider = ProviderKafkaConsumer(
+                request_context=RequestContext(
+                    headers_context=HeadersContext(headers={})
+                ),
+                environ_context=EnvironmentContext(),
+            )
+        provider.subscribe(topics=["topic"])
+
+        return provider, consumer.return_value
+
+    return build
+
+
+def test_consume_batch_leaves_out_errors(subscribed):
+    provider, consumer = subscribed()
+    messages = [
+        FakeMessage(partition=0, offset=0),
+        FakeMessage(partition=0, offset=1, error=KafkaError(KafkaError._PARTITION_EOF)),
+        FakeMessage(partition=1, offset=0),
+    ]
+    consumer.consume.return_value = messages
+
+    assert provider.consume_batch(max_messages=10, timeout=0.5) == [
+        messages[0],
+        messages[2],
+    ]
+    consumer.consume.assert_called_once_with(num_messages=10, timeout=0.5)
+
+
+def test_high_watermarks_are_the_next_offset_per_partition():
+    offsets = ProviderKafkaConsumer.high_watermarks(
+        messages=[
+            FakeMessage(partition=0, offset=7),
+            FakeMessage(partition=1, offset=3),
+            FakeMessage(partition=0, offset=5),
+        ]
+    )
+
+    assert sorted(
+        (offset.topic, offset.partition, offset.offset) for offset in offsets
+    ) == [("topic", 0, 8), ("topic", 1, 4)]
+
+
+@pytest.mark.parametrize(
+    "commit_mode, asynchronous", [("batch", False), ("async", True)]
+)
+def test_commit_batch_commits_the_high_watermarks(
+    subscribed, commit_mode, asynchronous
+):
+    provider, consumer = subscribed(commit_mode=commit_mode)
+
+    provider.commit_batch(messages=[FakeMessage(partition=0, offset=1)])
+
+    consumer.commit.assert_called_once()
+    assert consumer.commit.call_args.kwargs["asynchronous"] is asynchronous
+    assert [
+        (offset.topic, offset.partition, offset.offset)
+        for offset in consumer.commit.call_args.kwargs["offsets"]
+    ] == [("topic", 0, 2)]
+    consumer.store_offsets.assert_not_called()
+
+
+def test_commit_batch_skips_empty_batches(subscribed):
+    provider, consumer = subscribed()
+
+    provider.commit_batch(messages=[])
+
+    consumer.commit.assert_not_called()
+
+
+def test_periodic_commit_stores_until_the_interval_elapses(subscribed):
+    offsets = [TopicPartition("topic", 0, 2)]
+    provider, consumer = subscribed(commit_mode="periodic", commit_interval_ms=60000)
+
+    provider.commit_offsets(offsets=offsets)
+
+    consumer.store_offsets.assert_called_once_with(offsets=offsets)
+    consumer.commit.assert_not_called()
+
+    provider.commit_offsets(offsets=offsets, mode=ConstantsKafkaCommitMode.BATCH)
+    consumer.commit.assert_called_once_with(offsets=offsets, asynchronous=False)
+
+
+def test_periodic_commit_commits_the_stored_offsets(subscribed):
+    offsets = [TopicPartition("topic", 0, 2)]
+    provider, consumer = subscribed(commit_mode="periodic", commit_interval_ms=0)
+
+    provider.commit_offsets(offsets=offsets)
+
+    consumer.store_offsets.assert_called_once_with(offsets=offsets)
+    consumer.commit.assert_called_once_with(asynchronous=True)
+
+
+def test_close_ignores_nothing_stored(subscribed):
+    provider, consumer = subscribed(commit_mode="periodic")
+    consumer.commit.side_effect = KafkaException(KafkaError(KafkaError._NO_OFFSET))
+
+    provider.close()
+
+    consumer.commit.assert_called_once_with(asynchronous=False)
+    consumer.close.assert_called_once()
+
+
+def test_close_raises_other_commit_errors(subscribed):
+    provider, consumer = subscribed(commit_mode="periodic")
+    consumer.commit.side_effect = KafkaException(KafkaError(KafkaError._TRANSPORT))
+
+    with pytest.raises(KafkaException):
+        provider.close()
+
+    consumer.close.assert_not_called()
@@ -0,0 +1,158 @@
+"""
+Tests for ProviderKafkaProducer delivery reporting
+"""
+
+import threading
+import time
+
+import mock
+import pytest
+from confluent_kafka import KafkaError
+
+from ftl_python_lib.core.context.environment import EnvironmentContext
+from ftl_python_lib.core.context.headers import HeadersContext
+from ftl_python_lib.core.context.request import RequestContext
+from ftl_python_lib.core.exceptions import server_unexpected_error_exception
+from ftl_python_lib.core.providers.clients.kafka.producer import ProviderKafkaProducer
+
+
+class FakeMessage:
+    def __init__(self, topic: str, key: str) -> None:
+        self.__topic = topic
+        self.__key = key
+
+    def topic(self) -> str:
+        return self.__topic
+
+    def key(self) -> bytes:
+        return self.__key.encode()
+
+    def partition(self) -> int:
+        return 0
+
+
+class FakeProducer:
+    """
+    In-memory stand-in for confluent_kafka.Producer; delivery reports are
+    served by whichever thread calls poll() or flush() first
+    """
+
+    def __init__(self, config) -> None:
+        self.config = config
+        self.error = None
+        self.poll_errors = []
+        self.__lock = threading.Lock()
+        self.__pending = []
+
+    def produce(self, topic, key, value, callback) -> None:
+        with self.__lock:
+            self.__pending.append((callback, FakeMessage(topic=topic, key=key)))
+
+    def __serve(self) -> None:
+        while True:
+            with self.__lock:
+                if len(self.__pending) == 0:
+                    return
+                callback, message = self.__pending.pop(0)
+
+            callback(self.error, message)
+
+    def poll(self, timeout) -> int:
+        if len(self.poll_errors) > 0:
+            raise self.poll_errors.pop(0)
+
+        self.__serve()
+        time.sleep(timeout / 10)
+
+        return 0
+
+    def flush(self, timeout=None) -> int:
+        self.__serve()
+
+        return 0
+
+
+@pytest.fixture(name="producer")
+def fixture_producer(monkeypatch):
+    monkeypatch.setenv("KAFKA_BROKER", "localhost:9092")
+    monkeypatch.setenv("KAFKA_MESSAGE_INBOX_TARGET", "inbox")
+    monkeypatch.setenv("KAFKA_MESSAGE_OUTBOX_TARGET", "outbox")
+
+    with mock.patch(
+        "ftl_python_lib.core.providers.clients.kafka.producer.Producer", FakeProducer
+    ):
+        producer = ProviderKafkaProducer(
+            request_context=RequestContext(headers_context=HeadersContext(headers={})),
+            environ_context=EnvironmentContext(),
+        )
+
+        yield producer
+
+        producer.close(timeout=1)
+
+
+def fake(producer: ProviderKafkaProducer) -> FakeProducer:
+    return producer._ProviderKafkaProducer__producer
+
+
+def test_sync_delivery_error_is_raised_while_polling(producer):
+    assert producer.produce_message_in_async(key="a", value="a").result(timeout=1)
+
+    fake(producer).error = KafkaError(KafkaError._TRANSPORT)
+
+    for _ in range(20):
+        with pytest.raises(server_unexpected_error_exception.ExceptionUnexpectedError):
+            producer.produce_message_out_sync(key="b", value="b")
+
+
+def test_poll_thread_survives_errors(producer):
+    fake(producer).poll_errors.append(RuntimeError("callback failed"))
+
+    assert producer.produce_message_in_async(key="a", value="a").result(timeout=1)
+    assert producer.produce_message_in_async(key="b", value="b").result(timeout=1)
+
+
+def test_dead_poll_thread_is_restarted(producer):
+    producer.produce_message_in_async(key="a", value="a").result(timeout=1)
+
+    thread: threading.Thread = producer._ProviderKafkaProducer__poll_thread
+    producer._ProviderKafkaProducer__poll_stop.set()
+    thread.join()
+
+    future = producer.produce_message_in_async(key="b", value="b")
+
+    assert producer._ProviderKafkaProducer__poll_thread is not thread
+    assert future.result(timeout=1).topic() == "inbox"
+
+
+@pytest.mark.parametrize(
+    "profile,expected",
+    [
+        ("low_latency", {"linger.ms": 0, "acks": "1"}),
+        ("HIGH_THROUGHPUT", {"compression.type": "lz4", "linger.ms": 50}),
+        ("exactly_once", {"enable.idempotence": True, "acks": "all"}),
+    ],
+)
+def test_profile_is_selected_by_name(monkeypatch, producer, profile, expected):
+    monkeypatch.setenv("KAFKA_PRODUCER_PROFILE", profile)
+    producer.init_producer()
+
+    config = fake(producer).config
+
+    assert expected.items() <= config.items()
+    assert config["bootstrap.servers"] == "localhost:9092"
+
+
+def test_unknown_profile_falls_back_to_the_defaults(monkeypatch, producer):
+    monkeypatch.setenv("KAFKA_PRODUCER_PROFILE", "fastest")
+    producer.init_producer()
+
+    assert set(fake(producer).config) == {"bootstrap.servers", "client.id"}
+
+
+def test_compression_overrides_the_profile(monkeypatch, producer):
+    monkeypatch.setenv("KAFKA_PRODUCER_PROFILE", "high_throughput")
+    monkeypatch.setenv("KAFKA_PRODUCER_COMPRESSION", "zstd")
+    producer.init_producer()
+
+    assert fake(producer).config["compression.type"] == "zstd"
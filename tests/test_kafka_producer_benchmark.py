@@ -0,0 +1,82 @@
+"""
+Throughput and latency of the Kafka producer tuning profiles, measured
+against a real broker; skipped unless FTL_BENCHMARK_KAFKA_BROKER is set,
+e.g. with a local single-node broker:
+
+    docker run -d -p 9092:9092 apache/kafka:3.7.0
+    FTL_BENCHMARK_KAFKA_BROKER=localhost:9092 pytest -s tests/test_kafka_producer_benchmark.py
+"""
+
+import os
+import threading
+import time
+from typing import List
+
+import pytest
+
+from ftl_python_lib.constants.kafka import ConstantsKafkaProducerProfile
+from ftl_python_lib.core.context.environment import EnvironmentContext
+from ftl_python_lib.core.context.headers import HeadersContext
+from ftl_python_lib.core.context.request import RequestContext
+from ftl_python_lib.core.providers.clients.kafka.producer import ProviderKafkaProducer
+
+BROKER: str = os.environ.get("FTL_BENCHMARK_KAFKA_BROKER")
+
+MESSAGES: int = int(os.environ.get("FTL_BENCHMARK_KAFKA_MESSAGES", "10000"))
+
+# A pacs.008 sized payload
+PAYLOAD: str = "x" * 4096
+
+pytestmark = pytest.mark.skipif(
+    BROKER is None, reason="FTL_BENCHMARK_KAFKA_BROKER is not set"
+)
+
+
+@pytest.mark.parametrize(
+    "profile", [profile.name.lower() for profile in ConstantsKafkaProducerProfile]
+)
+def test_benchmark_profile(monkeypatch, record_property, profile):
+    monkeypatch.setenv("KAFKA_BROKER", BROKER)
+    monkeypatch.setenv("KAFKA_MESSAGE_INBOX_TARGET", "ftl-benchmark")
+    monkeypatch.setenv("KAFKA_MESSAGE_OUTBOX_TARGET", "ftl-benchmark")
+    monkeypatch.setenv("KAFKA_PRODUCER_PROFILE", profile)
+
+    producer = ProviderKafkaProducer(
+        request_context=RequestContext(headers_context=HeadersContext(headers={})),
+        environ_context=EnvironmentContext(),
+    )
+    latencies: List[float] = []
+    lock: threading.Lock = threading.Lock()
+
+    def record(sent: float):
+        def done(_):
+            with lock:
+                latencies.append(time.perf_counter() - sent)
+
+        return done
+
+    # Warm up the connection and the topic metadata
+    producer.produce_message_in_sync(key="warm-up", value=PAYLOAD)
+
+    futures: list = []
+    started: float = time.perf_counter()
+    for index in range(MESSAGES):
+        sent: float = time.perf_counter()
+        future = producer.produce_message_in_async(key=str(index), value=PAYLOAD)
+        future.add_done_callback(record(sent))
+        futures.append(future)
+    for future in futures:
+        future.result(timeout=60)
+    elapsed: float = time.perf_counter() - started
+    producer.close(timeout=10)
+
+    latencies.sort()
+    messages_per_second: float = MESSAGES / elapsed
+    p99: float = latencies[int(len(latencies) * 0.99) - 1]
+
+    record_property(f"kafka_{profile}_messages_per_second", messages_per_second)
+    record_property(f"kafka_{profile}_p99_seconds", p99)
+    print(
+        f"kafka_{profile}: {messages_per_second:.0f} msgs/s, "
+        f"p99 {p99 * 1000:.2f} ms"
+    )
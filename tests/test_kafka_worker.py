@@ -0,0 +1,252 @@
+"""
+Tests for the partition-aware Kafka worker pool
+"""
+
+import threading
+import time
+from typing import List
+
+import pytest
+from confluent_kafka import TopicPartition
+
+from ftl_python_lib.core.context.environment import EnvironmentContext
+from ftl_python_lib.core.providers.clients.kafka import worker
+
+
+class FakeMessage:
+    def __init__(self, topic: str, partition: int, offset: int, key: bytes) -> None:
+        self.__topic = topic
+        self.__partition = partition
+        self.__offset = offset
+        self.__key = key
+
+    def topic(self) -> str:
+        return self.__topic
+
+    def partition(self) -> int:
+        return self.__partition
+
+    def offset(self) -> int:
+        return self.__offset
+
+    def key(self) -> bytes:
+        return self.__key
+
+
+class FakeConsumer:
+    """
+    Stand-in for ProviderKafkaConsumer serving a fixed list of messages
+    from a single assigned partition
+    """
+
+    def __init__(self, messages: List[FakeMessage]) -> None:
+        self.messages = messages
+        self.committed: List[TopicPartition] = []
+        self.paused: List[TopicPartition] = []
+        self.closed = False
+
+    def subscribe(self, topics, on_assign, on_revoke, on_lost) -> None:
+        on_assign(None, self.assignment())
+
+    def consume_batch(self, max_messages: int, timeout: float) -> List[FakeMessage]:
+        batch, self.messages = (
+            self.messages[:max_messages],
+            self.messages[max_messages:],
+        )
+
+        if len(batch) == 0:
+            time.sleep(timeout)
+
+        return batch
+
+    def commit_offsets(self, offsets: List[TopicPartition], mode=None) -> None:
+        self.committed.extend(offsets)
+
+    def assignment(self) -> List[TopicPartition]:
+        return [TopicPartition("inbox", 0)]
+
+    def pause(self, partitions: List[TopicPartition]) -> None:
+        self.paused.extend(partitions)
+
+    def resume(self, partitions: List[TopicPartition]) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class RebalancingConsumer(FakeConsumer):
+    """
+    FakeConsumer revoking and reassigning its partition on the second poll,
+    then redelivering every message from the committed offset
+    """
+
+    def __init__(self, messages: List[FakeMessage], rebalanced) -> None:
+        super().__init__(messages=messages[:])
+        self.redelivered = messages
+        self.rebalanced = rebalanced
+        self.polls = 0
+        self.callbacks: dict = {}
+
+    def subscribe(self, topics, on_assign, on_revoke, on_lost) -> None:
+        self.callbacks = {"assign": on_assign, "revoke": on_revoke}
+        super().subscribe(topics, on_assign, on_revoke, on_lost)
+
+    def consume_batch(self, max_messages: int, timeout: float) -> List[FakeMessage]:
+        self.polls += 1
+
+        if self.polls == 2:
+            self.rebalanced.set()
+            self.callbacks["revoke"](None, self.assignment())
+            self.callbacks["assign"](None, self.assignment())
+
+            committed: int = max(
+                (partition.offset for partition in self.committed), default=0
+            )
+            self.messages = self.redelivered[committed:]
+
+        return super().consume_batch(max_messages=max_messages, timeout=timeout)
+
+
+def run_pool(
+    consumer: FakeConsumer, handler, **kwargs
+) -> worker.ProviderKafkaWorkerPool:
+    pool = worker.ProviderKafkaWorkerPool(
+        consumer=consumer,
+        environ_context=EnvironmentContext(),
+        handler=handler,
+        poll_timeout=0.01,
+        **kwargs,
+    )
+    thread = threading.Thread(target=pool.run, args=(["inbox"],))
+    thread.start()
+
+    deadline: float = time.monotonic() + 2
+    while time.monotonic() < deadline:
+        statistics = pool.statistics()
+        if len(consumer.messages) == 0 and statistics["backlog"] == 0:
+            break
+        time.sleep(0.01)
+
+    pool.stop()
+    thread.join(timeout=2)
+
+    return pool
+
+
+@pytest.fixture(name="messages")
+def fixture_messages() -> List[FakeMessage]:
+    return [
+        FakeMessage(topic="inbox", partition=0, offset=offset, key=b"key")
+        for offset in range(5)
+    ]
+
+
+def test_watermark_only_advances_over_contiguous_offsets():
+    offsets = worker.ProviderKafkaPartitionOffsets(topic="inbox", partition=0)
+    for offset in range(3):
+        offsets.dispatch(offset)
+        offsets.start()
+
+    offsets.complete(1)
+    offsets.complete(2)
+
+    assert offsets.to_commit() is None
+
+    offsets.complete(0)
+
+    assert offsets.to_commit().offset == 3
+
+
+def test_failed_offset_stops_the_watermark():
+    offsets = worker.ProviderKafkaPartitionOffsets(topic="inbox", partition=0)
+    for offset in range(3):
+        offsets.dispatch(offset)
+
+    offsets.start()
+    offsets.complete(0)
+    offsets.start()
+    offsets.fail()
+
+    assert offsets.failed is True
+    assert offsets.start() is False
+    assert offsets.to_commit().offset == 1
+
+
+def test_revoke_waits_for_in_flight_messages():
+    offsets = worker.ProviderKafkaPartitionOffsets(topic="inbox", partition=0)
+    offsets.dispatch(0)
+    offsets.start()
+
+    assert offsets.revoke(timeout=0.01) is False
+
+    threading.Timer(0.02, offsets.complete, args=(0,)).start()
+
+    assert offsets.revoke(timeout=1) is True
+    assert offsets.start() is False
+
+
+def test_handler_failure_is_not_committed(messages):
+    def handler(message: FakeMessage) -> None:
+        if message.offset() == 2:
+            raise ValueError("boom")
+
+    consumer = FakeConsumer(messages=messages)
+    pool = run_pool(consumer=consumer, handler=handler)
+
+    assert max(partition.offset for partition in consumer.committed) == 2
+    assert TopicPartition("inbox", 0) in consumer.paused
+    assert pool.statistics()["failed"] == 1
+    assert consumer.closed is True
+
+
+def test_dead_lettered_failure_is_committed(messages):
+    dead_letters = []
+
+    def handler(message: FakeMessage) -> None:
+        if message.offset() == 2:
+            raise ValueError("boom")
+
+    consumer = FakeConsumer(messages=messages)
+    pool = run_pool(
+        consumer=consumer,
+        handler=handler,
+        on_failure=lambda message, error: dead_letters.append(message.offset()),
+    )
+
+    assert dead_letters == [2]
+    assert max(partition.offset for partition in consumer.committed) == 5
+    assert pool.statistics()["dead_lettered"] == 1
+
+
+def test_failing_dead_letter_is_not_committed(messages):
+    def handler(message: FakeMessage) -> None:
+        if message.offset() == 2:
+            raise ValueError("boom")
+
+    def on_failure(message: FakeMessage, error: Exception) -> None:
+        raise RuntimeError("dead letter topic unavailable")
+
+    consumer = FakeConsumer(messages=messages)
+    run_pool(consumer=consumer, handler=handler, on_failure=on_failure)
+
+    assert max(partition.offset for partition in consumer.committed) == 2
+
+
+def test_reassigned_partition_drops_its_stale_backlog(monkeypatch, messages):
+    monkeypatch.setenv("KAFKA_WORKER_LANES", "1")
+    monkeypatch.setenv("KAFKA_WORKER_LANE_CAPACITY", "1")
+    rebalanced = threading.Event()
+    handled: List[int] = []
+
+    def handler(message: FakeMessage) -> None:
+        rebalanced.wait(timeout=1)
+        handled.append(message.offset())
+
+    consumer = RebalancingConsumer(messages=messages, rebalanced=rebalanced)
+    pool = run_pool(consumer=consumer, handler=handler)
+
+    assert consumer.polls > 2
+    assert sorted(handled) == list(range(5))
+    assert max(partition.offset for partition in consumer.committed) == 5
+    assert pool.statistics()["backlog"] == 0
@@ -0,0 +1,104 @@
+"""
+Tests for the keyset pagination of the model helpers
+"""
+
+import mock
+import pytest
+from sqlalchemy import create_engine
+
+from ftl_python_lib.core.context.headers import HeadersContext
+from ftl_python_lib.core.context.request import RequestContext
+from ftl_python_lib.models.sql.message import ModelMessage
+from ftl_python_lib.models.sql.provider import ModelProvider
+from ftl_python_lib.models_helper.message import HelperMessage
+from ftl_python_lib.models_helper.provider import HelperProvider
+
+# (reference_id, unique_key, version_major, version_minor, version_patch)
+MESSAGES = [
+    ("m-1", "pacs.008", "001", "08", "00"),
+    ("m-2", "pacs.008", "001", "09", "00"),
+    ("m-3", "pacs.002", "001", "10", "00"),
+    ("m-4", "pacs.002", "001", "10", "01"),
+    ("m-5", "camt.056", "001", "08", "00"),
+]
+
+
+@pytest.fixture(name="engine")
+def fixture_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'keyset.db'}")
+    ModelMessage.__table__.create(engine)
+    ModelProvider.__table__.create(engine)
+
+    with engine.begin() as connection:
+        connection.execute(
+            ModelMessage.__table__.insert(),
+            [
+                {
+                    "id": reference_id,
+                    "reference_id": reference_id,
+                    "unique_key": unique_key,
+                    "unique_type": unique_key,
+                    "version_major": major,
+                    "version_minor": minor,
+                    "version_patch": patch,
+                    "storage_path": "schema",
+                    "created_by": "owner",
+                }
+                for reference_id, unique_key, major, minor, patch in MESSAGES
+            ],
+        )
+        connection.execute(
+            ModelProvider.__table__.insert(),
+            [
+                {
+                    "id": f"p-{index:02}",
+                    "reference_id": f"p-{index:02}",
+                    "name": f"provider {index}",
+                    "category_id": "category",
+                    "subcategory_id": "subcategory",
+                    "created_by": "owner",
+                    "deleted_by": "owner" if index % 4 == 0 else None,
+                }
+                for index in range(10)
+            ],
+        )
+
+    with mock.patch(
+        "ftl_python_lib.core.context.session.MySqlEngine.get_engine",
+        return_value=engine,
+    ):
+        yield engine
+
+
+@pytest.fixture(name="request_context")
+def fixture_request_context():
+    return RequestContext(headers_context=HeadersContext(headers={}))
+
+
+def test_pages_seek_past_the_last_key(engine, request_context):
+    helper = HelperProvider(request_context=request_context, environ_context=None)
+
+    first = helper.get_page(limit=4)
+    second = helper.get_page(after=first[-1].reference_id, limit=4)
+
+    assert [row.reference_id for row in first] == ["p-01", "p-02", "p-03", "p-05"]
+    assert [row.reference_id for row in second] == ["p-06", "p-07", "p-09"]
+
+
+def test_iter_all_skips_deleted_rows(engine, request_context):
+    helper = HelperProvider(request_context=request_context, environ_context=None)
+
+    assert [row.reference_id for row in helper.iter_all(batch_size=2)] == [
+        f"p-{index:02}" for index in range(10) if index % 4 != 0
+    ]
+
+
+def test_message_pages_hold_the_get_all_versions(engine, request_context):
+    with mock.patch("ftl_python_lib.models_helper.message.ProviderS3"):
+        helper = HelperMessage(request_context=request_context, environ_context=None)
+
+    expected = sorted(message.reference_id for message in helper.get_all())
+
+    assert expected == ["m-2", "m-4", "m-5"]
+    assert [row.reference_id for row in helper.get_page(limit=2)] == expected[:2]
+    assert [row.reference_id for row in helper.iter_all(batch_size=1)] == expected
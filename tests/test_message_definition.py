@@ -0,0 +1,170 @@
+"""
+Tests for the message definitions extracted from an uploaded XSD
+"""
+
+import mock
+import pytest
+from bs4 import BeautifulSoup
+from sqlalchemy import create_engine
+from sqlalchemy import func
+from sqlalchemy import select
+
+from ftl_python_lib.core.context.headers import HeadersContext
+from ftl_python_lib.core.context.request import RequestContext
+from ftl_python_lib.models.sql.message_definition import ModelMessageDefinition
+from ftl_python_lib.models_helper.message_definition import HelperMessageDefinition
+from ftl_python_lib.utils.xml.parser import UtilsXmlParser
+from tests.conftest import BENCHMARK_ROUNDS
+from tests.conftest import build_pacs_008_xsd
+
+
+@pytest.fixture(name="engine")
+def fixture_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'definition.db'}")
+    ModelMessageDefinition.__table__.create(engine)
+
+    with mock.patch(
+        "ftl_python_lib.core.context.session.MySqlEngine.get_engine",
+        return_value=engine,
+    ):
+        yield engine
+
+
+@pytest.fixture(name="helper")
+def fixture_helper(engine):
+    return HelperMessageDefinition(
+        request_context=RequestContext(headers_context=HeadersContext(headers={})),
+        environ_context=mock.Mock(ftl_db_bulk_insert_chunk_size=500),
+    )
+
+
+def soup_tree(soup, name="Document", type_="Document", level=0):
+    """
+    The BeautifulSoup extraction create_from_content used before the lxml
+    indexes, kept as the reference output and benchmark baseline
+    """
+
+    result = []
+    element = soup.find("xs:element", {"name": name, "type": type_})
+
+    if element is None:
+        return result
+
+    item = {"name": name, "type": type_, "level": level, "is_leaf": True}
+    for source in ("Name", "Definition"):
+        documentation = element.find("xs:documentation", {"source": source})
+        item[source] = documentation.get_text() if documentation else None
+    result.append(item)
+
+    complex_type = soup.find("xs:complexType", {"name": type_})
+    if complex_type is not None:
+        search = (
+            complex_type.find("xs:sequence")
+            or complex_type.find("xs:simpleContent")
+            or complex_type.find("xs:choice")
+        )
+        for child in search.find_all("xs:element"):
+            item["is_leaf"] = False
+            result = result + soup_tree(soup, child["name"], child["type"], level + 1)
+
+    return result
+
+
+def lxml_tree(helper, content: bytes):
+    return [
+        {
+            "name": item["name"],
+            "type": item["type"],
+            "level": item["level"],
+            "is_leaf": item["is_leaf"],
+            "Name": item["annotation_name"],
+            "Definition": item["annotation_definition"],
+        }
+        for item in helper._get_tree(UtilsXmlParser.fromstring(src=content))
+    ]
+
+
+def count_rows(engine, message_id: str) -> int:
+    with engine.connect() as connection:
+        return connection.execute(
+            select(func.count()).where(ModelMessageDefinition.message_id == message_id)
+        ).scalar()
+
+
+def test_create_from_content_inserts_every_element(engine, helper):
+    helper.create_from_content("owner", "pacs.008", build_pacs_008_xsd())
+
+    with engine.connect() as connection:
+        rows = connection.execute(
+            select(
+                ModelMessageDefinition.name,
+                ModelMessageDefinition.level,
+                ModelMessageDefinition.is_leaf,
+                ModelMessageDefinition.element_index,
+            )
+            .where(ModelMessageDefinition.message_id == "pacs.008")
+            .order_by(ModelMessageDefinition.element_index)
+        ).fetchall()
+
+    assert len(rows) == sum(4**level for level in range(6)) + 1
+    assert tuple(rows[0]) == ("Document", 0, False, 0)
+    assert tuple(rows[1]) == ("FIToFICstmrCdtTrf", 1, False, 1)
+    assert rows[-1].is_leaf
+
+
+def test_benchmark_create_from_content(engine, helper, benchmark, record_property):
+    content: bytes = build_pacs_008_xsd()
+
+    elapsed: float = benchmark(
+        "create_from_content",
+        lambda: helper.create_from_content("owner", "pacs.008", content),
+    )
+    # One warm-up call runs before the timed rounds
+    rows_per_call: float = count_rows(engine, "pacs.008") / (BENCHMARK_ROUNDS + 1)
+    rows_per_second: float = rows_per_call / elapsed
+
+    record_property("create_from_content_rows_per_second", rows_per_second)
+    print(f"create_from_content: {rows_per_second:.0f} rows/s")
+
+
+def test_create_from_content_does_not_resolve_entities(engine, helper, tmp_path):
+    secret = tmp_path / "secret.txt"
+    secret.write_text("secret")
+    content: bytes = (
+        build_pacs_008_xsd(depth=1, width=1)
+        .replace(
+            b"<xs:schema",
+            f'<!DOCTYPE xs:schema [<!ENTITY leak SYSTEM "{secret.as_uri()}">]>'.encode()
+            + b"<xs:schema",
+        )
+        .replace(b">FIToFICstmrCdtTrf<", b">&leak;<", 1)
+    )
+
+    helper.create_from_content("owner", "pacs.008", content)
+
+    with engine.connect() as connection:
+        names = connection.execute(
+            select(ModelMessageDefinition.annotation_name)
+        ).fetchall()
+
+    assert len(names) == 3
+    assert "secret" not in {name for (name,) in names}
+
+
+def test_tree_matches_the_beautifulsoup_extraction(helper):
+    content: bytes = build_pacs_008_xsd(depth=3, width=3)
+
+    assert lxml_tree(helper, content) == soup_tree(BeautifulSoup(content, "xml"))
+
+
+@pytest.mark.parametrize("extractor", ["lxml", "beautifulsoup"])
+def test_benchmark_get_tree(helper, benchmark, extractor):
+    content: bytes = build_pacs_008_xsd()
+
+    if extractor == "lxml":
+        benchmark("get_tree_lxml", lambda: lxml_tree(helper, content))
+    else:
+        benchmark(
+            "get_tree_beautifulsoup",
+            lambda: soup_tree(BeautifulSoup(content, "xml")),
+        )
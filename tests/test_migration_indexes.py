@@ -0,0 +1,207 @@
+"""
+EXPLAIN the helper lookups against a SQLite stand-in carrying the indexes
+created by the migrations, and check that no lookup scans a table
+"""
+
+import contextlib
+import glob
+import importlib.util
+import os
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+import mock
+import pytest
+from sqlalchemy import Index
+from sqlalchemy import create_engine
+from sqlalchemy import event
+
+from ftl_python_lib.core.context.environment import EnvironmentContext
+from ftl_python_lib.core.context.headers import HeadersContext
+from ftl_python_lib.core.context.request import RequestContext
+from ftl_python_lib.models_helper.account import HelperAccount
+from ftl_python_lib.models_helper.config import HelperConfig
+from ftl_python_lib.models_helper.mapping import HelperMapping
+from ftl_python_lib.models_helper.member import HelperMember
+from ftl_python_lib.models_helper.message import HelperMessage
+from ftl_python_lib.models_helper.message_definition import HelperMessageDefinition
+from ftl_python_lib.models_helper.microservice import HelperMicroservice
+from ftl_python_lib.models_helper.provider import HelperProvider
+from ftl_python_lib.models_helper.transaction import HelperTransaction
+from ftl_python_lib.utils.iterable_base import Base
+
+VERSIONS_PATH: str = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)),
+    "ftl_python_lib",
+    "migration",
+    "versions",
+)
+
+ENVIRON: Dict[str, str] = {
+    "FTL_ACTIVE_REGION": "us-east-1",
+    "FTL_RUNTIME_BUCKET": "runtime",
+    "FTL_ENVIRON_CONTEXT_SECRET": "secret",
+    "FTL_OWNER_EMAIL": "owner@example.com",
+    "FTL_OWNER_FIRST_NAME": "Owner",
+    "FTL_OWNER_LAST_NAME": "Owner",
+    "AWS_ACCESS_KEY_ID": "test",
+    "AWS_SECRET_ACCESS_KEY": "test",
+}
+
+
+class IndexRecorder:
+    """
+    Stand-in for alembic.op keeping the final set of indexes and unique
+    constraints; tables come from the models, everything else is ignored
+    """
+
+    def __init__(self) -> None:
+        self.indexes: Dict[Tuple[str, str], List[str]] = {}
+
+    def create_index(self, name, table_name, columns, **_) -> None:
+        self.indexes[(table_name, name)] = list(columns)
+
+    def create_unique_constraint(self, name, table_name, columns, **_) -> None:
+        self.indexes[(table_name, name)] = list(columns)
+
+    def drop_index(self, name, table_name, **_) -> None:
+        self.indexes.pop((table_name, name))
+
+    def get_bind(self):
+        # Data migrations find no rows to move
+        return mock.Mock(**{"execute.return_value": []})
+
+    def __getattr__(self, _):
+        return lambda *args, **kwargs: None
+
+
+def load_migrations() -> list:
+    modules: dict = {}
+
+    for path in glob.glob(os.path.join(VERSIONS_PATH, "*.py")):
+        spec = importlib.util.spec_from_file_location(
+            "migration_" + os.path.basename(path)[:-3], path
+        )
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        modules[module.down_revision] = module
+
+    ordered: list = []
+    revision = None
+    while revision in modules:
+        ordered.append(modules[revision])
+        revision = modules[revision].revision
+
+    assert len(ordered) == len(modules)
+
+    return ordered
+
+
+@pytest.fixture(name="environ", scope="module")
+def fixture_environ():
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        for key, value in ENVIRON.items():
+            monkeypatch.setenv(key, value)
+
+        yield
+
+
+@pytest.fixture(name="engine", scope="module")
+def fixture_engine(environ):
+    # Loading the migrations imports every model they touch
+    migrations: list = load_migrations()
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+
+    recorder = IndexRecorder()
+
+    for migration in migrations:
+        with contextlib.ExitStack() as stack:
+            stack.enter_context(
+                mock.patch.object(migration, "op", recorder, create=True)
+            )
+
+            # Seeding migrations call AWS providers, e.g. Cognito invites
+            for name in vars(migration).copy():
+                if name.startswith("Provider"):
+                    stack.enter_context(mock.patch.object(migration, name))
+
+            migration.upgrade()
+
+    for (table, name), columns in recorder.indexes.items():
+        table_ = Base.metadata.tables[table]
+        Index(f"{table}__{name}", *[table_.c[column] for column in columns]).create(
+            engine
+        )
+
+    return engine
+
+
+@pytest.fixture(name="contexts")
+def fixture_contexts(engine):
+    with mock.patch(
+        "ftl_python_lib.core.context.session.MySqlEngine.get_engine",
+        return_value=engine,
+    ):
+        yield (
+            RequestContext(headers_context=HeadersContext(headers={})),
+            EnvironmentContext(),
+        )
+
+
+LOOKUPS = {
+    "account_by_reference_id": lambda c: HelperAccount(*c).get_reference_id("r"),
+    "member_by_auth_id": lambda c: HelperMember(*c).get_by_auth_id("a", "e"),
+    "message_by_reference_id": lambda c: HelperMessage(*c).get_by_reference_id("r"),
+    "message_by_key": lambda c: HelperMessage(*c).get_by_key("pacs.008", "1", "0", "8"),
+    "message_by_category_id": lambda c: HelperMessage(*c).get_all_by_category_id("c"),
+    "message_definition_by_message_id": lambda c: HelperMessageDefinition(
+        *c
+    ).get_by_message_id("m"),
+    "message_definition_by_name": lambda c: HelperMessageDefinition(*c).get_by_name(
+        "n"
+    ),
+    "mapping_by_source": lambda c: HelperMapping(*c).get_all(
+        {"source": "s", "source_type": "t", "message_type": "pacs.008"}
+    ),
+    "provider_by_subcategory_id": lambda c: HelperProvider(
+        *c
+    ).get_all_by_category_id_subcategory_id("c", "s"),
+    "config_by_key": lambda c: HelperConfig(*c).get_by_key("k", "t", "r"),
+    "microservice_by_name": lambda c: HelperMicroservice(*c).get_by_name("n"),
+    "transaction_by_reference_id": lambda c: HelperTransaction(*c).get_by_reference_id(
+        "r"
+    ),
+}
+
+
+@pytest.mark.parametrize("lookup", LOOKUPS)
+def test_lookup_uses_an_index(engine, contexts, lookup):
+    statements: list = []
+
+    def capture(_, __, statement, parameters, ___, ____) -> None:
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        # Tables are empty, some helpers fail after the lookup itself
+        with contextlib.suppress(Exception):
+            LOOKUPS[lookup](contexts)
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    assert len(statements) > 0
+
+    with engine.connect() as connection:
+        for statement, parameters in statements:
+            plan: List[str] = [
+                row[-1]
+                for row in connection.exec_driver_sql(
+                    "EXPLAIN QUERY PLAN " + statement, parameters
+                ).fetchall()
+            ]
+
+            assert all(not step.startswith("SCAN") for step in plan), plan
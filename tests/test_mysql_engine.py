@@ -0,0 +1,63 @@
+"""
+Tests for the process-wide pooled engines of MySqlEngine
+"""
+
+import threading
+
+import mock
+import pytest
+
+from ftl_python_lib.core.providers.mysql.engine import MySqlEngine
+from ftl_python_lib.core.providers.mysql.engine import MySqlPool
+
+
+@pytest.fixture(name="connection_string")
+def fixture_connection_string(tmp_path):
+    connection_string: str = f"sqlite:///{tmp_path / 'engine.db'}"
+
+    with mock.patch.object(
+        MySqlEngine, "get_connection_string", return_value=connection_string
+    ):
+        yield connection_string
+
+    MySqlEngine.dispose_all()
+
+
+def test_engine_is_shared_across_threads(connection_string):
+    engines: list = []
+    threads = [
+        threading.Thread(target=lambda: engines.append(MySqlEngine.get_engine()))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(engine) for engine in engines}) == 1
+    assert isinstance(engines[0].pool, MySqlPool)
+    assert str(engines[0].url) == connection_string
+
+
+def test_pool_statistics_count_checkouts(connection_string):
+    engine = MySqlEngine.get_engine()
+
+    with engine.connect():
+        statistics = MySqlEngine.get_pool_statistics()[connection_string]
+
+        assert statistics["checked_out"] == 1
+
+    statistics = MySqlEngine.get_pool_statistics()[connection_string]
+
+    assert statistics["checkouts"] == 1
+    assert statistics["checked_out"] == 0
+    assert statistics["timeouts"] == 0
+
+
+def test_dispose_all_drops_the_engines(connection_string):
+    engine = MySqlEngine.get_engine()
+
+    MySqlEngine.dispose_all()
+
+    assert MySqlEngine.get_pool_statistics() == {}
+    assert MySqlEngine.get_engine() is not engine
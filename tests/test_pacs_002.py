@@ -0,0 +1,102 @@
+"""
+Tests for the pacs.008 to pacs.002 conversions
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from lxml import etree
+
+from ftl_python_lib.typings.iso20022.status_report import TypeStatusReportHeader
+from ftl_python_lib.utils.xml.processing import UtilsXmlCodecXmltodict
+from ftl_python_lib.utils.xml.to_pacs_002 import PACS_002_NAMESPACE
+from ftl_python_lib.utils.xml.to_pacs_002 import pacs_002_status_report
+from ftl_python_lib.utils.xml.to_pacs_002 import pacs_008_to_pacs_002
+from tests.conftest import PACS_008_NAMESPACE
+from tests.conftest import build_pacs_008
+
+HEADER: TypeStatusReportHeader = TypeStatusReportHeader(
+    message_id="STS-1",
+    created_at="2022-05-01T10:00:01",
+    original_message_id="MSG-1",
+    original_message_name_id="pacs.008.001.08",
+)
+
+
+def transactions(count: int):
+    for index in range(count):
+        yield (
+            SimpleNamespace(
+                instruction_id=f"INSTR-{index}",
+                end_to_end_id=f"E2E-{index}",
+                transaction_id=f"TX-{index}",
+            ),
+            "RJCT" if index % 2 else "ACSC",
+            "AM04" if index % 2 else None,
+        )
+
+
+def test_pacs_008_to_pacs_002_leaves_the_source_untouched():
+    src = UtilsXmlCodecXmltodict.parse(src=build_pacs_008(transactions=2))
+
+    res = pacs_008_to_pacs_002(src)
+    res["Document"]["FIToFICstmrCdtTrf"]["GrpHdr"]["MsgId"] = "STS-1"
+    res["Document"]["FIToFICstmrCdtTrf"]["CdtTrfTxInf"].pop()
+
+    assert res["Document"]["@xmlns"] == PACS_002_NAMESPACE
+    assert src["Document"]["@xmlns"] == PACS_008_NAMESPACE
+    assert src["Document"]["FIToFICstmrCdtTrf"]["GrpHdr"]["MsgId"] == "MSG-1"
+    assert len(src["Document"]["FIToFICstmrCdtTrf"]["CdtTrfTxInf"]) == 2
+
+
+def test_pacs_008_to_pacs_002_rejects_other_types():
+    with pytest.raises(ValueError):
+        pacs_008_to_pacs_002("<Document/>")
+
+
+def test_status_report():
+    report = etree.fromstring(
+        pacs_002_status_report(
+            header=HEADER, transactions=transactions(2), group_status="PART"
+        )
+    )
+    namespaces = {"p": PACS_002_NAMESPACE}
+
+    assert (
+        report.findtext("p:FIToFIPmtStsRpt/p:GrpHdr/p:MsgId", namespaces=namespaces)
+        == "STS-1"
+    )
+    assert [
+        (
+            status.findtext("p:OrgnlEndToEndId", namespaces=namespaces),
+            status.findtext("p:TxSts", namespaces=namespaces),
+            status.findtext("p:StsRsnInf/p:Rsn/p:Cd", namespaces=namespaces),
+        )
+        for status in report.iterfind(
+            "p:FIToFIPmtStsRpt/p:TxInfAndSts", namespaces=namespaces
+        )
+    ] == [("E2E-0", "ACSC", None), ("E2E-1", "RJCT", "AM04")]
+    assert (
+        report.findtext(
+            "p:FIToFIPmtStsRpt/p:OrgnlGrpInfAndSts/p:GrpSts", namespaces=namespaces
+        )
+        == "PART"
+    )
+
+
+@pytest.mark.parametrize("builder", ["status_report", "deepcopy"])
+def test_benchmark_pacs_002(benchmark, builder):
+    src = UtilsXmlCodecXmltodict.parse(src=build_pacs_008(transactions=1000))
+
+    if builder == "status_report":
+        benchmark(
+            "pacs_002_status_report",
+            lambda: pacs_002_status_report(
+                header=HEADER, transactions=transactions(1000)
+            ),
+        )
+    else:
+        benchmark(
+            "pacs_008_to_pacs_002",
+            lambda: UtilsXmlCodecXmltodict.unparse(src=pacs_008_to_pacs_002(src)),
+        )
@@ -0,0 +1,43 @@
+"""
+Tests for the pacs.008 accessors of TypeReceivedMessageOut
+"""
+
+import mock
+import pytest
+
+from ftl_python_lib.typings.iso20022.received_message import TypeReceivedMessageOut
+from ftl_python_lib.utils.xml.processing import parse
+from tests.conftest import build_pacs_008
+
+
+def message_out(transactions: int) -> TypeReceivedMessageOut:
+    return TypeReceivedMessageOut(
+        message_out=parse(src=build_pacs_008(transactions=transactions)),
+        request_context=mock.Mock(),
+        environ_context=mock.Mock(),
+    )
+
+
+@pytest.mark.parametrize("transactions", [1, 3])
+def test_accessors_read_first_transaction(transactions):
+    out = message_out(transactions=transactions)
+
+    assert out.creditor_name == "Creditor 0"
+    assert out.creditor_account == "CA-0"
+    assert out.debitor_name == "Debtor 0"
+    assert out.debitor_account == "DA-0"
+    assert out.currency == "EUR"
+    assert out.amount == 0
+
+
+def test_accessors_default_when_missing():
+    out = TypeReceivedMessageOut(
+        message_out={"Document": {"FIToFICstmrCdtTrf": {"CdtTrfTxInf": []}}},
+        request_context=mock.Mock(),
+        environ_context=mock.Mock(),
+    )
+
+    assert out.creditor_name == "N/A"
+    assert out.debitor_account == "N/A"
+    assert out.currency == "N/A"
+    assert out.amount == 0
@@ -0,0 +1,158 @@
+"""
+Tests for the request-scoped unit of work in SessionContext
+"""
+
+import mock
+import pytest
+from sqlalchemy import Column
+from sqlalchemy import String
+from sqlalchemy import create_engine
+from sqlalchemy.orm import declarative_base
+
+from ftl_python_lib.core.context.headers import HeadersContext
+from ftl_python_lib.core.context.request import RequestContext
+from ftl_python_lib.core.context.session import SessionContext
+
+Base = declarative_base()
+
+
+class ModelRow(Base):
+    __tablename__ = "row"
+
+    id = Column(String(36), primary_key=True)
+
+
+@pytest.fixture(name="engine")
+def fixture_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'session.db'}")
+    Base.metadata.create_all(engine)
+
+    with mock.patch(
+        "ftl_python_lib.core.context.session.MySqlEngine.get_engine",
+        return_value=engine,
+    ):
+        yield engine
+
+
+@pytest.fixture(name="request_context")
+def fixture_request_context():
+    return RequestContext(headers_context=HeadersContext(headers={}))
+
+
+def count_rows(engine) -> int:
+    with engine.connect() as connection:
+        return len(connection.execute(ModelRow.__table__.select()).fetchall())
+
+
+def test_standalone_session_commits(engine, request_context):
+    context = SessionContext(request_context=request_context)
+    context.get_session().add(ModelRow(id="a"))
+    context.commit()
+
+    assert not context.is_shared
+    assert count_rows(engine) == 1
+
+
+def test_unit_of_work_commits_once_on_end(engine, request_context):
+    unit_of_work = SessionContext(request_context=request_context)
+    unit_of_work.begin()
+
+    first = SessionContext(request_context=request_context)
+    second = SessionContext(request_context=request_context)
+
+    assert first.get_session() is second.get_session()
+    assert first.is_shared
+
+    first.get_session().add(ModelRow(id="a"))
+    first.commit()
+    second.get_session().add(ModelRow(id="b"))
+    second.commit()
+
+    assert count_rows(engine) == 0
+
+    unit_of_work.end()
+
+    assert count_rows(engine) == 2
+
+
+def test_session_held_before_begin_still_commits(engine, request_context):
+    early = SessionContext(request_context=request_context)
+    early_session = early.get_session()
+
+    unit_of_work = SessionContext(request_context=request_context)
+    unit_of_work.begin()
+
+    early.get_session().add(ModelRow(id="a"))
+    early.commit()
+
+    assert early.get_session() is early_session
+    assert not early.is_shared
+    assert count_rows(engine) == 1
+
+    unit_of_work.end(exception=ValueError("boom"))
+
+    assert count_rows(engine) == 1
+
+
+def test_rollback_leaves_unit_of_work_to_end(engine, request_context):
+    unit_of_work = SessionContext(request_context=request_context)
+    shared = unit_of_work.begin()
+
+    helper = SessionContext(request_context=request_context)
+    helper.get_session().add(ModelRow(id="a"))
+    helper.commit()
+    helper.rollback()
+
+    assert [row.id for row in shared.query(ModelRow).all()] == ["a"]
+
+    unit_of_work.end(exception=ValueError("boom"))
+
+    assert count_rows(engine) == 0
+
+
+def test_on_commit_runs_after_standalone_commit(engine, request_context):
+    context = SessionContext(request_context=request_context)
+    context.get_session().add(ModelRow(id="a"))
+
+    committed = []
+    context.commit(on_commit=lambda: committed.append(count_rows(engine)))
+
+    assert committed == [1]
+
+
+def test_on_commit_waits_for_end_of_unit_of_work(engine, request_context):
+    unit_of_work = SessionContext(request_context=request_context)
+    unit_of_work.begin()
+
+    committed = []
+
+    def on_commit() -> None:
+        committed.append(count_rows(engine))
+
+    helper = SessionContext(request_context=request_context)
+    helper.get_session().add(ModelRow(id="a"))
+    helper.commit(on_commit=on_commit)
+    helper.get_session().add(ModelRow(id="b"))
+    helper.commit(on_commit=on_commit)
+
+    assert committed == []
+
+    unit_of_work.end()
+
+    assert committed == [2]
+
+
+def test_on_commit_skipped_on_rollback(engine, request_context):
+    unit_of_work = SessionContext(request_context=request_context)
+    unit_of_work.begin()
+
+    committed = []
+
+    helper = SessionContext(request_context=request_context)
+    helper.get_session().add(ModelRow(id="a"))
+    helper.commit(on_commit=lambda: committed.append(True))
+
+    unit_of_work.end(exception=ValueError("boom"))
+
+    assert committed == []
+    assert count_rows(engine) == 0
@@ -0,0 +1,49 @@
+"""
+Tests for the str to bytes conversion
+"""
+
+import pytest
+
+from ftl_python_lib.utils.conversion_counter import UtilsConversionCounter
+from ftl_python_lib.utils.to_bytes import UtilsConversionsToBytes
+from ftl_python_lib.utils.xml.extractor import UtilsXmlFieldExtractor
+from ftl_python_lib.utils.xml.parser import UtilsXmlParser
+from ftl_python_lib.utils.xml.processing import UtilsXmlCodecLxml
+
+DOCUMENT: bytes = b'<Document xmlns="urn:a"><MsgId>MSG-1</MsgId></Document>'
+
+
+def test_str_is_encoded_and_counted():
+    count = UtilsConversionCounter.count()
+
+    assert UtilsConversionsToBytes.str_to_bytes(src="é") == "é".encode()
+    assert UtilsConversionCounter.count() == count + 1
+
+
+def test_bytes_are_returned_as_they_are():
+    count = UtilsConversionCounter.count()
+
+    assert UtilsConversionsToBytes.str_to_bytes(src=DOCUMENT) is DOCUMENT
+    assert UtilsConversionCounter.count() == count
+
+
+@pytest.mark.parametrize("src", [bytearray(DOCUMENT), memoryview(DOCUMENT)])
+def test_bytes_like_are_not_decoded(src):
+    count = UtilsConversionCounter.count()
+
+    result = UtilsConversionsToBytes.str_to_bytes(src=src)
+
+    assert isinstance(result, bytes)
+    assert result == DOCUMENT
+    assert UtilsConversionCounter.count() == count
+
+
+@pytest.mark.parametrize("src", [bytearray(DOCUMENT), memoryview(DOCUMENT)])
+def test_xml_utilities_take_bytes_like(src):
+    assert UtilsXmlParser.sniff_namespace(src=src) == "urn:a"
+    assert UtilsXmlCodecLxml.parse(src=src) == {
+        "Document": {"@xmlns": "urn:a", "MsgId": "MSG-1"}
+    }
+    assert UtilsXmlFieldExtractor(paths=["Document/MsgId"]).extract(src=src) == {
+        "Document/MsgId": "MSG-1"
+    }
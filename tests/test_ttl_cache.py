@@ -0,0 +1,88 @@
+"""
+Tests for UtilsTtlCache
+"""
+
+import threading
+import time
+
+from ftl_python_lib.utils.ttl_cache import UtilsTtlCache
+
+
+def test_value_is_cached_until_it_expires():
+    cache = UtilsTtlCache(ttl=0.05)
+    calls = []
+
+    def loader() -> int:
+        calls.append(True)
+        return len(calls)
+
+    assert cache.get("key", loader) == 1
+    assert cache.get("key", loader) == 1
+
+    time.sleep(0.06)
+
+    assert cache.get("key", loader) == 2
+
+
+def test_zero_ttl_disables_caching():
+    cache = UtilsTtlCache(ttl=0)
+    calls = []
+
+    cache.get("key", lambda: calls.append(True))
+    cache.get("key", lambda: calls.append(True))
+
+    assert len(calls) == 2
+
+
+def test_invalidate_one_key_or_all():
+    cache = UtilsTtlCache(ttl=60)
+    cache.get("a", lambda: 1)
+    cache.get("b", lambda: 1)
+
+    cache.invalidate("a")
+
+    assert cache.get("a", lambda: 2) == 2
+    assert cache.get("b", lambda: 2) == 1
+
+    cache.invalidate()
+
+    assert cache.get("b", lambda: 3) == 3
+
+
+def test_concurrent_misses_run_the_loader_once():
+    cache = UtilsTtlCache(ttl=60)
+    calls = []
+    release = threading.Event()
+
+    def loader() -> int:
+        calls.append(True)
+        release.wait(timeout=1)
+        return 42
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get("key", loader)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+
+    time.sleep(0.05)
+    release.set()
+
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [42] * 8
+
+
+def test_value_loaded_across_an_invalidation_is_not_stored():
+    cache = UtilsTtlCache(ttl=60)
+
+    def loader() -> str:
+        cache.invalidate()
+        return "stale"
+
+    assert cache.get("key", loader) == "stale"
+    assert cache.get("key", lambda: "fresh") == "fresh"
@@ -0,0 +1,67 @@
+"""
+Tests for UtilsXmlFieldExtractor
+"""
+
+import pytest
+from lxml import etree
+
+from ftl_python_lib.constants.messages import ConstantsMessagesPacs008Fields
+from ftl_python_lib.constants.messages import ConstantsMessagesPacs008Paths
+from ftl_python_lib.constants.messages import ConstantsMessagesPacs008TransactionFields
+from ftl_python_lib.utils.xml.extractor import UtilsXmlFieldExtractor
+from ftl_python_lib.utils.xml.processing import parse
+
+FIELDS: UtilsXmlFieldExtractor = UtilsXmlFieldExtractor(
+    paths=[field.value for field in ConstantsMessagesPacs008Fields]
+)
+TRANSACTION_FIELDS: UtilsXmlFieldExtractor = UtilsXmlFieldExtractor(
+    paths=[field.value for field in ConstantsMessagesPacs008TransactionFields]
+)
+
+
+def test_extract_reads_first_transaction(pacs_008):
+    fields = FIELDS.extract(src=pacs_008)
+
+    assert fields[ConstantsMessagesPacs008Fields.CREDITOR_NAME.value] == "Creditor 0"
+    assert fields[ConstantsMessagesPacs008Fields.DEBITOR_ACCOUNT.value] == "DA-0"
+    assert fields[ConstantsMessagesPacs008Fields.AMOUNT.value] == "0.50"
+    assert fields[ConstantsMessagesPacs008Fields.CURRENCY.value] == "EUR"
+
+
+def test_extract_matches_dict_paths(pacs_008):
+    message = parse(src=pacs_008)
+
+    assert FIELDS.extract(src=pacs_008) == {
+        field.value: UtilsXmlFieldExtractor.from_dict(src=message, path=field.value)
+        for field in ConstantsMessagesPacs008Fields
+    }
+
+
+def test_extract_missing_field_is_none():
+    extractor = UtilsXmlFieldExtractor(paths=["Document/Missing", "Document/@id"])
+
+    assert extractor.extract(src=b"<Document/>") == {
+        "Document/Missing": None,
+        "Document/@id": None,
+    }
+
+
+def test_extract_rejects_truncated_input(pacs_008):
+    with pytest.raises(etree.XMLSyntaxError):
+        FIELDS.extract(src=pacs_008[:-20])
+
+
+def test_iterate_yields_every_transaction(pacs_008):
+    records = list(
+        TRANSACTION_FIELDS.iterate(
+            src=pacs_008, record_path=ConstantsMessagesPacs008Paths.TRANSACTION.value
+        )
+    )
+
+    assert len(records) == 3
+    assert records == list(
+        TRANSACTION_FIELDS.iterate_dict(
+            src=parse(src=pacs_008),
+            record_path=ConstantsMessagesPacs008Paths.TRANSACTION.value,
+        )
+    )
@@ -0,0 +1,90 @@
+"""
+Conformance of the lxml codec with xmltodict, and their throughput
+"""
+
+import pytest
+
+from ftl_python_lib.utils.xml.processing import UtilsXmlCodecLxml
+from ftl_python_lib.utils.xml.processing import UtilsXmlCodecXmltodict
+from tests.conftest import build_pacs_008
+
+DOCUMENTS = {
+    "attributes": b'<a x="1" y="2"><b z="3">text</b></a>',
+    "text_next_to_children": b"<a>head<b>1</b>tail</a>",
+    "repeated_elements": b"<a><b>1</b><c/><b>2</b><b>3</b></a>",
+    "single_element_is_not_a_list": b"<a><b>1</b></a>",
+    "empty_elements": b'<a><b/><c></c><d x="1"/><e>  </e></a>',
+    "empty_root": b"<a/>",
+    "default_namespace": b'<Document xmlns="urn:a"><B>1</B></Document>',
+    "prefixed_namespace": b'<p:a xmlns:p="urn:p"><p:b p:x="1">1</p:b><c/></p:a>',
+    "nested_namespaces": (
+        b'<a xmlns="urn:a"><b xmlns="urn:b"><c>1</c></b>'
+        b'<q:d xmlns:q="urn:q" q:y="2"/></a>'
+    ),
+    "pacs_008_single": build_pacs_008(transactions=1),
+    "pacs_008_batch": build_pacs_008(transactions=10),
+}
+
+DICTS = {
+    "undeclared_prefix": {"p:a": {"b": "1"}},
+    "undeclared_attribute_prefix": {"a": {"@p:x": "1", "#text": "t"}},
+    "values": {"a": {"b": 1, "c": True, "d": None, "e": ["1", None, {"@x": "y"}]}},
+}
+
+
+@pytest.mark.parametrize("name", DOCUMENTS)
+def test_parse_matches_xmltodict(name):
+    assert UtilsXmlCodecLxml.parse(src=DOCUMENTS[name]) == UtilsXmlCodecXmltodict.parse(
+        src=DOCUMENTS[name]
+    )
+
+
+@pytest.mark.parametrize("name", DOCUMENTS)
+def test_parse_accepts_str(name):
+    src: str = DOCUMENTS[name].decode()
+
+    assert UtilsXmlCodecLxml.parse(src=src) == UtilsXmlCodecXmltodict.parse(src=src)
+
+
+@pytest.mark.parametrize("name", DOCUMENTS)
+def test_unparse_matches_xmltodict(name):
+    message = UtilsXmlCodecXmltodict.parse(src=DOCUMENTS[name])
+
+    assert UtilsXmlCodecLxml.unparse(src=message) == UtilsXmlCodecXmltodict.unparse(
+        src=message
+    )
+
+
+@pytest.mark.parametrize("name", DOCUMENTS)
+def test_round_trip(name):
+    message = UtilsXmlCodecLxml.parse(src=DOCUMENTS[name])
+
+    assert (
+        UtilsXmlCodecLxml.parse(src=UtilsXmlCodecLxml.unparse(src=message)) == message
+    )
+
+
+@pytest.mark.parametrize("name", DICTS)
+def test_unparse_dict_matches_xmltodict(name):
+    assert UtilsXmlCodecLxml.unparse(src=DICTS[name]) == UtilsXmlCodecXmltodict.unparse(
+        src=DICTS[name]
+    )
+
+
+def test_unparse_requires_one_root():
+    with pytest.raises(ValueError):
+        UtilsXmlCodecLxml.unparse(src={"a": "1", "b": "2"})
+
+
+@pytest.mark.parametrize("codec", [UtilsXmlCodecXmltodict, UtilsXmlCodecLxml])
+def test_benchmark_parse(benchmark, codec):
+    src: bytes = build_pacs_008(transactions=2000)
+
+    benchmark(f"parse_{codec.__name__}", lambda: codec.parse(src=src))
+
+
+@pytest.mark.parametrize("codec", [UtilsXmlCodecXmltodict, UtilsXmlCodecLxml])
+def test_benchmark_unparse(benchmark, codec):
+    message = UtilsXmlCodecXmltodict.parse(src=build_pacs_008(transactions=2000))
+
+    benchmark(f"unparse_{codec.__name__}", lambda: codec.unparse(src=message))
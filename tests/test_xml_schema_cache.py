@@ -0,0 +1,102 @@
+"""
+Tests for the process-wide cache of compiled XSD schemas
+"""
+
+import threading
+
+import mock
+import pytest
+from lxml import etree
+
+from ftl_python_lib.utils.xml.parser import UtilsXmlParser
+from ftl_python_lib.utils.xml.schema_cache import UtilsXmlSchemaCache
+
+
+def build_xsd(name: str) -> str:
+    return (
+        '<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">'
+        f'<xs:element name="{name}" type="xs:string"/>'
+        "</xs:schema>"
+    )
+
+
+@pytest.fixture(name="cache")
+def fixture_cache():
+    return UtilsXmlSchemaCache(max_size=2)
+
+
+def test_hits_and_misses(cache):
+    first = cache.get(xsd=build_xsd("A"))
+
+    assert cache.get(xsd=build_xsd("A").encode()) is first
+    assert cache.get(xsd=build_xsd("B")) is not first
+    assert cache.statistics() == {
+        "size": 2,
+        "max_size": 2,
+        "hits": 1,
+        "misses": 2,
+        "evictions": 0,
+    }
+
+
+def test_least_recently_used_is_evicted(cache):
+    first = cache.get(xsd=build_xsd("A"))
+    cache.get(xsd=build_xsd("B"))
+    cache.get(xsd=build_xsd("A"))
+    cache.get(xsd=build_xsd("C"))
+
+    assert cache.get(xsd=build_xsd("A")) is first
+    assert cache.statistics()["evictions"] == 1
+    assert cache.statistics()["misses"] == 3
+
+    cache.get(xsd=build_xsd("B"))
+
+    assert cache.statistics()["misses"] == 4
+
+
+def test_explicit_key_ignores_the_content(cache):
+    first = cache.get(xsd=build_xsd("A"), key="pacs.008")
+
+    assert cache.get(xsd=build_xsd("B"), key="pacs.008") is first
+
+
+def test_concurrent_misses_compile_once(cache):
+    barrier = threading.Barrier(8)
+    schemas: list = []
+
+    def get():
+        barrier.wait()
+        schemas.append(cache.get(xsd=build_xsd("A")))
+
+    with mock.patch(
+        "ftl_python_lib.utils.xml.schema_cache.etree.XMLSchema",
+        side_effect=etree.XMLSchema,
+    ) as compile_schema:
+        threads = [threading.Thread(target=get) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert compile_schema.call_count == 1
+    assert len({id(schema) for schema in schemas}) == 1
+    assert cache.statistics()["hits"] == 7
+
+
+def test_compiled_schema_returns_its_own_error_log(cache):
+    schema = cache.get(xsd=build_xsd("A"))
+
+    valid, errors = schema.validate(UtilsXmlParser.fromstring(src="<B/>"))
+
+    assert not valid
+    assert len(errors) == 1
+    assert "B" in errors[0].message
+    assert schema.validate(UtilsXmlParser.fromstring(src="<A>a</A>")) == (True, [])
+
+
+def test_clear_drops_every_schema(cache):
+    first = cache.get(xsd=build_xsd("A"))
+    cache.clear()
+
+    assert cache.statistics()["size"] == 0
+    assert cache.get(xsd=build_xsd("A")) is not first
@@ -0,0 +1,98 @@
+"""
+Tests for the in-memory XML validation
+"""
+
+import os
+import tempfile
+
+from ftl_python_lib.utils.xml.schema_cache import XML_SCHEMA_CACHE
+from ftl_python_lib.utils.xml.validation import UtilsXmlValidation
+
+XSD: str = """<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+  <xs:element name="Document">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:element name="Amt" type="xs:decimal" maxOccurs="unbounded"/>
+      </xs:sequence>
+    </xs:complexType>
+  </xs:element>
+</xs:schema>"""
+
+VALID: bytes = b"<Document><Amt>1.50</Amt></Document>"
+
+INVALID: bytes = b"<Document>\n  <Amt>1.50</Amt>\n  <Amt>many</Amt>\n</Document>"
+
+MALFORMED: bytes = b"<Document>\n  <Amt>1.50</Amt>\n</Doc>"
+
+
+def test_valid_document():
+    result = UtilsXmlValidation(xsd=XSD, xml=VALID).validate()
+
+    assert result
+    assert result.errors == []
+
+
+def test_invalid_document_reports_where():
+    result = UtilsXmlValidation(xsd=XSD, xml=INVALID).validate()
+
+    assert not result.valid
+    assert [(error.line, error.path) for error in result.errors] == [
+        (3, "/Document/Amt[2]")
+    ]
+    assert "many" in result.errors[0].message
+
+
+def test_malformed_document_reports_the_syntax_error():
+    UtilsXmlValidation(xsd=XSD, xml=b"<Document>\n</Amt>").validate()
+    result = UtilsXmlValidation(xsd=XSD, xml=MALFORMED).validate()
+
+    assert not result.valid
+    assert len(result.errors) == 1
+    assert result.errors[0].line == 3
+    assert result.errors[0].level == "FATAL"
+
+
+def test_context_manager_is_kept_and_stays_in_memory(tmp_path, monkeypatch):
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+
+    with UtilsXmlValidation(xsd=XSD, xml=VALID) as validation:
+        assert validation.is_valid()
+
+    assert os.listdir(tmp_path) == []
+
+
+def test_accepts_str():
+    assert UtilsXmlValidation(xsd=XSD, xml=VALID.decode()).is_valid()
+
+
+def test_validate_many_yields_in_input_order():
+    documents = [VALID, INVALID, MALFORMED] * 10
+
+    results = list(UtilsXmlValidation.validate_many(xsd=XSD, xmls=documents))
+
+    assert [index for index, _, _ in results] == list(range(30))
+    assert [valid for _, valid, _ in results] == [True, False, False] * 10
+    assert all(len(errors) == 1 for _, valid, errors in results if not valid)
+
+
+def test_validate_many_consumes_the_input_lazily():
+    consumed: list = []
+
+    def documents():
+        for index in range(100):
+            consumed.append(index)
+            yield VALID
+
+    results = UtilsXmlValidation.validate_many(xsd=XSD, xmls=documents(), workers=2)
+
+    assert next(results) == (0, True, [])
+    assert len(consumed) <= 2 * 2
+    assert sum(1 for _ in results) == 99
+
+
+def test_validate_many_compiles_the_schema_once():
+    misses = XML_SCHEMA_CACHE.statistics()["misses"]
+
+    list(UtilsXmlValidation.validate_many(xsd=XSD + " ", xmls=[VALID] * 20))
+
+    assert XML_SCHEMA_CACHE.statistics()["misses"] == misses + 1